@@ -0,0 +1,64 @@
+"""
+Throughput of an asyncio producer feeding a consumer that writes in batches,
+AsyncQueue.get_batch against per-element gets from asyncio.Queue
+
+Usage:
+    python benchmarks/async_queue_benchmark.py [items] [batch]
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data_structure import AsyncQueue
+
+CAPACITY = 4096
+
+
+async def produce(queue, items):
+    for x in range(items):
+        await queue.put(x)
+
+
+async def consume_asyncio(queue, items, batch):
+    """
+    Collects each batch through one get per element, as callers did before
+    """
+    taken = 0
+    while taken < items:
+        elements = [await queue.get() for _ in range(min(batch, items - taken))]
+        taken += len(elements)
+
+
+async def consume_batches(queue, items, batch):
+    """
+    Collects each batch through one get_batch
+    """
+    taken = 0
+    while taken < items:
+        taken += len(await queue.get_batch(min(batch, items - taken)))
+
+
+async def measure(queue, consume, items, batch):
+    """
+    Returns items per second
+    """
+    start = time.perf_counter()
+    await asyncio.gather(produce(queue, items), consume(queue, items, batch))
+
+    return items / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    batch = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+
+    print('{:<26} {:>14}'.format('consumer', 'items/s'))
+    rate = asyncio.run(measure(asyncio.Queue(CAPACITY), consume_asyncio, items, batch))
+    print('{:<26} {:>14.0f}'.format('asyncio.Queue get', rate))
+    rate = asyncio.run(measure(AsyncQueue(CAPACITY), consume_asyncio, items, batch))
+    print('{:<26} {:>14.0f}'.format('AsyncQueue get', rate))
+    rate = asyncio.run(measure(AsyncQueue(CAPACITY), consume_batches, items, batch))
+    print('{:<26} {:>14.0f}'.format('AsyncQueue get_batch', rate))
@@ -0,0 +1,89 @@
+"""
+Throughput of producer / consumer threads as they scale, BlockingQueue and
+BlockingStack against queue.Queue and a Queue behind one coarse lock
+
+Usage:
+    python benchmarks/blocking_benchmark.py [max_threads] [items]
+"""
+import os
+import queue
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data_structure import BlockingQueue, BlockingStack, Queue
+
+CAPACITY = 1024
+
+
+class CoarseQueue(object):
+    """
+    Queue wrapped in one lock and one condition, as callers did before
+    """
+
+    def __init__(self, capacity):
+        self._queue = Queue()
+        self._capacity = capacity
+        self._condition = threading.Condition()
+
+    def put(self, element, timeout=None):
+        with self._condition:
+            self._condition.wait_for(lambda: self._queue.size() < self._capacity)
+            self._queue.enqueue(element)
+            self._condition.notify_all()
+
+    def get(self, timeout=None):
+        with self._condition:
+            self._condition.wait_for(lambda: self._queue.size() > 0)
+            element = self._queue.dequeue()
+            self._condition.notify_all()
+        return element
+
+
+def measure(make, threads, items):
+    """
+    Runs given number of producers and as many consumers passing items through a shared container
+
+    Returns:
+        items per second
+    """
+    container = make(CAPACITY)
+    per_thread = items // threads
+
+    def produce():
+        for x in range(per_thread):
+            container.put(x)
+
+    def consume():
+        for _ in range(per_thread):
+            container.get()
+
+    workers = [threading.Thread(target=produce) for _ in range(threads)]
+    workers += [threading.Thread(target=consume) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    items = int(sys.argv[2]) if len(sys.argv) > 2 else 200000
+    containers = [
+        ('BlockingQueue', BlockingQueue),
+        ('BlockingStack', BlockingStack),
+        ('queue.Queue', queue.Queue),
+        ('coarse Queue', CoarseQueue)]
+
+    print('{:>8} '.format('pairs') + ' '.join('{:>14}'.format(name) for name, _ in containers))
+    threads = 1
+    while threads <= max_threads:
+        rates = [measure(make, threads, items) for _, make in containers]
+        print('{:>8} '.format(threads) + ' '.join('{:>14.0f}'.format(rate) for rate in rates))
+        threads *= 2
+    print('items per second, one producer and one consumer per pair')
@@ -0,0 +1,67 @@
+"""
+Throughput of external_sort_file on a synthetic file of random f8 values,
+under memory budgets far below the file size
+
+Usage:
+    python benchmarks/external_sort_benchmark.py [gigabytes] [temp dir]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data_structure.external_sort import external_sort_file
+
+# values generated per write, so that the input never sits in memory as a whole
+GENERATE_BLOCK = 1 << 22
+BUDGETS = [(64 << 20, 16), (256 << 20, 16), (256 << 20, 64)]
+
+
+def generate(path, values):
+    """
+    Writes given number of random f8 values to path block by block
+    """
+    state = np.random.RandomState(0)
+    with open(path, 'wb') as file:
+        for low in range(0, values, GENERATE_BLOCK):
+            state.random_sample(min(GENERATE_BLOCK, values - low)).tofile(file)
+
+
+def verify(path):
+    """
+    Checks the output file is acending block by block
+    """
+    previous = -np.inf
+    with open(path, 'rb') as file:
+        while True:
+            block = np.fromfile(file, dtype='f8', count=GENERATE_BLOCK)
+            if len(block) == 0:
+                return True
+            if block[0] < previous or np.any(block[1:] < block[:-1]):
+                return False
+            previous = block[-1]
+
+
+if __name__ == '__main__':
+    gigabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 2
+    directory = tempfile.mkdtemp(dir=sys.argv[2] if len(sys.argv) > 2 else None)
+    values = int(gigabytes * (1 << 30)) // 8
+    input_path = os.path.join(directory, 'input.bin')
+    output_path = os.path.join(directory, 'output.bin')
+
+    try:
+        generate(input_path, values)
+        print('{:>10} {:>10} {:>8} {:>10} {:>10} {:>8}'.format('GiB', 'budget MiB', 'fan in', 'seconds', 'MiB/s', 'sorted'))
+        for budget, fan_in in BUDGETS:
+            start = time.perf_counter()
+            external_sort_file(input_path, output_path, dtype='f8', memory_budget=budget, fan_in=fan_in, temp_dir=directory)
+            seconds = time.perf_counter() - start
+            print('{:>10.2f} {:>10} {:>8} {:>10.2f} {:>10.1f} {:>8}'.format(
+                gigabytes, budget >> 20, fan_in, seconds, values * 8 / seconds / (1 << 20), str(verify(output_path))))
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,51 @@
+"""
+Per-operation latency of cursor-local inserts and removes, Vector against GapVector
+
+Usage:
+    python benchmarks/gap_vector_benchmark.py [max_exponent]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data_structure import GapVector, Vector
+
+OPERATIONS = 20000
+
+
+def measure(vector_class, size):
+    """
+    Types and deletes around a cursor that wanders slowly through the vector
+
+    Args:
+        vector_class (type): Vector or GapVector
+        size (int): number of elements kept in vector
+
+    Returns:
+        nanoseconds per operation
+    """
+    vector = vector_class(initial_iter=range(size))
+    cursor = size // 2
+    random.seed(size)
+
+    start = time.perf_counter()
+    for _ in range(OPERATIONS):
+        cursor = min(max(cursor + random.randint(-2, 2), 1), vector.size() - 1)
+        if random.random() < 0.5:
+            vector.insert(cursor, 0)
+        else:
+            vector.remove(cursor)
+
+    return (time.perf_counter() - start) / OPERATIONS * 1e9
+
+
+if __name__ == '__main__':
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+
+    print('{:>10} {:>16} {:>16}'.format('size', 'vector ns/op', 'gap ns/op'))
+    for exponent in range(3, max_exponent + 1):
+        size = 10 ** exponent
+        print('{:>10} {:>16.1f} {:>16.1f}'.format(size, measure(Vector, size), measure(GapVector, size)))
@@ -0,0 +1,77 @@
+"""
+Compares the counting / radix sort path of Vector.mergesort on ints against
+comparison mergesort and bubblesort, for object and typed vectors
+
+Usage:
+    python benchmarks/integer_sort_benchmark.py [size]
+"""
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data_structure import Vector
+from data_structure.sorting import merge_sort
+
+# bubblesort is quadratic, only run it on inputs up to this size
+BUBBLESORT_LIMIT = 2000
+
+
+def inputs(size):
+    """
+    Returns named int lists of given size
+    """
+    return [
+        ('ids < 1000', [random.randrange(1000) for _ in range(size)]),
+        ('ids < n', [random.randrange(size) for _ in range(size)]),
+        ('ids < 2^32', [random.randrange(1 << 32) for _ in range(size)]),
+    ]
+
+
+def timed(sort, data, dtype=None):
+    """
+    Returns seconds spent sorting a vector holding data
+    """
+    vector = Vector(initial_iter=data, dtype=dtype)
+    start = time.perf_counter()
+    sort(vector)
+    return time.perf_counter() - start
+
+
+def comparison_sort(vector):
+    """
+    Sorts the vector through comparison mergesort, as Vector.mergesort did before the integer path
+    """
+    segment = vector._elements[:vector.size()]
+    merge_sort(segment)
+    vector._elements[:vector.size()] = segment
+
+
+def typed_stable_sort(vector):
+    """
+    Sorts the typed vector through numpy stable sort, as Vector.mergesort did before the integer path
+    """
+    vector._elements[:vector.size()] = np.sort(vector._elements[:vector.size()], kind='stable')
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    candidates = [
+        ('object', None, 'mergesort (integer)', lambda v: v.mergesort()),
+        ('object', None, 'mergesort (integer) desc', lambda v: v.mergesort(acending=False)),
+        ('object', None, 'comparison mergesort', comparison_sort),
+        ('i8', 'i8', 'mergesort (counting)', lambda v: v.mergesort()),
+        ('i8', 'i8', 'numpy stable sort', typed_stable_sort),
+    ]
+    if size <= BUBBLESORT_LIMIT:
+        candidates.append(('object', None, 'bubblesort', lambda v: v.bubblesort()))
+
+    print('{:>12} {:>8} {:>26} {:>10}'.format('input', 'vector', 'method', 'seconds'))
+    for name, data in inputs(size):
+        for vector, dtype, method, sort in candidates:
+            print('{:>12} {:>8} {:>26} {:>10.4f}'.format(name, vector, method, timed(sort, data, dtype)))
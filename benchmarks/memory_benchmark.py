@@ -0,0 +1,58 @@
+"""
+Memory over time of a grow-then-drain workload under different growth policies
+
+Usage:
+    python benchmarks/memory_benchmark.py [size]
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data_structure import Vector
+
+STEPS = 10
+
+POLICIES = [
+    ('double, no shrink', dict()),
+    ('double, shrink 25%', dict(shrink_threshold=0.25)),
+    ('x1.5, shrink 25%', dict(growth_factor=1.5, shrink_threshold=0.25)),
+    ('typed double, shrink 25%', dict(dtype='f8', shrink_threshold=0.25)),
+]
+
+
+def workload(size, **kwargs):
+    """
+    Appends given number of elements in batches, then removes them from the tail in batches
+
+    Returns:
+        list of (phase, vector size, capacity, traced kilobytes) samples
+    """
+    samples = []
+    batch = max(size // STEPS, 1)
+
+    tracemalloc.start()
+    vector = Vector(**kwargs)
+    for _ in range(STEPS):
+        for x in range(batch):
+            vector.append(float(x))
+        samples.append(('grow', vector.size(), vector.capacity(), tracemalloc.get_traced_memory()[0] // 1024))
+
+    for _ in range(STEPS):
+        vector.remove_range(vector.size() - batch, vector.size())
+        samples.append(('drain', vector.size(), vector.capacity(), tracemalloc.get_traced_memory()[0] // 1024))
+    tracemalloc.stop()
+
+    return samples
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    for name, kwargs in POLICIES:
+        print(name)
+        print('{:>8} {:>10} {:>10} {:>10}'.format('phase', 'size', 'capacity', 'KiB'))
+        for phase, vector_size, capacity, kilobytes in workload(size, **kwargs):
+            print('{:>8} {:>10} {:>10} {:>10}'.format(phase, vector_size, capacity, kilobytes))
+        print()
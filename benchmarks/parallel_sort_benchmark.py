@@ -0,0 +1,39 @@
+"""
+Scaling of Vector.parallel_sort across 1, 2, 4 and 8 workers
+
+Usage:
+    python benchmarks/parallel_sort_benchmark.py [size]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data_structure import Vector
+
+WORKERS = [1, 2, 4, 8]
+
+
+def timed(vector, workers):
+    """
+    Returns seconds spent sorting the vector with given number of workers
+    """
+    start = time.perf_counter()
+    vector.parallel_sort(workers=workers)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    data = [random.random() for _ in range(size)]
+
+    print('cpus: {}'.format(os.cpu_count()))
+    print('{:>8} {:>8} {:>10} {:>8}'.format('vector', 'workers', 'seconds', 'speedup'))
+    for name, dtype in [('object', None), ('f8', 'f8')]:
+        baseline = None
+        for workers in WORKERS:
+            seconds = timed(Vector(dtype=dtype, initial_iter=data), workers)
+            baseline = baseline or seconds
+            print('{:>8} {:>8} {:>10.3f} {:>8.2f}'.format(name, workers, seconds, baseline / seconds))
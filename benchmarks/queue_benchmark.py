@@ -0,0 +1,51 @@
+"""
+Per-operation latency of Queue.enqueue/dequeue against queue size
+
+Usage:
+    python benchmarks/queue_benchmark.py [max_exponent]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data_structure import Queue
+
+OPERATIONS = 100000
+
+
+def measure(size):
+    """
+    Fills a queue with given number of elements, then times steady-state enqueue + dequeue pairs
+
+    Args:
+        size (int): number of elements kept in queue
+
+    Returns:
+        (fill, steady) nanoseconds per operation
+    """
+    queue = Queue()
+
+    start = time.perf_counter()
+    for x in range(size):
+        queue.enqueue(x)
+    fill = (time.perf_counter() - start) / size * 1e9
+
+    start = time.perf_counter()
+    for x in range(OPERATIONS):
+        queue.enqueue(x)
+        queue.dequeue()
+    steady = (time.perf_counter() - start) / (2 * OPERATIONS) * 1e9
+
+    return fill, steady
+
+
+if __name__ == '__main__':
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+
+    print('{:>10} {:>16} {:>16}'.format('size', 'fill ns/op', 'steady ns/op'))
+    for exponent in range(3, max_exponent + 1):
+        size = 10 ** exponent
+        fill, steady = measure(size)
+        print('{:>10} {:>16.1f} {:>16.1f}'.format(size, fill, steady))
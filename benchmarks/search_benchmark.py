@@ -0,0 +1,42 @@
+"""
+Compares one binary search per key against Vector.search_many on sorted vectors
+
+Usage:
+    python benchmarks/search_benchmark.py [size]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data_structure import Vector
+
+BATCHES = [100, 1000, 10000]
+
+
+def timed(function):
+    """
+    Returns seconds spent calling function
+    """
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    data = sorted(random.randrange(2 * size) for _ in range(size))
+
+    print('{:>8} {:>8} {:>10} {:>12} {:>12}'.format('vector', 'keys', 'targets', 'per key', 'search_many'))
+    for name, dtype in [('object', None), ('i8', 'i8')]:
+        vector = Vector(dtype=dtype, initial_iter=data)
+        for batch in BATCHES:
+            for order in ['random', 'sorted']:
+                targets = [random.randrange(2 * size) for _ in range(batch)]
+                if order == 'sorted':
+                    targets.sort()
+                single = timed(lambda: [vector.binary_search_acending(t) for t in targets])
+                many = timed(lambda: vector.search_many(targets))
+                print('{:>8} {:>8} {:>10} {:>12.5f} {:>12.5f}'.format(name, batch, order, single, many))
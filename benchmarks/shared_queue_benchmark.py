@@ -0,0 +1,114 @@
+"""
+Throughput of (id, value) records sent from a producer process to a consumer
+process, SharedQueue one by one, in batches and read in place against
+multiprocessing.Queue pickling every record or every batch
+
+Usage:
+    python benchmarks/shared_queue_benchmark.py [records] [batch]
+"""
+import multiprocessing
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data_structure import SharedQueue
+
+RECORD = [('id', 'i8'), ('value', 'f8')]
+CAPACITY = 4096
+
+
+def produce_pickled(queue, records, batch):
+    if batch == 1:
+        for x in range(records):
+            queue.put((x, x / 2))
+    else:
+        for start in range(0, records, batch):
+            block = np.empty(min(batch, records - start), dtype=RECORD)
+            block['id'] = np.arange(start, start + len(block))
+            block['value'] = block['id'] / 2
+            queue.put(block)
+
+
+def produce_shared(queue, records, batch):
+    if batch == 1:
+        for x in range(records):
+            queue.put((x, x / 2))
+    else:
+        for start in range(0, records, batch):
+            block = np.empty(min(batch, records - start), dtype=RECORD)
+            block['id'] = np.arange(start, start + len(block))
+            block['value'] = block['id'] / 2
+            queue.put_many(block)
+    queue.close()
+
+
+def consume_pickled(queue, records, batch):
+    taken = 0
+    while taken < records:
+        if batch == 1:
+            queue.get()
+            taken += 1
+        else:
+            taken += len(queue.get())
+
+
+def consume_shared(queue, records, batch):
+    taken = 0
+    while taken < records:
+        if batch == 1:
+            queue.get()
+            taken += 1
+        else:
+            taken += len(queue.get_many(batch))
+
+
+def consume_in_place(queue, records, batch):
+    taken = 0
+    total = 0.0
+    while taken < records:
+        view = queue.acquire(batch)
+        total += np.asarray(view)['value'].sum()
+        taken += len(view)
+        view.release()
+        queue.release()
+
+
+def measure(queue, produce, consume, records, batch):
+    """
+    Runs a producer process and consumes in this one
+
+    Returns:
+        records per second
+    """
+    producer = multiprocessing.Process(target=produce, args=(queue, records, batch))
+    start = time.perf_counter()
+    producer.start()
+    consume(queue, records, batch)
+    producer.join()
+
+    return records / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    batch = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+    cases = [
+        ('multiprocessing.Queue', 'one by one', 1, lambda: multiprocessing.Queue(CAPACITY), produce_pickled, consume_pickled),
+        ('SharedQueue', 'one by one', 1, lambda: SharedQueue(RECORD, CAPACITY), produce_shared, consume_shared),
+        ('multiprocessing.Queue', 'batches', batch, lambda: multiprocessing.Queue(CAPACITY), produce_pickled, consume_pickled),
+        ('SharedQueue', 'batches', batch, lambda: SharedQueue(RECORD, CAPACITY), produce_shared, consume_shared),
+        ('SharedQueue', 'in place', batch, lambda: SharedQueue(RECORD, CAPACITY), produce_shared, consume_in_place)]
+
+    print('{:<24}{:<12}{:>14}'.format('queue', 'transfer', 'records/s'))
+    for name, transfer, size, make, produce, consume in cases:
+        queue = make()
+        rate = measure(queue, produce, consume, records, size)
+        if isinstance(queue, SharedQueue):
+            queue.close()
+            queue.unlink()
+        print('{:<24}{:<12}{:>14.0f}'.format(name, transfer, rate))
+    print('batch of {} records, {} in total'.format(batch, records))
@@ -0,0 +1,51 @@
+"""
+Cost of freezing a vector through Vector.snapshot against a full copy, and
+of the writes that follow a snapshot
+
+Usage:
+    python benchmarks/snapshot_benchmark.py [size]
+"""
+import os
+import random
+import sys
+import time
+from itertools import product
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data_structure import Vector
+
+WRITES = 1000
+
+
+def timed(function):
+    """
+    Returns (seconds spent calling function, its result)
+    """
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    patterns = [
+        ('recent', [random.randrange(size - size // 100, size) for _ in range(WRITES)]),
+        ('random', [random.randrange(size) for _ in range(WRITES)]),
+    ]
+
+    print('{:>8} {:>8} {:>12} {:>12} {:>16} {:>14}'.format(
+        'vector', 'writes', 'copy s', 'snapshot s', 'writes ns/op', 'copied KiB'))
+    for (name, dtype), (pattern, indices) in product([('object', None), ('f8', 'f8')], patterns):
+        vector = Vector(dtype=dtype, initial_iter=range(size))
+        copy_seconds, _ = timed(lambda: Vector(dtype=dtype, initial_iter=vector.get(0, size)))
+        snapshot_seconds, snapshot = timed(vector.snapshot)
+
+        def write():
+            for i in indices:
+                vector.put(i, 0)
+
+        write_seconds, _ = timed(write)
+        _, copied = snapshot.memory_usage()
+        print('{:>8} {:>8} {:>12.4f} {:>12.6f} {:>16.1f} {:>14}'.format(
+            name, pattern, copy_seconds, snapshot_seconds, write_seconds / WRITES * 1e9, copied // 1024))
@@ -0,0 +1,88 @@
+"""
+Compares Vector.sort against bubblesort, the previous recursive mergesort and builtin sorted
+
+Usage:
+    python benchmarks/sort_benchmark.py [size]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data_structure import Vector
+
+# bubblesort is quadratic, only run it on inputs up to this size
+BUBBLESORT_LIMIT = 2000
+
+
+def recursive_mergesort(elements, low, high):
+    """
+    Top-down mergesort with a temp list per merge, as Vector.mergesort used to be
+    """
+    if high - low < 2:
+        return
+
+    mid = (low + high) >> 1
+    recursive_mergesort(elements, low, mid)
+    recursive_mergesort(elements, mid, high)
+
+    left, right = low, mid
+    temp_container = []
+    while left < mid and right < high:
+        if elements[left] < elements[right]:
+            temp_container.append(elements[left])
+            left += 1
+        else:
+            temp_container.append(elements[right])
+            right += 1
+    temp_container.extend(elements[left:mid])
+    temp_container.extend(elements[right:high])
+    elements[low:high] = temp_container
+
+
+def inputs(size):
+    """
+    Returns named input lists of given size
+    """
+    random_list = [random.random() for _ in range(size)]
+    sorted_list = sorted(random_list)
+    nearly_sorted = list(sorted_list)
+    for _ in range(size // 100 + 1):
+        i, j = random.randrange(size), random.randrange(size)
+        nearly_sorted[i], nearly_sorted[j] = nearly_sorted[j], nearly_sorted[i]
+
+    return [
+        ('random', random_list),
+        ('sorted', sorted_list),
+        ('nearly sorted', nearly_sorted),
+        ('reversed', sorted_list[::-1]),
+    ]
+
+
+def timed(sort, data):
+    """
+    Returns seconds spent sorting a copy of data
+    """
+    vector = Vector(initial_iter=data)
+    start = time.perf_counter()
+    sort(vector)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    candidates = [
+        ('Vector.sort', lambda v: v.sort()),
+        ('recursive mergesort', lambda v: recursive_mergesort(v._elements, 0, v.size())),
+        ('sorted', lambda v: sorted(v._elements[:v.size()])),
+    ]
+    if size <= BUBBLESORT_LIMIT:
+        candidates.append(('Vector.bubblesort', lambda v: v.bubblesort()))
+
+    print('{:>14} {:>22} {:>10}'.format('input', 'method', 'seconds'))
+    for name, data in inputs(size):
+        for method, sort in candidates:
+            print('{:>14} {:>22} {:>10.4f}'.format(name, method, timed(sort, data)))
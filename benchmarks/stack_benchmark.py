@@ -0,0 +1,84 @@
+"""
+Per-operation latency of push and pop, the lean Stack against the vector path the Stack used to take
+
+Usage:
+    python benchmarks/stack_benchmark.py [operations]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data_structure import Stack, Vector
+
+BATCH = 64
+
+
+def measure_vector(operations):
+    """
+    Pushes through append and pops through get and remove, as Stack did before
+    """
+    vector = Vector()
+    start = time.perf_counter()
+    for i in range(operations):
+        vector.append(i)
+    for _ in range(operations):
+        vector.get(vector.size() - 1)
+        vector.remove(vector.size() - 1)
+
+    return (time.perf_counter() - start) / (2 * operations) * 1e9
+
+
+def measure_stack(operations, **kwargs):
+    """
+    Pushes and pops one element at a time
+    """
+    stack = Stack(**kwargs)
+    start = time.perf_counter()
+    for i in range(operations):
+        stack.push(i % 1000)
+    for _ in range(operations):
+        stack.pop()
+
+    return (time.perf_counter() - start) / (2 * operations) * 1e9
+
+
+def measure_batches(operations):
+    """
+    Pushes and pops BATCH elements at a time
+    """
+    stack = Stack()
+    batch = list(range(BATCH))
+    start = time.perf_counter()
+    for _ in range(operations // BATCH):
+        stack.push_many(batch)
+    for _ in range(operations // BATCH):
+        stack.pop_many(BATCH)
+
+    return (time.perf_counter() - start) / (2 * operations) * 1e9
+
+
+def measure_list(operations):
+    """
+    Baseline of python list append and pop
+    """
+    elements = []
+    start = time.perf_counter()
+    for i in range(operations):
+        elements.append(i)
+    for _ in range(operations):
+        elements.pop()
+
+    return (time.perf_counter() - start) / (2 * operations) * 1e9
+
+
+if __name__ == '__main__':
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+    print('{:<28} {:>10}'.format('path', 'ns/op'))
+    print('{:<28} {:>10.1f}'.format('vector append/get/remove', measure_vector(operations)))
+    print('{:<28} {:>10.1f}'.format('stack push/pop', measure_stack(operations)))
+    print('{:<28} {:>10.1f}'.format('stack with min/max', measure_stack(operations, track_min=True, track_max=True)))
+    print('{:<28} {:>10.1f}'.format('stack push_many/pop_many', measure_batches(operations)))
+    print('{:<28} {:>10.1f}'.format('python list', measure_list(operations)))
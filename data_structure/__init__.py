@@ -1,6 +1,18 @@
 from .vector import Vector
+from .vector_view import VectorView
+from .vector_snapshot import VectorSnapshot
+from .mapped_vector import MappedVector
+from .sorted_vector import SortedVector
+from .sparse_vector import SparseVector
+from .gap_vector import GapVector
+from .bloom_filter import BloomFilter
 from .stack import Stack
+from .persistent_stack import PersistentStack
 from .queue import Queue
+from .blocking_queue import BlockingQueue
+from .blocking_stack import BlockingStack
+from .async_queue import AsyncQueue
+from .shared_queue import SharedQueue
 from .list_node import ListNode
 from .list import List
 from .tree_node import TreeNode
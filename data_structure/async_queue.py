@@ -0,0 +1,244 @@
+import asyncio
+from collections import deque
+
+from data_structure import Queue
+
+
+class AsyncQueue(object):
+
+    def __init__(self, capacity=None, **kwargs):
+        """
+        Constructor
+
+        A FIFO queue for asyncio tasks on top of the circular buffer of Queue.
+        Waiting getters and putters park on futures served in arrival order;
+        a getter waiting for a batch is only woken once enough elements are
+        there, so a batch costs one event loop round trip instead of one per
+        element. As in asyncio.Queue, a getter never waits while enough
+        elements are there for it, so getters behind a batch still waiting
+        for more are served first
+
+        Args:
+            capacity (int): maximum number of elements, puts wait beyond it, unbounded if None
+            kwargs: passed to the Queue constructor, e.g. dtype
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError('capacity must be positive')
+
+        self._capacity = capacity
+        if capacity is not None:
+            kwargs.setdefault('default_capacity', capacity)
+        self._queue = Queue(**kwargs)
+        # (future, number of elements it waits for) of each waiting getter
+        self._getters = deque()
+        self._putters = deque()
+        # elements put but not marked done yet
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    def size(self):
+        """
+        Returns number of elements
+        """
+        return self._queue.size()
+
+    def __len__(self):
+        """
+        Returns number of elements
+        """
+        return self._queue.size()
+
+    def empty(self):
+        """
+        Returns if the queue is empty
+        """
+        return self._queue.empty()
+
+    def full(self):
+        """
+        Returns if the queue is full
+        """
+        return self._capacity is not None and self._queue.size() >= self._capacity
+
+    def capacity(self):
+        """
+        Returns maximum number of elements, None if unbounded
+        """
+        return self._capacity
+
+    def _wake_getters(self):
+        """
+        Wakes waiting getters in arrival order, as many as the elements there are enough for
+        """
+        available = self._queue.size()
+        woken = []
+        for entry in self._getters:
+            if not available:
+                break
+            getter, needed = entry
+            if not getter.done() and needed <= available:
+                woken.append(entry)
+                available -= needed
+
+        for entry in woken:
+            self._getters.remove(entry)
+            entry[0].set_result(None)
+
+    def _wake_putters(self, count):
+        """
+        Wakes up to count waiting putters
+        """
+        while count and self._putters:
+            putter = self._putters.popleft()
+            if not putter.done():
+                putter.set_result(None)
+                count -= 1
+
+    async def _park(self, waiters, entry, timeout=None):
+        """
+        Waits until the entry's future is woken
+
+        Args:
+            waiters (deque): getters or putters
+            entry (object): future, or (future, needed) for getters
+            timeout (float): seconds to wait at most, forever if None
+
+        Returns:
+            True if woken, False on timeout
+        """
+        future = entry[0] if isinstance(entry, tuple) else entry
+        waiters.append(entry)
+        try:
+            if timeout is None:
+                await future
+            else:
+                await asyncio.wait([future], timeout=timeout)
+        except BaseException:
+            future.cancel()
+            self._pass_on(waiters, entry, future)
+            raise
+
+        if future.done():
+            return True
+
+        future.cancel()
+        self._pass_on(waiters, entry, future)
+
+        return False
+
+    def _pass_on(self, waiters, entry, future):
+        """
+        Drops an abandoned waiter, passing the elements or room it leaves on to other waiters
+        """
+        try:
+            waiters.remove(entry)
+        except ValueError:
+            pass
+        if waiters is self._getters:
+            # elements it waited for, or was woken for, may be enough for others
+            self._wake_getters()
+        elif future.done() and not future.cancelled():
+            self._wake_putters(1)
+
+    def put_nowait(self, element):
+        """
+        Adds element to the tail without waiting
+
+        Raises:
+            asyncio.QueueFull if the queue is full
+        """
+        if self.full():
+            raise asyncio.QueueFull('queue is full')
+
+        self._queue.enqueue(element)
+        self._unfinished += 1
+        self._finished.clear()
+        self._wake_getters()
+
+    async def put(self, element):
+        """
+        Adds element to the tail, waiting while the queue is full
+        """
+        while self.full():
+            await self._park(self._putters, asyncio.get_running_loop().create_future())
+        self.put_nowait(element)
+
+    def get_nowait(self):
+        """
+        Removes the element at the head without waiting
+
+        Raises:
+            asyncio.QueueEmpty if the queue is empty
+        """
+        if self._queue.empty():
+            raise asyncio.QueueEmpty('queue is empty')
+
+        element = self._queue.dequeue()
+        self._wake_putters(1)
+        self._wake_getters()
+
+        return element
+
+    async def get(self):
+        """
+        Removes the element at the head, waiting while the queue is empty
+        """
+        while self._queue.empty():
+            await self._park(self._getters, (asyncio.get_running_loop().create_future(), 1))
+
+        return self.get_nowait()
+
+    async def get_batch(self, n, timeout=None):
+        """
+        Removes n elements at once, waiting until they are there or timeout expires
+
+        Args:
+            n (int): number of elements, at most capacity
+            timeout (float): seconds to wait at most, forever if None
+
+        Returns:
+            list of up to n elements in FIFO order, fewer only on timeout
+        """
+        if n < 1 or (self._capacity is not None and n > self._capacity):
+            raise ValueError('batch size must be in [1, capacity]')
+
+        if timeout is None:
+            while self._queue.size() < n:
+                await self._park(self._getters, (asyncio.get_running_loop().create_future(), n))
+        else:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            while self._queue.size() < n:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                if not await self._park(self._getters, (loop.create_future(), n), remaining):
+                    break
+
+        count = min(n, self._queue.size())
+        elements = list(self._queue.dequeue_many(count))
+        self._wake_putters(count)
+        self._wake_getters()
+
+        return elements
+
+    def task_done(self, count=1):
+        """
+        Marks given number of elements got earlier as processed
+
+        Raises:
+            ValueError if called more times than elements were put
+        """
+        if count > self._unfinished:
+            raise ValueError('task_done() called too many times')
+
+        self._unfinished -= count
+        if self._unfinished == 0:
+            self._finished.set()
+
+    async def join(self):
+        """
+        Waits until every element put has been marked done
+        """
+        await self._finished.wait()
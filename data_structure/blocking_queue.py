@@ -0,0 +1,158 @@
+import threading
+from queue import Empty, Full
+
+DEFAULT_CAPACITY = 1024
+
+
+class BlockingQueue(object):
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """
+        Constructor
+
+        A bounded FIFO ring buffer for producer / consumer threads. Producers
+        only take the tail lock and consumers only the head lock, so a put and
+        a get never wait for each other; each side counts its own operations
+        and the size is their difference. A side only takes the other lock to
+        wake it up when the queue stops being empty / full, and waiters of the
+        same side wake each other up in a cascade
+
+        Args:
+            capacity (int): maximum number of elements, puts block beyond it
+        """
+        if capacity < 1:
+            raise ValueError('capacity must be positive')
+
+        self._capacity = capacity
+        self._elements = [None] * capacity
+        # numbers of puts and gets so far, each only written under its own lock
+        self._puts, self._gets = 0, 0
+        self._tail_lock = threading.Lock()
+        self._head_lock = threading.Lock()
+        self._not_full = threading.Condition(self._tail_lock)
+        self._not_empty = threading.Condition(self._head_lock)
+
+    def size(self):
+        """
+        Returns number of elements, a snapshot as other threads go on
+        """
+        return self._puts - self._gets
+
+    def __len__(self):
+        """
+        Returns number of elements
+        """
+        return self.size()
+
+    def empty(self):
+        """
+        Returns if the queue is empty
+        """
+        return self.size() == 0
+
+    def full(self):
+        """
+        Returns if the queue is full
+        """
+        return self.size() >= self._capacity
+
+    def capacity(self):
+        """
+        Returns maximum number of elements
+        """
+        return self._capacity
+
+    def _signal_not_empty(self):
+        """
+        Wakes up a consumer, called by a producer once the queue stops being empty
+        """
+        with self._head_lock:
+            self._not_empty.notify()
+
+    def _signal_not_full(self):
+        """
+        Wakes up a producer, called by a consumer once the queue stops being full
+        """
+        with self._tail_lock:
+            self._not_full.notify()
+
+    def put(self, element, timeout=None):
+        """
+        Adds element to the tail, blocking while the queue is full
+
+        Args:
+            element (object): given element
+            timeout (float): seconds to wait at most, forever if None, not at all if 0
+
+        Raises:
+            queue.Full if still full after timeout
+        """
+        with self._tail_lock:
+            if not self._not_full.wait_for(lambda: self._puts - self._gets < self._capacity, timeout):
+                raise Full('queue is full')
+            self._elements[self._puts % self._capacity] = element
+            self._puts += 1
+            size = self._puts - self._gets
+            if size < self._capacity:
+                # cascades to the next waiting producer
+                self._not_full.notify()
+
+        if size == 1:
+            self._signal_not_empty()
+
+    def get(self, timeout=None):
+        """
+        Removes the element at the head, blocking while the queue is empty
+
+        Args:
+            timeout (float): seconds to wait at most, forever if None, not at all if 0
+
+        Raises:
+            queue.Empty if still empty after timeout
+        """
+        with self._head_lock:
+            if not self._not_empty.wait_for(lambda: self._puts > self._gets, timeout):
+                raise Empty('queue is empty')
+            slot = self._gets % self._capacity
+            element = self._elements[slot]
+            # releases the reference held by the buffer
+            self._elements[slot] = None
+            self._gets += 1
+            size = self._puts - self._gets
+            if size > 0:
+                # cascades to the next waiting consumer
+                self._not_empty.notify()
+
+        if size == self._capacity - 1:
+            self._signal_not_full()
+
+        return element
+
+    def drain(self, max_items=None):
+        """
+        Removes the elements available at the head without blocking, taking the lock once
+
+        Args:
+            max_items (int): maximum number of elements, all available ones if None
+
+        Returns:
+            list of elements in FIFO order
+        """
+        with self._head_lock:
+            count = self._puts - self._gets
+            if max_items is not None:
+                count = min(count, max_items)
+            elements = []
+            for _ in range(count):
+                slot = self._gets % self._capacity
+                elements.append(self._elements[slot])
+                self._elements[slot] = None
+                self._gets += 1
+            size = self._puts - self._gets
+
+        if count and size + count >= self._capacity:
+            # producers waiting on a full queue may all go on
+            with self._tail_lock:
+                self._not_full.notify(count)
+
+        return elements
@@ -0,0 +1,116 @@
+import threading
+from queue import Empty, Full
+
+from data_structure import Stack
+from data_structure.blocking_queue import DEFAULT_CAPACITY
+
+
+class BlockingStack(object):
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, **kwargs):
+        """
+        Constructor
+
+        A bounded LIFO stack for producer / consumer threads. Both ends of a
+        stack are its top, so there's one lock, held only around the O(1)
+        push or pop on the lean Stack; producers and consumers wait on
+        separate conditions so that a put only wakes a consumer and a get
+        only wakes a producer
+
+        Args:
+            capacity (int): maximum number of elements, puts block beyond it
+            kwargs: passed to the Stack constructor, e.g. dtype
+        """
+        if capacity < 1:
+            raise ValueError('capacity must be positive')
+
+        self._capacity = capacity
+        self._stack = Stack(capacity, **kwargs)
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._not_empty = threading.Condition(self._lock)
+
+    def size(self):
+        """
+        Returns number of elements, a snapshot as other threads go on
+        """
+        return self._stack.size()
+
+    def __len__(self):
+        """
+        Returns number of elements
+        """
+        return self.size()
+
+    def empty(self):
+        """
+        Returns if the stack is empty
+        """
+        return self.size() == 0
+
+    def full(self):
+        """
+        Returns if the stack is full
+        """
+        return self.size() >= self._capacity
+
+    def capacity(self):
+        """
+        Returns maximum number of elements
+        """
+        return self._capacity
+
+    def put(self, element, timeout=None):
+        """
+        Pushes element, blocking while the stack is full
+
+        Args:
+            element (object): given element
+            timeout (float): seconds to wait at most, forever if None, not at all if 0
+
+        Raises:
+            queue.Full if still full after timeout
+        """
+        with self._lock:
+            if not self._not_full.wait_for(lambda: self._stack.size() < self._capacity, timeout):
+                raise Full('stack is full')
+            self._stack.push(element)
+            self._not_empty.notify()
+
+    def get(self, timeout=None):
+        """
+        Pops the top element, blocking while the stack is empty
+
+        Args:
+            timeout (float): seconds to wait at most, forever if None, not at all if 0
+
+        Raises:
+            queue.Empty if still empty after timeout
+        """
+        with self._lock:
+            if not self._not_empty.wait_for(lambda: self._stack.size() > 0, timeout):
+                raise Empty('stack is empty')
+            element = self._stack.pop()
+            self._not_full.notify()
+
+        return element
+
+    def drain(self, max_items=None):
+        """
+        Pops the available elements without blocking, taking the lock once
+
+        Args:
+            max_items (int): maximum number of elements, all available ones if None
+
+        Returns:
+            list of elements in popping order, the top first
+        """
+        with self._lock:
+            count = self._stack.size()
+            if max_items is not None:
+                count = min(count, max_items)
+            elements = list(self._stack.pop_many(count))
+            if count:
+                self._not_full.notify(count)
+
+        return elements
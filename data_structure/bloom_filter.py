@@ -0,0 +1,133 @@
+import hashlib
+import math
+import pickle
+
+# expected number of distinct elements before the filter grows
+DEFAULT_CAPACITY = 1 << 20
+# upper bound of the false positive rate
+DEFAULT_ERROR_RATE = 0.01
+# capacity factor and error rate factor of each grown filter
+GROWTH = 2
+TIGHTENING = 0.5
+
+
+def fingerprint(element, size=16):
+    """
+    Hashes element through its pickled bytes, stable for equal elements that pickle alike
+
+    Args:
+        element (object): given element, which may be unhashable
+        size (int): bytes of the fingerprint
+
+    Returns:
+        bytes of given size
+    """
+    data = pickle.dumps(element, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return hashlib.blake2b(data, digest_size=size).digest()
+
+
+class BloomFilter(object):
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, error_rate=DEFAULT_ERROR_RATE):
+        """
+        Constructor
+
+        A scalable Bloom filter: each slice is a bit array sized for its
+        capacity, and once it's full a slice GROWTH times larger with
+        TIGHTENING times the error rate is added, so the false positive rate
+        stays below error_rate however many elements are added. Elements are
+        never reported missing once added
+
+        Args:
+            capacity (int): expected number of distinct elements
+            error_rate (float): upper bound of the false positive rate, in (0, 1)
+        """
+        if capacity < 1:
+            raise ValueError('capacity must be positive')
+        if not 0 < error_rate < 1:
+            raise ValueError('error rate must be in (0, 1)')
+
+        self._size = 0
+        # [bits, bit count, hash count, capacity, element count, error rate] of each slice
+        self._slices = []
+        # the error rates of all slices sum up to error_rate
+        self._add_slice(capacity, error_rate * (1 - TIGHTENING))
+
+    def _add_slice(self, capacity, error_rate):
+        """
+        Adds a slice with optimal bit count and hash count for given capacity and error rate
+        """
+        bit_count = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        hash_count = max(1, int(round(bit_count / capacity * math.log(2))))
+        self._slices.append([bytearray((bit_count + 7) // 8), bit_count, hash_count, capacity, 0, error_rate])
+
+    @staticmethod
+    def _positions(digest, bit_count, hash_count):
+        """
+        Derives hash_count bit positions from one digest through double hashing
+        """
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+
+        return [(h1 + k * h2) % bit_count for k in range(hash_count)]
+
+    def _contains_digest(self, digest):
+        """
+        Checks whether every bit of the digest is set in some slice
+        """
+        for bits, bit_count, hash_count, _, _, _ in self._slices:
+            if all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(digest, bit_count, hash_count)):
+                return True
+
+        return False
+
+    def add(self, element):
+        """
+        Adds given element
+
+        Args:
+            element (object): given element, compared by its pickled bytes
+
+        Returns:
+            True if the element wasn't in the filter, False if it was or on a false positive
+        """
+        digest = fingerprint(element)
+        if self._contains_digest(digest):
+            return False
+
+        current = self._slices[-1]
+        if current[4] >= current[3]:
+            self._add_slice(current[3] * GROWTH, current[5] * TIGHTENING)
+            current = self._slices[-1]
+        bits, bit_count, hash_count = current[0], current[1], current[2]
+        for p in self._positions(digest, bit_count, hash_count):
+            bits[p >> 3] |= 1 << (p & 7)
+        current[4] += 1
+        self._size += 1
+
+        return True
+
+    def __contains__(self, element):
+        """
+        Overloads membership test, may be a false positive but never a false negative
+        """
+        return self._contains_digest(fingerprint(element))
+
+    def __len__(self):
+        """
+        Returns number of elements added, less than the distinct count by the false positives
+        """
+        return self._size
+
+    def size(self):
+        """
+        Returns number of elements added
+        """
+        return self._size
+
+    def memory_usage(self):
+        """
+        Returns bytes of the bit arrays
+        """
+        return sum(len(s[0]) for s in self._slices)
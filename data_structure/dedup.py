@@ -0,0 +1,206 @@
+import os
+import shutil
+import tempfile
+from itertools import count
+
+import numpy as np
+
+from data_structure.bloom_filter import DEFAULT_CAPACITY, DEFAULT_ERROR_RATE, BloomFilter, fingerprint
+from data_structure.run_files import merge_typed_runs, write_run
+
+# distinct elements remembered in memory before their fingerprints are spilled to disk
+DEFAULT_MAX_ITEMS = 1 << 20
+# fingerprints merged at once when spilled runs are combined
+MERGE_BLOCK_SIZE = 1 << 16
+# numpy strips trailing null bytes, so every fingerprint ends with a marker byte
+FINGERPRINT_DTYPE = np.dtype('S16')
+MODES = ('exact', 'approximate', 'sorted')
+
+_EMPTY = object()
+
+
+def _fingerprint(element):
+    """
+    Returns 16 bytes identifying element, the last byte never null
+    """
+    return fingerprint(element, FINGERPRINT_DTYPE.itemsize - 1) + b'\x01'
+
+
+def unique_sorted(iterable, key=None):
+    """
+    Drops elements equal to the one before them, in O(1) memory
+
+    Only adjacent duplicates are dropped, so every duplicate is dropped if the
+    input is sorted or grouped by key, as in List.uniquify
+
+    Args:
+        iterable (iterable): given elements
+        key (callable): maps element to the key it's compared by
+
+    Returns:
+        generator of the first element of each group
+    """
+    previous = _EMPTY
+    for element in iterable:
+        current = element if key is None else key(element)
+        if previous is _EMPTY or current != previous:
+            previous = current
+            yield element
+
+
+def unique_approximate(iterable, key=None, error_rate=DEFAULT_ERROR_RATE, capacity=DEFAULT_CAPACITY):
+    """
+    Drops repeated elements through a Bloom filter, in about 10 bits per distinct element at 1% error rate
+
+    Duplicates are always dropped, while a distinct element is dropped as
+    well with probability below error_rate
+
+    Args:
+        iterable (iterable): given elements, which may be unhashable
+        key (callable): maps element to the key it's compared by, keys are compared by their pickled bytes
+        error_rate (float): upper bound of the chance to drop a distinct element
+        capacity (int): expected number of distinct elements, the filter grows beyond it
+
+    Returns:
+        generator of the first occurrence of each element
+    """
+    seen = BloomFilter(capacity, error_rate)
+    for element in iterable:
+        if seen.add(element if key is None else key(element)):
+            yield element
+
+
+def _contains(runs, digest):
+    """
+    Checks whether any sorted fingerprint run holds digest through binary search
+    """
+    for _, run in runs:
+        i = int(np.searchsorted(run, digest))
+        if i < len(run) and run[i] == digest:
+            return True
+
+    return False
+
+
+def _spill(seen, runs, directory, names):
+    """
+    Saves fingerprints as a sorted run file, then merges the newest runs while
+    the one before is no larger, which keeps O(log n) runs like a binary counter
+
+    Args:
+        seen (set): fingerprints in memory
+        runs (list): (path, memory map) of each spilled run, oldest first
+        directory (str): directory holding the run files
+        names (iterator): unique numbers naming the run files
+    """
+    path = os.path.join(directory, 'seen-{}.bin'.format(next(names)))
+    write_run(path, [np.sort(np.array(list(seen), dtype=FINGERPRINT_DTYPE))], FINGERPRINT_DTYPE)
+    runs.append((path, np.memmap(path, dtype=FINGERPRINT_DTYPE, mode='r')))
+
+    while len(runs) > 1 and len(runs[-2][1]) <= len(runs[-1][1]):
+        (older, _), (newer, _) = runs.pop(-2), runs.pop()
+        path = os.path.join(directory, 'seen-{}.bin'.format(next(names)))
+        # runs hold disjoint fingerprints, so merging keeps them unique
+        write_run(path, merge_typed_runs([older, newer], FINGERPRINT_DTYPE, False, MERGE_BLOCK_SIZE), FINGERPRINT_DTYPE)
+        os.remove(older)
+        os.remove(newer)
+        runs.append((path, np.memmap(path, dtype=FINGERPRINT_DTYPE, mode='r')))
+
+
+def unique_exact(iterable, key=None, max_items=DEFAULT_MAX_ITEMS, temp_dir=None):
+    """
+    Drops repeated elements, spilling what it has seen to disk once it's seen max_items distinct ones
+
+    Hashable elements are remembered in a set and compared by == as in
+    Vector.deduplicate, unhashable ones by 128-bit fingerprints of their
+    pickled bytes, so e.g. dicts of the same items inserted in different
+    order count as distinct. Once max_items are remembered, they are spilled
+    as a sorted run file of fingerprints and later lookups binary search the
+    memory mapped runs, so memory stays bounded however many distinct
+    elements come; an element equal to a spilled one but pickled differently,
+    such as 1.0 after 1, is then kept again, and spilled elements must be
+    picklable
+
+    Args:
+        iterable (iterable): given elements, which may be unhashable
+        key (callable): maps element to the key it's compared by
+        max_items (int): distinct elements remembered in memory
+        temp_dir (str): directory for the run files, system default if None
+
+    Returns:
+        generator of the first occurrence of each element, temp files are removed once it's exhausted or closed
+    """
+    if max_items < 1:
+        raise ValueError('max items must be positive')
+
+    # hashable keys, and fingerprints of unhashable ones
+    values, seen = set(), set()
+    runs = []
+    directory, names = None, count()
+    try:
+        for element in iterable:
+            current = element if key is None else key(element)
+            try:
+                if current in values:
+                    continue
+                hashable = True
+            except TypeError:
+                hashable = False
+
+            if hashable:
+                if runs and _contains(runs, _fingerprint(current)):
+                    continue
+                values.add(current)
+            else:
+                digest = _fingerprint(current)
+                if digest in seen or (runs and _contains(runs, digest)):
+                    continue
+                seen.add(digest)
+            yield element
+
+            if len(values) + len(seen) >= max_items:
+                if directory is None:
+                    directory = tempfile.mkdtemp(dir=temp_dir)
+                seen.update(_fingerprint(value) for value in values)
+                _spill(seen, runs, directory, names)
+                values, seen = set(), set()
+    finally:
+        # memory maps are released before their files are removed
+        del runs[:]
+        if directory is not None:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+def unique(
+        iterable,
+        mode='exact',
+        key=None,
+        max_items=DEFAULT_MAX_ITEMS,
+        error_rate=DEFAULT_ERROR_RATE,
+        capacity=DEFAULT_CAPACITY,
+        temp_dir=None):
+    """
+    Streams the first occurrence of each element, keeping the input order
+
+    Args:
+        iterable (iterable): given elements
+        mode (str): 'exact' remembers elements, spilled to disk as fingerprints beyond max_items,
+            'approximate' remembers them in a Bloom filter, which may drop distinct elements at error_rate,
+            'sorted' only compares neighbours in O(1) memory, which suits sorted or grouped input
+        key (callable): maps element to the key it's compared by
+        max_items (int): distinct elements remembered in memory, exact mode only
+        error_rate (float): upper bound of the chance to drop a distinct element, approximate mode only
+        capacity (int): expected number of distinct elements, approximate mode only
+        temp_dir (str): directory for spilled runs, exact mode only
+
+    Returns:
+        generator of elements
+    """
+    if mode == 'exact':
+        return unique_exact(iterable, key, max_items, temp_dir)
+    if mode == 'approximate':
+        return unique_approximate(iterable, key, error_rate, capacity)
+    if mode == 'sorted':
+        return unique_sorted(iterable, key)
+
+    raise ValueError('mode must be one of {}'.format(', '.join(MODES)))
@@ -0,0 +1,182 @@
+import os
+import sys
+import tempfile
+from itertools import chain, islice
+
+import numpy as np
+
+from data_structure import Vector
+from data_structure.run_files import blocks, merge_object_runs, merge_typed_runs, read_run, write_run
+
+# bytes of elements held in memory at once, split between the chunk being sorted and the merge buffers
+DEFAULT_MEMORY_BUDGET = 64 << 20
+# number of runs merged at once, more runs are merged in several passes
+DEFAULT_FAN_IN = 16
+# bytes of a list slot, which references its element
+POINTER_SIZE = np.dtype(np.intp).itemsize
+
+_EMPTY = object()
+
+
+def _element_size(sample, dtype):
+    """
+    Estimates bytes taken by one element in memory
+    """
+    if dtype is not None:
+        return dtype.itemsize
+
+    return sys.getsizeof(sample) + POINTER_SIZE
+
+
+def _sizes(element_size, memory_budget, fan_in):
+    """
+    Returns (chunk size, block size) in elements
+
+    A chunk is sorted in memory, which takes twice its size; a merge keeps
+    one block per run plus the merged block
+    """
+    chunk_size = max(1, memory_budget // (2 * element_size))
+    block_size = max(1, memory_budget // ((fan_in + 1) * element_size))
+
+    return chunk_size, block_size
+
+
+def _merge(paths, dtype, key, reverse, block_size):
+    """
+    Merges sorted runs
+
+    Returns:
+        generator of merged blocks
+    """
+    if dtype is not None:
+        return merge_typed_runs(paths, dtype, reverse, block_size)
+
+    return merge_object_runs(paths, key, reverse, block_size)
+
+
+def _sorted_blocks(chunks, dtype, key, reverse, block_size, fan_in, directory):
+    """
+    Sorts each chunk with the vector sort and spills it as a run, then merges the runs fan_in at a time
+
+    Args:
+        chunks (iterable): lists or numpy arrays of unsorted elements
+        directory (str): directory holding the run files
+
+    Returns:
+        generator of sorted blocks
+    """
+    paths = []
+    for chunk in chunks:
+        vector = Vector(max(len(chunk), 1), initial_iter=chunk, dtype=dtype)
+        vector.sort(key=key, reverse=reverse)
+        path = os.path.join(directory, 'run-{}.bin'.format(len(paths)))
+        write_run(path, blocks(vector.get(0, vector.size()), block_size), dtype)
+        paths.append(path)
+        # releases the sorted chunk before the next one is read
+        del chunk, vector
+
+    generation = 0
+    while len(paths) > fan_in:
+        generation += 1
+        merged_paths = []
+        for low in range(0, len(paths), fan_in):
+            group = paths[low:low + fan_in]
+            path = os.path.join(directory, 'run-{}-{}.bin'.format(generation, len(merged_paths)))
+            write_run(path, _merge(group, dtype, key, reverse, block_size), dtype)
+            merged_paths.append(path)
+            for old in group:
+                os.remove(old)
+        paths = merged_paths
+
+    for block in _merge(paths, dtype, key, reverse, block_size):
+        yield block
+
+
+def _chunked(iterator, dtype, chunk_size):
+    """
+    Streams chunks of given size from an iterator
+    """
+    while True:
+        if dtype is not None:
+            chunk = np.fromiter(islice(iterator, chunk_size), dtype=dtype)
+        else:
+            chunk = list(islice(iterator, chunk_size))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+def external_sort(
+        iterable,
+        dtype=None,
+        key=None,
+        reverse=False,
+        memory_budget=DEFAULT_MEMORY_BUDGET,
+        fan_in=DEFAULT_FAN_IN,
+        temp_dir=None):
+    """
+    Sorts elements that may not fit in memory, stable
+
+    Input is streamed in chunks bounded by memory budget, each chunk is sorted
+    through Vector.sort and spilled to a temp file as a run, and the runs are
+    merged fan_in at a time until the last merge streams the output
+
+    Args:
+        iterable (iterable): elements to be sorted
+        dtype (str): numpy dtype, e.g. 'f8' or 'i8', runs are saved as raw values if given
+        key (callable): maps element to the key it's compared by, python objects only
+        reverse (bool): True if sorting descendingly
+        memory_budget (int): approximate bytes of elements held in memory at once
+        fan_in (int): number of runs merged at once, at least 2
+        temp_dir (str): directory for the run files, system default if None
+
+    Returns:
+        generator of sorted elements, temp files are removed once it's exhausted or closed
+    """
+    if fan_in < 2:
+        raise ValueError('fan in must be at least 2')
+    dtype = None if dtype is None else np.dtype(dtype)
+    if dtype is not None and key is not None:
+        raise ValueError('key is not supported for typed elements')
+
+    iterator = iter(iterable)
+    first = next(iterator, _EMPTY)
+    if first is _EMPTY:
+        return
+    chunk_size, block_size = _sizes(_element_size(first, dtype), memory_budget, fan_in)
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        chunks = _chunked(chain([first], iterator), dtype, chunk_size)
+        for block in _sorted_blocks(chunks, dtype, key, reverse, block_size, fan_in, directory):
+            for element in block:
+                yield element
+
+
+def external_sort_file(
+        input_path,
+        output_path,
+        dtype='f8',
+        reverse=False,
+        memory_budget=DEFAULT_MEMORY_BUDGET,
+        fan_in=DEFAULT_FAN_IN,
+        temp_dir=None):
+    """
+    Sorts a file of raw typed values into another file of the same format, stable
+
+    Args:
+        input_path (str): file of raw values, e.g. written by numpy.ndarray.tofile
+        output_path (str): file the sorted values are written to
+        dtype (str): numpy dtype of the values
+        reverse (bool): True if sorting descendingly
+        memory_budget (int): approximate bytes of elements held in memory at once
+        fan_in (int): number of runs merged at once, at least 2
+        temp_dir (str): directory for the run files, system default if None
+    """
+    if fan_in < 2:
+        raise ValueError('fan in must be at least 2')
+    dtype = np.dtype(dtype)
+    chunk_size, block_size = _sizes(dtype.itemsize, memory_budget, fan_in)
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        chunks = read_run(input_path, dtype, chunk_size)
+        write_run(output_path, _sorted_blocks(chunks, dtype, None, reverse, block_size, fan_in, directory), dtype)
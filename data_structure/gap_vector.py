@@ -0,0 +1,253 @@
+import functools
+
+from data_structure import Vector
+from data_structure.vector import override_methods
+
+# vector operations reading the buffer by index, which run with the gap at the end;
+# _order_counts backs the order properties, _buffer backs views and _resize is reached by growing and shrinking
+LINEARIZED_METHODS = (
+    '__str__', '__array__', '__contains__', '__add__', '__radd__', '__iadd__', '__sub__', '__rsub__', '__isub__',
+    '__mul__', '__rmul__', '__imul__', '__truediv__', '__rtruediv__', '__itruediv__', '__lt__', '__le__', '__gt__',
+    '__ge__', '_buffer', '_order_counts', '_resize', 'compare_with_iterable', 'append', 'take', 'put_many',
+    'equal', 'not_equal', 'dot', 'sum', 'min', 'max', 'argmin', 'argmax', 'mean', 'expand', 'reserve',
+    'shrink_to_fit', 'unsorted', 'build_index', 'find', 'count', 'search', 'binary_search_acending',
+    'binary_search_descending', 'search_many', 'extend', 'partial_permute', 'permute', 'deduplicate', 'filter',
+    'bubblesort', 'sort', 'parallel_sort', 'mergesort', 'merge', 'nth_element', 'select', 'top_k')
+
+
+class GapVector(Vector):
+
+    def __init__(self, *args, **kwargs):
+        """
+        Constructor
+
+        The free space of the vector is kept as a gap at the last edit point:
+        vector index i lives on slot i before the gap and on slot
+        i + capacity - size after it, so inserting or removing next to the
+        previous edit only moves the gap over the elements in between instead
+        of shifting the whole tail
+
+        Args:
+            same as vector
+
+            default_capacity (int): default initial fixed size
+            default_element (object): default element in vector
+            initial_iter (iterable): initial elements to initialize vector
+        """
+        # index where the gap starts, None if the gap is at the end
+        self._gap = None
+        super(GapVector, self).__init__(*args, **kwargs)
+
+    def _slot(self, i):
+        """
+        Maps vector index to slot in the gap buffer
+
+        Args:
+            i (int): index
+        """
+        if self._gap is None or i < self._gap:
+            return i
+
+        return i + self._capacity - self._size
+
+    def _move_gap(self, i):
+        """
+        Moves the gap to start on index i, copying only the elements in between
+
+        Args:
+            i (int): index
+        """
+        gap = self._size if self._gap is None else self._gap
+        length = self._capacity - self._size
+        if i < gap:
+            self._elements[i + length:gap + length] = self._elements[i:gap]
+            # releases references held by slots that are now in the gap
+            vacated = min(gap, i + length) - i
+            self._elements[i:i + vacated] = self._allocate(vacated)
+        elif i > gap:
+            self._elements[gap:i] = self._elements[gap + length:i + length]
+            vacated = i + length - max(i, gap + length)
+            self._elements[i + length - vacated:i + length] = self._allocate(vacated)
+
+        self._gap = None if i == self._size else i
+
+    def _linearize(self):
+        """
+        Moves the gap to the end so that vector index i lives on slot i
+        """
+        if self._gap is not None:
+            self._move_gap(self._size)
+
+    def __iter__(self):
+        """
+        Iterates over elements, skipping the gap
+        """
+        for i in range(self._size):
+            yield self._elements[self._slot(i)]
+
+    def __getitem__(self, index):
+        """
+        Overloads item indexing
+
+        Args:
+            i (int): index
+
+        Returns:
+            data saved in the i-th element in vector
+        """
+        if isinstance(index, slice):
+            self._linearize()
+            return self._elements[index]
+
+        if index < 0:
+            index += self._size
+
+        return self._elements[self._slot(index)]
+
+    def __setitem__(self, index, value):
+        """
+        Overloads item indexing
+
+        Args:
+            i (int): index
+            value (object): data to be saved in the i-th element in vector
+        """
+        if isinstance(index, slice):
+            self._preserve(0, self._size)
+            self._linearize()
+            self._elements[index] = value
+        else:
+            if index < 0:
+                index += self._size
+            self._preserve(index, index + 1)
+            self._elements[self._slot(index)] = value
+        self._descents, self._ascents = None, None
+
+    def copy_from(self, iter, dedup=None):
+        """
+        Copies content from given iterable
+
+        Args:
+            iter (iterable): iterable object from which contents are copied and put into vector
+            dedup (str): mode of dedup.unique dropping repeated elements on the way in, 'exact', 'approximate' or 'sorted', all kept if None
+        """
+        # snapshots read the old elements through the gap before it's reset
+        self._preserve(0, self._size)
+        self._gap = None
+        super(GapVector, self).copy_from(iter, dedup)
+
+    def get(self, i, j=None):
+        """
+        Gets element of index [i, j)
+
+        Args:
+            i, j (int): index
+        """
+        if j is None:
+            if 0 <= i < self._size:
+                return self._elements[self._slot(i)]
+            else:
+                raise IndexError('index out of range')
+
+        self._linearize()
+        return super(GapVector, self).get(i, j)
+
+    def put(self, i, element):
+        """
+        Updates element of index i
+
+        Args:
+            i (int): index
+            element (object): the given element to be updated on index i
+        """
+        if 0 <= i < self._size:
+            self._preserve(i, i + 1)
+            self._elements[self._slot(i)] = element
+            self._descents, self._ascents = None, None
+        else:
+            raise IndexError('index out of range')
+
+    def insert(self, i, element):
+        """
+        Inserts element on given index, amortized O(1) next to the previous edit
+
+        Args:
+            i (int): index
+            element (object): given element to be inserted into vector
+        """
+        self.insert_many(i, [element])
+
+    def insert_many(self, i, iterable):
+        """
+        Inserts elements on given index through the gap
+
+        Args:
+            i (int): index
+            iterable (iterable): given elements to be inserted into vector
+        """
+        if not 0 <= i <= self._size:
+            raise IndexError('index out of range')
+
+        values = list(iterable)
+        count = len(values)
+        if count == 0:
+            return
+
+        self._preserve(i, self._size + count)
+        if self._size + count > self._capacity:
+            # grows with the gap at the end, amortized O(1) as capacity grows geometrically
+            self._ensure_capacity(self._size + count)
+        self._move_gap(i)
+        self._elements[i:i + count] = values
+        self._size += count
+        self._gap = None if i + count == self._size else i + count
+        # order is recounted lazily if a search needs it
+        self._descents, self._ascents = None, None
+
+    def remove_range(self, start, end):
+        """
+        Removes vector segment [start, end) by widening the gap
+
+        Args:
+            start (int): starting index
+            end (int): ending index
+        """
+        if 0 <= start < end <= self._size:
+            self._preserve(start, self._size)
+            self._move_gap(start)
+            length = self._capacity - self._size
+            # releases references held by the removed slots
+            self._elements[start + length:end + length] = self._allocate(end - start)
+            self._size -= end - start
+            self._gap = None if start == self._size else start
+            self._descents, self._ascents = None, None
+            self._shrink_if_sparse()
+        else:
+            raise IndexError('starting and ending index out of valid range')
+
+    def partial_remove(self, start, end):
+        """
+        Removes vector segment [start, end)
+        """
+        self.remove_range(start, end)
+
+    def remove(self, i):
+        """
+        Removes element on index i
+        """
+        self.remove_range(i, i + 1)
+
+
+def _linearized(method):
+    """
+    Wraps vector method so that it runs with the gap at the end
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._linearize()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+override_methods(GapVector, LINEARIZED_METHODS, _linearized)
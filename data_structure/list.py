@@ -1,4 +1,5 @@
 from data_structure import ListNode
+from data_structure.dedup import unique
 
 
 class List(object):
@@ -108,13 +109,16 @@ class List(object):
         """
         self.get(i)._data = value
 
-    def copy_from(self, iterable):
+    def copy_from(self, iterable, dedup=None):
         """
         Copies content from given iterable
 
         Args:
             iterable (iterable): iterable object from which contents are copied and put into list
+            dedup (str): mode of dedup.unique dropping repeated elements on the way in, 'exact', 'approximate' or 'sorted', all kept if None
         """                 
+        if dedup is not None:
+            iterable = unique(iterable, dedup)
         temp = self._head
         self._size = 0
 
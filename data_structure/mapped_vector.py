@@ -0,0 +1,166 @@
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from data_structure import Vector
+from data_structure.dedup import unique
+from data_structure.vector import DEFAULT_SIZE, DEFAULT_GROWTH_FACTOR
+
+MAGIC = b'DSVECTOR'
+# magic, dtype string, size, capacity
+HEADER_FORMAT = '<8s16sqq'
+# elements start on a 64-byte boundary
+HEADER_SIZE = 64
+SIZE_OFFSET = 24
+
+
+class MappedVector(Vector):
+
+    def __init__(
+        self,
+        path,
+        dtype='f8',
+        default_capacity=DEFAULT_SIZE,
+        growth_factor=DEFAULT_GROWTH_FACTOR,
+        initial_iter=None):
+        """
+        Constructor
+
+        Elements live in a memory-mapped file made of a 64-byte header (size,
+        capacity, dtype) followed by the fixed space, so reopening an existing
+        file maps it without reading the elements
+
+        Args:
+            path (str): file path, created if it doesn't exist
+            dtype (str): numpy dtype, e.g. 'f8' or 'i8', ignored if the file exists
+            default_capacity (int): default initial fixed size of a new file
+            growth_factor (float): the fixed space is multiplied by this factor when it's full
+            initial_iter (iterable): initial elements to initialize vector
+        """
+        if growth_factor <= 1:
+            raise ValueError('growth factor must be greater than 1')
+
+        self._path = path
+        self._default_capacity = default_capacity
+        self._growth_factor = growth_factor
+        self._shrink_threshold = None
+
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            self._file = open(path, 'r+b')
+            magic, dtype_str, _, capacity = struct.unpack(HEADER_FORMAT, self._file.read(struct.calcsize(HEADER_FORMAT)))
+            if magic != MAGIC:
+                raise ValueError('not a mapped vector file')
+            self._dtype = np.dtype(dtype_str.rstrip(b'\0').decode('ascii'))
+        else:
+            self._dtype = np.dtype(dtype)
+            if self._dtype.hasobject:
+                raise ValueError('mapped vector requires a numeric dtype')
+            capacity = default_capacity
+            self._file = open(path, 'w+b')
+            self._file.write(struct.pack(HEADER_FORMAT, MAGIC, self._dtype.str.encode('ascii'), 0, capacity))
+            self._file.truncate(HEADER_SIZE + capacity * self._dtype.itemsize)
+
+        self._default_element = self._dtype.type(0)
+        self._capacity = capacity
+        self._map()
+        # order is counted lazily so that reopening doesn't scan the file
+        self._descents, self._ascents = None, None
+        self._snapshots = None
+        self._index = None
+
+        if initial_iter is not None:
+            self.copy_from(initial_iter)
+
+    def _map(self):
+        """
+        Maps the file and builds arrays on the header and the fixed space
+        """
+        self._file.flush()
+        self._mmap = mmap.mmap(self._file.fileno(), HEADER_SIZE + self._capacity * self._dtype.itemsize)
+        # frombuffer holds a buffer export, so the mapping can't be closed under live arrays
+        self._header = np.frombuffer(self._mmap, dtype='<i8', count=2, offset=SIZE_OFFSET)
+        self._elements = np.frombuffer(self._mmap, dtype=self._dtype, count=self._capacity, offset=HEADER_SIZE)
+
+    @property
+    def _size(self):
+        """
+        Vector size saved in the file header
+        """
+        return int(self._header[0])
+
+    @_size.setter
+    def _size(self, value):
+        self._header[0] = value
+
+    def path(self):
+        """
+        Returns file path
+        """
+        return self._path
+
+    def copy_from(self, iter, dedup=None):
+        """
+        Copies content from given iterable, keeping the file
+
+        Args:
+            iter (iterable): iterable object from which contents are copied and put into vector
+            dedup (str): mode of dedup.unique dropping repeated elements on the way in, 'exact', 'approximate' or 'sorted', all kept if None
+        """
+        if dedup is not None:
+            iter = unique(iter, dedup)
+        self._preserve(0, self._size)
+        self._size = 0
+        self._descents, self._ascents = 0, 0
+        self.extend(iter)
+
+    def _resize(self, capacity):
+        """
+        Resizes the file and remaps it
+
+        Args:
+            capacity (int): new size of the fixed space
+        """
+        if capacity == self._capacity:
+            return
+
+        if capacity < self._capacity:
+            # the old mapping must go before the file shrinks under it
+            self._header, self._elements = None, None
+            try:
+                self._mmap.close()
+            except BufferError:
+                self._map()
+                raise BufferError('arrays or views on the mapped vector are still alive')
+
+        self._file.truncate(HEADER_SIZE + capacity * self._dtype.itemsize)
+        self._capacity = capacity
+        # the previous mapping is released once nothing references it
+        self._map()
+        self._header[1] = capacity
+
+    def flush(self):
+        """
+        Writes changes through to the file
+        """
+        self._mmap.flush()
+
+    def close(self):
+        """
+        Flushes and closes the file
+        """
+        self.flush()
+        self._header, self._elements = None, None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # arrays handed out still reference the mapping, it's unmapped once they are gone
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
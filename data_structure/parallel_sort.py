@@ -0,0 +1,156 @@
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from data_structure.sorting import merge_sort
+
+# below this many elements per worker the pool costs more than it saves
+MIN_CHUNK_SIZE = 10000
+
+
+def _sort_chunk(task):
+    """
+    Sorts one chunk of python objects in a worker process
+
+    Args:
+        task (tuple): (chunk, key, reverse)
+
+    Returns:
+        sorted chunk
+    """
+    chunk, key, reverse = task
+    merge_sort(chunk, key=key, reverse=reverse)
+
+    return chunk
+
+
+def _sort_shared_chunk(task):
+    """
+    Sorts one chunk of a typed array in shared memory in place, in a worker process
+
+    Args:
+        task (tuple): (shared memory name, dtype string, total size, start, end)
+    """
+    name, dtype, size, start, end = task
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        elements = np.ndarray((size,), dtype=np.dtype(dtype), buffer=memory.buf)
+        elements[start:end] = np.sort(elements[start:end], kind='stable')
+        del elements
+    finally:
+        memory.close()
+
+
+def chunk_bounds(size, chunks):
+    """
+    Splits [0, size) into given number of nearly equal chunks
+
+    Returns:
+        list of (start, end)
+    """
+    bounds = [size * i // chunks for i in range(chunks + 1)]
+
+    return [(bounds[i], bounds[i + 1]) for i in range(chunks) if bounds[i] < bounds[i + 1]]
+
+
+def parallel_merge_sort(elements, key=None, reverse=False, workers=None):
+    """
+    Sorts chunks of elements in a process pool and merges the sorted runs, stable
+
+    Python objects are pickled to the workers and the runs are merged through
+    a heap; numpy arrays are sorted in shared memory without pickling and the
+    runs are merged pairwise with vectorized binary search, as a heap merge
+    would go element by element in python
+
+    Args:
+        elements (list or numpy.ndarray): elements to be sorted, not modified
+        key (callable): maps element to the key it's compared by, must be picklable, python objects only
+        reverse (bool): True if sorting descendingly
+        workers (int): number of worker processes, number of cpus if None
+
+    Returns:
+        sorted list, or numpy array if elements is a numpy array
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    chunks = chunk_bounds(len(elements), max(1, min(workers, len(elements) // MIN_CHUNK_SIZE)))
+
+    if isinstance(elements, np.ndarray):
+        if key is not None:
+            raise ValueError('key is not supported for typed elements')
+        return _parallel_sort_typed(elements, reverse, chunks)
+
+    if len(chunks) <= 1:
+        result = list(elements)
+        merge_sort(result, key=key, reverse=reverse)
+        return result
+
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        runs = list(executor.map(_sort_chunk, [(elements[start:end], key, reverse) for start, end in chunks]))
+
+    # heapq.merge breaks ties by run order, which keeps the sort stable
+    return list(heapq.merge(*runs, key=key, reverse=reverse))
+
+
+def _parallel_sort_typed(elements, reverse, chunks):
+    """
+    Sorts numpy array chunks in shared memory through a process pool
+
+    Args:
+        elements (numpy.ndarray): elements to be sorted
+        reverse (bool): True if sorting descendingly
+        chunks (list): (start, end) of each chunk
+
+    Returns:
+        sorted numpy array
+    """
+    if reverse:
+        # sorting the reversed array acendingly and reversing back keeps equal elements in original order
+        elements = elements[::-1]
+
+    if len(chunks) <= 1:
+        result = np.sort(elements, kind='stable')
+        return result[::-1] if reverse else result
+
+    size = len(elements)
+    memory = shared_memory.SharedMemory(create=True, size=max(elements.nbytes, 1))
+    try:
+        shared = np.ndarray((size,), dtype=elements.dtype, buffer=memory.buf)
+        shared[:] = elements
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            list(executor.map(_sort_shared_chunk, [
+                (memory.name, elements.dtype.str, size, start, end) for start, end in chunks]))
+        runs = [shared[start:end].copy() for start, end in chunks]
+        del shared
+    finally:
+        memory.close()
+        memory.unlink()
+
+    while len(runs) > 1:
+        runs = [merge_sorted_arrays(runs[i], runs[i + 1]) if i + 1 < len(runs) else runs[i]
+                for i in range(0, len(runs), 2)]
+    result = runs[0]
+
+    return result[::-1] if reverse else result
+
+
+def merge_sorted_arrays(left, right):
+    """
+    Merges two acending numpy arrays, elements of left go first among equal ones
+
+    Args:
+        left (numpy.ndarray): acending array
+        right (numpy.ndarray): acending array
+
+    Returns:
+        merged acending array
+    """
+    result = np.empty(len(left) + len(right), dtype=np.result_type(left, right))
+    # each element lands on its own index plus the number of elements from the other run before it
+    result[np.arange(len(left)) + np.searchsorted(right, left, side='left')] = left
+    result[np.arange(len(right)) + np.searchsorted(left, right, side='right')] = right
+
+    return result
@@ -0,0 +1,162 @@
+from data_structure import Stack, Vector
+
+
+class PersistentStack(object):
+
+    def __init__(self, initial_iter=None):
+        """
+        Constructor
+
+        An immutable stack of linked (element, tail) cells: push and pop
+        return new versions in O(1) that share every cell below the top, so
+        branching off a version never copies it
+
+        Args:
+            initial_iter (iterable): initial elements, the last one ending on top
+        """
+        # (element, tail cell) of the top, None if empty
+        self._cell = None
+        self._size = 0
+
+        if initial_iter is not None:
+            if isinstance(initial_iter, Vector):
+                initial_iter = initial_iter.get(0, initial_iter.size()) if initial_iter.size() else []
+            for element in initial_iter:
+                self._cell = (element, self._cell)
+                self._size += 1
+
+    @classmethod
+    def _of(cls, cell, size):
+        """
+        Wraps a cell chain as a version without copying it
+        """
+        stack = cls()
+        stack._cell, stack._size = cell, size
+
+        return stack
+
+    def size(self):
+        """
+        Returns stack size
+        """
+        return self._size
+
+    def __len__(self):
+        """
+        Returns stack size
+        """
+        return self._size
+
+    def empty(self):
+        """
+        Returns if the stack is empty
+        """
+        return self._size == 0
+
+    def top(self):
+        """
+        Returns top element of the stack
+        """
+        if self._cell is None:
+            raise IndexError('top of empty stack')
+
+        return self._cell[0]
+
+    def push(self, element):
+        """
+        Pushes given element, in O(1)
+
+        Returns:
+            new version with the element on top
+        """
+        return self._of((element, self._cell), self._size + 1)
+
+    def pop(self):
+        """
+        Drops the top element, in O(1)
+
+        Returns:
+            new version sharing every cell below the top
+        """
+        if self._cell is None:
+            raise IndexError('pop from empty stack')
+
+        return self._of(self._cell[1], self._size - 1)
+
+    def push_many(self, iterable):
+        """
+        Pushes given elements in order, the last one ending on top
+
+        Returns:
+            new version
+        """
+        cell, size = self._cell, self._size
+        for element in iterable:
+            cell = (element, cell)
+            size += 1
+
+        return self._of(cell, size)
+
+    def pop_many(self, count):
+        """
+        Drops given number of elements from the top, in O(count)
+
+        Returns:
+            new version
+        """
+        if not 0 <= count <= self._size:
+            raise IndexError('not enough elements to pop')
+
+        cell = self._cell
+        for _ in range(count):
+            cell = cell[1]
+
+        return self._of(cell, self._size - count)
+
+    def __iter__(self):
+        """
+        Iterates over elements from the top down
+        """
+        cell = self._cell
+        while cell is not None:
+            yield cell[0]
+            cell = cell[1]
+
+    def __str__(self):
+        """
+        Overloads print statement, bottom first as a stack prints
+        """
+        return '[{}]'.format(','.join(str(e) for e in self.to_list()))
+
+    def to_list(self):
+        """
+        Returns elements bottom first
+        """
+        elements = list(self)
+        elements.reverse()
+
+        return elements
+
+    def to_stack(self, **kwargs):
+        """
+        Copies the version into a Stack, in O(n)
+
+        Args:
+            kwargs: passed to the Stack constructor, e.g. dtype or track_min
+
+        Returns:
+            Stack with the same top
+        """
+        stack = Stack(**kwargs)
+        stack.push_many(self.to_list())
+
+        return stack
+
+    def to_vector(self, **kwargs):
+        """
+        Copies the version into a Vector bottom first, in O(n)
+
+        Args:
+            kwargs: passed to the Vector constructor, e.g. dtype
+        """
+        return Vector(initial_iter=self.to_list(), **kwargs)
@@ -1,4 +1,21 @@
+import functools
+
+import numpy as np
+
 from data_structure import Vector
+from data_structure.vector import override_methods
+
+# vector operations reading the buffer by index, which run on a linearized buffer;
+# _order_counts backs the order properties, _buffer backs views and _resize is reached by shrinking
+LINEARIZED_METHODS = (
+    '__str__', '__array__', '__contains__', '__add__', '__radd__', '__iadd__', '__sub__', '__rsub__', '__isub__',
+    '__mul__', '__rmul__', '__imul__', '__truediv__', '__rtruediv__', '__itruediv__', '__lt__', '__le__', '__gt__',
+    '__ge__', '_buffer', '_order_counts', '_resize', 'compare_with_iterable', 'append', 'take', 'put_many',
+    'equal', 'not_equal', 'dot', 'sum', 'min', 'max', 'argmin', 'argmax', 'mean', 'reserve', 'shrink_to_fit',
+    'unsorted', 'build_index', 'find', 'count', 'search', 'binary_search_acending', 'binary_search_descending',
+    'search_many', 'insert', 'insert_many', 'extend', 'partial_permute', 'permute', 'partial_remove',
+    'remove_range', 'remove', 'deduplicate', 'filter', 'bubblesort', 'sort', 'parallel_sort', 'mergesort', 'merge',
+    'nth_element', 'select', 'top_k')
 
 
 class Queue(Vector):
@@ -7,38 +24,244 @@ class Queue(Vector):
         """
         Constructor
 
+        The queue is kept as a circular buffer on top of the vector storage:
+        vector index i lives on slot (offset + i) % capacity, where index 0 is
+        the tail and index size - 1 is the head, so enqueue and dequeue only
+        move the offset instead of shifting elements
+
         Args:
             same as vector
-            
+
             default_capacity (int): default initial fixed size
             default_element (object): default element in vector
             initial_iter (iterable): initial elements to initialize vector
         """
+        self._offset = 0
         super(Queue, self).__init__(*args, **kwargs)
 
+    def _slot(self, i):
+        """
+        Maps vector index to slot in the circular buffer
+
+        Args:
+            i (int): index
+        """
+        return (self._offset + i) % self._capacity
+
+    def _normalize(self, index):
+        """
+        Maps negative index from the head end and checks it's within size, as slots wrap around
+
+        Args:
+            index (int): index, negative counting back from size
+
+        Returns:
+            index in [0, size)
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('index out of range')
+
+        return index
+
+    def _linearize(self):
+        """
+        Rotates the circular buffer so that vector index i lives on slot i
+        """
+        if self._offset == 0:
+            return
+
+        elements = self._elements
+        if self._dtype is not None:
+            self._elements = np.concatenate((elements[self._offset:], elements[:self._offset]))
+        else:
+            self._elements = elements[self._offset:] + elements[:self._offset]
+        self._offset = 0
+
+    def __getitem__(self, index):
+        """
+        Overloads item indexing
+
+        Args:
+            i (int): index
+
+        Returns:
+            data saved in the i-th element in queue
+        """
+        if isinstance(index, slice):
+            self._linearize()
+            return self._elements[index]
+
+        return self._elements[self._slot(self._normalize(index))]
+
+    def __setitem__(self, index, value):
+        """
+        Overloads item indexing
+
+        Args:
+            i (int): index
+            value (object): data to be saved in the i-th element in queue
+        """
+        if isinstance(index, slice):
+            self._preserve(0, self._size)
+            self._linearize()
+            self._elements[index] = value
+        else:
+            index = self._normalize(index)
+            self._preserve(index, index + 1)
+            self._elements[self._slot(index)] = value
+        self._descents, self._ascents = None, None
+
+    def copy_from(self, iter, dedup=None):
+        """
+        Copies content from given iterable
+
+        Args:
+            iter (iterable): iterable object from which contents are copied and put into queue, the last element being the head
+            dedup (str): mode of dedup.unique dropping repeated elements on the way in, 'exact', 'approximate' or 'sorted', all kept if None
+        """
+        # snapshots read the old elements through the offset before it's reset
+        self._preserve(0, self._size)
+        self._offset = 0
+        super(Queue, self).copy_from(iter, dedup)
+
+    def get(self, i, j=None):
+        """
+        Gets element of index [i, j)
+
+        Args:
+            i, j (int): index
+        """
+        if j is None:
+            if 0 <= i < self._size:
+                return self._elements[self._slot(i)]
+            else:
+                raise IndexError('index out of range')
+
+        self._linearize()
+        return super(Queue, self).get(i, j)
+
+    def put(self, i, element):
+        """
+        Updates element of index i
+
+        Args:
+            i (int): index
+            element (object): the given element to be updated on index i
+        """
+        if 0 <= i < self._size:
+            self._preserve(i, i + 1)
+            self._elements[self._slot(i)] = element
+            self._descents, self._ascents = None, None
+        else:
+            raise IndexError('index out of range')
+
+    def expand(self):
+        """
+        Grows the fixed space by growth factor if necessary
+        """
+        if self._size == self._capacity:
+            # unwrap before growing, amortized O(1) as capacity grows geometrically
+            self._linearize()
+            super(Queue, self).expand()
+
     def head(self):
         """
-        Returns the top element of the queue        
+        Returns the top element of the queue
         """
-        return self.get(i = self._size - 1)
+        if self._size <= 0:
+            raise IndexError('index out of range')
+
+        return self._elements[self._slot(self._size - 1)]
 
     def tail(self):
         """
-        Returns the element on the tail of the queue        
+        Returns the element on the tail of the queue
         """
-        return self.get(i = 0)
+        if self._size <= 0:
+            raise IndexError('index out of range')
+
+        return self._elements[self._offset]
 
     def enqueue(self, element):
         """
-        Adds given element to the tail of queue 
+        Adds given element to the tail of queue
         """
-        self.insert(0, element)
+        # every element moves up by one index
+        self._preserve(0, self._size)
+        self.expand()
+        self._offset = (self._offset - 1) % self._capacity
+        self._elements[self._offset] = element
+        self._size += 1
+        # order is recounted lazily if a search needs it
+        self._descents, self._ascents = None, None
 
     def dequeue(self):
         """
-        Pops the element at the head of the queue        
+        Pops the element at the head of the queue
         """
-        top = self.head()
-        self.remove(self._size - 1)
+        if self._size <= 0:
+            raise IndexError('index out of range')
+
+        self._preserve(self._size - 1, self._size)
+        slot = self._slot(self._size - 1)
+        top = self._elements[slot]
+        # release the reference held by the buffer
+        self._elements[slot] = self._default_element
+        self._size -= 1
+        self._descents, self._ascents = None, None
+        self._shrink_if_sparse()
+
+        return top
+
+    def dequeue_many(self, count):
+        """
+        Pops given number of elements at the head of the queue, copying at most two blocks of slots
+
+        Args:
+            count (int): number of elements
+
+        Returns:
+            list of elements in dequeuing order, the head first, or numpy array if the queue is typed
+        """
+        if not 0 <= count <= self._size:
+            raise IndexError('index out of range')
+
+        start = self._size - count
+        self._preserve(start, self._size)
+        first = self._slot(start) if count else 0
+        end = first + count
+        if end <= self._capacity:
+            block = self._elements[first:end]
+            if self._dtype is not None:
+                block = block.copy()
+            self._elements[first:end] = self._allocate(count)
+        else:
+            wrapped = end - self._capacity
+            if self._dtype is not None:
+                block = np.concatenate((self._elements[first:], self._elements[:wrapped]))
+            else:
+                block = self._elements[first:] + self._elements[:wrapped]
+            self._elements[first:] = self._allocate(self._capacity - first)
+            self._elements[:wrapped] = self._allocate(wrapped)
+        self._size = start
+        self._descents, self._ascents = None, None
+        self._shrink_if_sparse()
+
+        return block[::-1]
+
+
+def _linearized(method):
+    """
+    Wraps vector method so that it runs on a linearized circular buffer
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._linearize()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
 
-        return top
\ No newline at end of file
+override_methods(Queue, LINEARIZED_METHODS, _linearized)
@@ -0,0 +1,123 @@
+import heapq
+import pickle
+from itertools import chain, islice
+
+import numpy as np
+
+
+def write_run(path, blocks, dtype):
+    """
+    Writes blocks of sorted elements to a run file, raw values if typed, pickled blocks otherwise
+
+    Args:
+        path (str): file path
+        blocks (iterable): lists or numpy arrays
+        dtype (numpy.dtype): element dtype, None for python objects
+    """
+    with open(path, 'wb') as file:
+        for block in blocks:
+            if dtype is not None:
+                np.asarray(block, dtype=dtype).tofile(file)
+            elif len(block):
+                pickle.dump(list(block), file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def read_run(path, dtype=None, block_size=1 << 16):
+    """
+    Reads a run file written by the external sort block by block
+
+    Args:
+        path (str): file path
+        dtype (numpy.dtype): element dtype, None for python objects
+        block_size (int): number of typed elements per block, python object blocks keep their written size
+
+    Returns:
+        generator of lists, or numpy arrays if typed
+    """
+    with open(path, 'rb') as file:
+        while True:
+            if dtype is not None:
+                block = np.fromfile(file, dtype=dtype, count=block_size)
+                if len(block) == 0:
+                    return
+            else:
+                try:
+                    block = pickle.load(file)
+                except EOFError:
+                    return
+            yield block
+
+
+def blocks(elements, block_size):
+    """
+    Splits a sequence into blocks of given size
+    """
+    for low in range(0, len(elements), block_size):
+        yield elements[low:low + block_size]
+
+
+def merge_object_runs(paths, key, reverse, block_size):
+    """
+    Merges python object runs through a heap of their heads, stable
+
+    Returns:
+        generator of merged blocks
+    """
+    runs = [chain.from_iterable(read_run(path)) for path in paths]
+    # heapq.merge breaks ties by run order, which keeps the sort stable
+    merged = heapq.merge(*runs, key=key, reverse=reverse)
+    while True:
+        block = list(islice(merged, block_size))
+        if not block:
+            return
+        yield block
+
+
+def merge_typed_runs(paths, dtype, reverse, block_size):
+    """
+    Merges typed runs block by block, stable
+
+    The run whose buffered block ends first bounds what is safe to emit:
+    every buffered element before that bound is merged at once through a
+    vectorized stable sort of the concatenated buffers, as going element by
+    element through a heap would cost more than the disk
+
+    Returns:
+        generator of merged numpy arrays
+    """
+    files = [open(path, 'rb') for path in paths]
+    try:
+        buffers = [np.fromfile(file, dtype=dtype, count=block_size) for file in files]
+        while True:
+            live = [k for k in range(len(buffers)) if len(buffers[k])]
+            if not live:
+                return
+
+            lasts = np.array([buffers[k][-1] for k in live])
+            # the first of the runs ending earliest, its equal elements go before those of later runs
+            bound_run = live[int(np.argmax(lasts) if reverse else np.argmin(lasts))]
+            bound = buffers[bound_run][-1]
+
+            parts = []
+            for k in live:
+                buffer = buffers[k]
+                # elements equal to the bound are safe only from runs up to the bound run
+                inclusive = k <= bound_run
+                if reverse:
+                    count = len(buffer) - int(np.searchsorted(buffer[::-1], bound, side='left' if inclusive else 'right'))
+                else:
+                    count = int(np.searchsorted(buffer, bound, side='right' if inclusive else 'left'))
+                parts.append(buffer[:count])
+                buffers[k] = buffer[count:]
+                if len(buffers[k]) == 0:
+                    buffers[k] = np.fromfile(files[k], dtype=dtype, count=block_size)
+
+            merged = np.concatenate(parts)
+            # reversing around a stable sort keeps equal elements in run order
+            if reverse:
+                yield np.sort(merged[::-1], kind='stable')[::-1]
+            else:
+                yield np.sort(merged, kind='stable')
+    finally:
+        for file in files:
+            file.close()
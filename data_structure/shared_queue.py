@@ -0,0 +1,384 @@
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+from queue import Empty, Full
+
+import numpy as np
+
+DEFAULT_CAPACITY = 1024
+# puts and gets counters sit on cache lines of their own, so producer and consumer don't write to the same one
+COUNTER_STRIDE = 64
+HEADER_SIZE = 128
+# a waiting side yields the cpu this many times before it starts sleeping
+SPINS = 100
+POLL_INTERVAL = 1e-4
+
+
+def _deadline(timeout):
+    """
+    Turns a timeout in seconds into a point of time.monotonic(), None if waiting forever
+    """
+    return None if timeout is None else time.monotonic() + timeout
+
+
+def _remaining(deadline):
+    """
+    Returns seconds left before deadline, None if waiting forever
+    """
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+class SharedQueue(object):
+
+    def __init__(self, dtype, capacity=DEFAULT_CAPACITY, multi_producer=False, multi_consumer=False):
+        """
+        Constructor
+
+        A bounded FIFO ring buffer of fixed-size typed records in shared
+        memory, so records cross processes without being pickled. The header
+        holds the numbers of puts and gets so far, each written only by its
+        own side: with one producer and one consumer no lock is taken, and a
+        record is written before the puts counter publishes it. Several
+        producers / consumers share a process lock per side. Waiting sides
+        poll, as no condition variable reaches across processes.
+
+        The queue is handed to other processes as an argument of
+        multiprocessing.Process, which attaches them to the same memory
+
+        Args:
+            dtype (str or numpy.dtype): numpy dtype of records, e.g. 'f8' or [('id', 'i8'), ('value', 'f8')]
+            capacity (int): maximum number of records, puts block beyond it
+            multi_producer (bool): True if several processes put
+            multi_consumer (bool): True if several processes get
+        """
+        if capacity < 1:
+            raise ValueError('capacity must be positive')
+
+        dtype = np.dtype(dtype)
+        if dtype.hasobject:
+            raise ValueError('shared queue requires a numeric dtype')
+
+        self._dtype = dtype
+        self._capacity = capacity
+        self._memory = shared_memory.SharedMemory(create=True, size=HEADER_SIZE + capacity * dtype.itemsize)
+        self._owner = True
+        self._put_lock = multiprocessing.Lock() if multi_producer else None
+        self._get_lock = multiprocessing.Lock() if multi_consumer else None
+        self._map()
+        self._counters[:] = 0
+
+    def _map(self):
+        """
+        Builds arrays on the counters and the records of the shared memory
+        """
+        buf = self._memory.buf
+        # counters[0] is the number of puts, counters[1] the number of gets
+        self._counters = np.ndarray((2,), dtype=np.int64, buffer=buf, strides=(COUNTER_STRIDE,))
+        self._records = np.ndarray((self._capacity,), dtype=self._dtype, buffer=buf, offset=HEADER_SIZE)
+        # number of records handed out by acquire and not released yet, None if none are
+        self._acquired = None
+
+    def __getstate__(self):
+        """
+        Pickles the queue as the name of its memory, for another process to attach to
+        """
+        return self._memory.name, self._dtype, self._capacity, self._put_lock, self._get_lock
+
+    def __setstate__(self, state):
+        """
+        Attaches to the memory of a queue created by another process
+        """
+        name, self._dtype, self._capacity, self._put_lock, self._get_lock = state
+        self._memory = shared_memory.SharedMemory(name=name)
+        self._owner = False
+        self._map()
+
+    def name(self):
+        """
+        Returns name of the shared memory
+        """
+        return self._memory.name
+
+    def dtype(self):
+        """
+        Returns numpy dtype of records
+        """
+        return self._dtype
+
+    def size(self):
+        """
+        Returns number of records, a snapshot as other processes go on
+        """
+        return int(self._counters[0] - self._counters[1])
+
+    def __len__(self):
+        """
+        Returns number of records
+        """
+        return self.size()
+
+    def empty(self):
+        """
+        Returns if the queue is empty
+        """
+        return self.size() == 0
+
+    def full(self):
+        """
+        Returns if the queue is full
+        """
+        return self.size() >= self._capacity
+
+    def capacity(self):
+        """
+        Returns maximum number of records
+        """
+        return self._capacity
+
+    def _wait_for(self, predicate, deadline):
+        """
+        Polls predicate until it holds, yielding the cpu first and sleeping later
+
+        Args:
+            predicate (callable): condition waited for
+            deadline (float): time.monotonic() to give up at, never if None
+
+        Returns:
+            True if predicate holds, False on timeout
+        """
+        spins = 0
+        while not predicate():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            if spins < SPINS:
+                spins += 1
+                time.sleep(0)
+            else:
+                time.sleep(POLL_INTERVAL)
+
+        return True
+
+    def _wait_for_room(self, count, deadline):
+        """
+        Waits until count records fit, on the producer side
+        """
+        counters, capacity = self._counters, self._capacity
+        return self._wait_for(lambda: counters[0] - counters[1] + count <= capacity, deadline)
+
+    def _wait_for_records(self, deadline):
+        """
+        Waits until a record is there, on the consumer side
+        """
+        counters = self._counters
+        return self._wait_for(lambda: counters[0] > counters[1], deadline)
+
+    def put(self, record, timeout=None):
+        """
+        Adds record to the tail, blocking while the queue is full
+
+        Args:
+            record (object): record, e.g. number or tuple of fields
+            timeout (float): seconds to wait at most, forever if None, not at all if 0
+
+        Raises:
+            queue.Full if still full after timeout
+        """
+        deadline = _deadline(timeout)
+        if self._put_lock is not None and not self._put_lock.acquire(True, _remaining(deadline)):
+            raise Full('queue is full')
+        try:
+            if not self._wait_for_room(1, deadline):
+                raise Full('queue is full')
+            puts = int(self._counters[0])
+            self._records[puts % self._capacity] = record
+            # the record is written before the consumer sees the counter move
+            self._counters[0] = puts + 1
+        finally:
+            if self._put_lock is not None:
+                self._put_lock.release()
+
+    def put_many(self, records, timeout=None):
+        """
+        Adds records to the tail at once, blocking until they all fit, copying at most two blocks
+
+        Args:
+            records (iterable): records, at most capacity of them
+            timeout (float): seconds to wait at most, forever if None, not at all if 0
+
+        Raises:
+            queue.Full if they still don't fit after timeout, none of them added
+        """
+        records = np.asarray(records, dtype=self._dtype)
+        count = len(records)
+        if count > self._capacity:
+            raise ValueError('more records than capacity')
+        if count == 0:
+            return
+
+        deadline = _deadline(timeout)
+        if self._put_lock is not None and not self._put_lock.acquire(True, _remaining(deadline)):
+            raise Full('queue is full')
+        try:
+            if not self._wait_for_room(count, deadline):
+                raise Full('queue is full')
+            puts = int(self._counters[0])
+            first = puts % self._capacity
+            split = min(count, self._capacity - first)
+            self._records[first:first + split] = records[:split]
+            self._records[:count - split] = records[split:]
+            self._counters[0] = puts + count
+        finally:
+            if self._put_lock is not None:
+                self._put_lock.release()
+
+    def _check_not_acquired(self):
+        """
+        Raises RuntimeError if records handed out by acquire are not released yet
+        """
+        if self._acquired is not None:
+            raise RuntimeError('acquired records must be released first')
+
+    def get(self, timeout=None):
+        """
+        Removes the record at the head, blocking while the queue is empty
+
+        Args:
+            timeout (float): seconds to wait at most, forever if None, not at all if 0
+
+        Returns:
+            copy of the record, numpy scalar
+
+        Raises:
+            queue.Empty if still empty after timeout
+        """
+        self._check_not_acquired()
+        deadline = _deadline(timeout)
+        if self._get_lock is not None and not self._get_lock.acquire(True, _remaining(deadline)):
+            raise Empty('queue is empty')
+        try:
+            if not self._wait_for_records(deadline):
+                raise Empty('queue is empty')
+            gets = int(self._counters[1])
+            # copied before the slot is handed back to the producer
+            record = self._records[gets % self._capacity].copy()
+            self._counters[1] = gets + 1
+        finally:
+            if self._get_lock is not None:
+                self._get_lock.release()
+
+        return record
+
+    def get_many(self, max_items=None, timeout=None):
+        """
+        Removes the records available at the head at once, blocking while the queue is empty
+
+        Args:
+            max_items (int): maximum number of records, all available ones if None
+            timeout (float): seconds to wait at most, forever if None, not at all if 0
+
+        Returns:
+            numpy array of at least one record in FIFO order
+
+        Raises:
+            queue.Empty if still empty after timeout
+        """
+        self._check_not_acquired()
+        deadline = _deadline(timeout)
+        if self._get_lock is not None and not self._get_lock.acquire(True, _remaining(deadline)):
+            raise Empty('queue is empty')
+        try:
+            if not self._wait_for_records(deadline):
+                raise Empty('queue is empty')
+            puts, gets = int(self._counters[0]), int(self._counters[1])
+            count = puts - gets if max_items is None else min(puts - gets, max_items)
+            first = gets % self._capacity
+            split = min(count, self._capacity - first)
+            records = np.empty(count, dtype=self._dtype)
+            records[:split] = self._records[first:first + split]
+            records[split:] = self._records[:count - split]
+            self._counters[1] = gets + count
+        finally:
+            if self._get_lock is not None:
+                self._get_lock.release()
+
+        return records
+
+    def acquire(self, max_items=None, timeout=None):
+        """
+        Hands out records at the head without copying them, blocking while the queue is empty
+
+        The records stay in the queue until release(); as a view can't wrap
+        around the ring, it ends on the last slot at most. Several consumers
+        are kept out until release()
+
+        Args:
+            max_items (int): maximum number of records, all contiguous available ones if None
+            timeout (float): seconds to wait at most, forever if None, not at all if 0
+
+        Returns:
+            memoryview over at least one record in FIFO order, valid until release()
+
+        Raises:
+            queue.Empty if still empty after timeout
+        """
+        self._check_not_acquired()
+        deadline = _deadline(timeout)
+        if self._get_lock is not None and not self._get_lock.acquire(True, _remaining(deadline)):
+            raise Empty('queue is empty')
+        if not self._wait_for_records(deadline):
+            if self._get_lock is not None:
+                self._get_lock.release()
+            raise Empty('queue is empty')
+
+        puts, gets = int(self._counters[0]), int(self._counters[1])
+        first = gets % self._capacity
+        count = min(puts - gets, self._capacity - first)
+        if max_items is not None:
+            count = min(count, max_items)
+        self._acquired = count
+
+        return memoryview(self._records[first:first + count])
+
+    def release(self, count=None):
+        """
+        Removes records handed out by acquire, handing their slots back to producers
+
+        Args:
+            count (int): number of records consumed, the rest stay at the head, all if None
+        """
+        if self._acquired is None:
+            raise RuntimeError('release() called without acquire()')
+        if count is None:
+            count = self._acquired
+        elif not 0 <= count <= self._acquired:
+            raise ValueError('more records released than acquired')
+
+        self._counters[1] += count
+        self._acquired = None
+        if self._get_lock is not None:
+            self._get_lock.release()
+
+    def close(self):
+        """
+        Detaches this process from the shared memory
+        """
+        self._counters, self._records = None, None
+        try:
+            self._memory.close()
+        except BufferError:
+            # memoryviews handed out still reference the memory, it's unmapped once they are gone
+            pass
+
+    def unlink(self):
+        """
+        Frees the shared memory once every process has closed it, by the process that created it
+        """
+        if self._owner:
+            self._memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        self.unlink()
@@ -0,0 +1,315 @@
+from bisect import bisect_left, bisect_right
+from itertools import islice
+
+import numpy as np
+
+from data_structure import Vector
+from data_structure.parallel_sort import merge_sorted_arrays
+from data_structure.sorting import merge_runs, merge_sort
+
+
+class SortedVector(Vector):
+
+    def __init__(self, *args, **kwargs):
+        """
+        Constructor
+
+        Elements are always kept acending, so lookups are binary searches and
+        never check sortedness
+
+        Args:
+            same as vector
+
+            default_capacity (int): default initial fixed size
+            default_element (object): default element in vector
+            initial_iter (iterable): initial elements to initialize vector, sorted on copying through extend
+        """
+        super(SortedVector, self).__init__(*args, **kwargs)
+
+    def _bisect(self, element, right=False):
+        """
+        Finds the index where element would be inserted to keep order
+
+        Args:
+            element (object): given element
+            right (bool): True if going after equal elements, False if before them
+        """
+        if self._dtype is not None:
+            return int(np.searchsorted(self._elements[:self._size], element, side='right' if right else 'left'))
+
+        return (bisect_right if right else bisect_left)(self._elements, element, 0, self._size)
+
+    def _check_order(self, i, j, first, last):
+        """
+        Raises ValueError unless elements from first to last fit between vector[i - 1] and vector[j]
+
+        Args:
+            i, j (int): index of the neighbouring elements
+            first, last (object): first and last element to be placed in between
+        """
+        if (i > 0 and first < self._elements[i - 1]) or (j < self._size and self._elements[j] < last):
+            raise ValueError('element breaks the order of sorted vector')
+
+    def add(self, element):
+        """
+        Inserts element after equal ones through binary search, moving the tail as one block
+
+        Args:
+            element (object): given element
+
+        Returns:
+            index where the element is inserted
+        """
+        i = self._bisect(element, right=True)
+        super(SortedVector, self).insert(i, element)
+
+        return i
+
+    def append(self, element):
+        """
+        Appends given element, which must be no less than the last element
+        """
+        self._check_order(self._size, self._size, element, element)
+        super(SortedVector, self).append(element)
+
+    def put(self, i, element):
+        """
+        Updates element of index i, which must keep the order
+
+        Args:
+            i (int): index
+            element (object): the given element to be updated on index i
+        """
+        if 0 <= i < self._size:
+            self._check_order(i, i + 1, element, element)
+        super(SortedVector, self).put(i, element)
+
+    def put_many(self, indices, values):
+        """
+        Updates elements of given indices, which must keep the order, restoring them otherwise
+
+        Args:
+            indices (iterable): index of each element
+            values (iterable): the given elements to be updated on the indices
+        """
+        indices = list(indices)
+        previous = self.take(indices)
+        super(SortedVector, self).put_many(indices, values)
+        for i in indices:
+            if (i > 0 and self._elements[i] < self._elements[i - 1]) or (
+                    i + 1 < self._size and self._elements[i + 1] < self._elements[i]):
+                super(SortedVector, self).put_many(indices[::-1], previous[::-1])
+                raise ValueError('element breaks the order of sorted vector')
+
+    def _inplace(self, ufunc, other):
+        """
+        Applies numpy ufunc in place, which must keep the order, restoring the elements otherwise
+        """
+        previous = self._elements[:self._size].copy() if self._dtype is not None else None
+        super(SortedVector, self)._inplace(ufunc, other)
+        values = self._elements[:self._size]
+        if np.any(values[1:] < values[:-1]):
+            values[:] = previous
+            self._descents, self._ascents = self._count_order(1, self._size)
+            raise ValueError('elementwise operation breaks the order of sorted vector')
+        self._descents, self._ascents = self._count_order(1, self._size)
+
+        return self
+
+    def __setitem__(self, index, value):
+        """
+        Overloads item indexing, only allowed when it keeps the order
+        """
+        if isinstance(index, slice):
+            raise ValueError('sorted vector does not support slice assignment')
+        self.put(index, value)
+
+    def insert(self, i, element):
+        """
+        Inserts element on given index, which must keep the order
+
+        Args:
+            i (int): index
+            element (object): given element to be inserted into vector
+        """
+        if 0 <= i <= self._size:
+            self._check_order(i, i, element, element)
+        super(SortedVector, self).insert(i, element)
+
+    def insert_many(self, i, iterable):
+        """
+        Inserts acending elements on given index, which must keep the order
+
+        Args:
+            i (int): index
+            iterable (iterable): given acending elements to be inserted into vector
+        """
+        values = list(iterable)
+        if not values:
+            return
+
+        if any(values[k] < values[k - 1] for k in range(1, len(values))):
+            raise ValueError('elements to be inserted are not acending')
+        if 0 <= i <= self._size:
+            self._check_order(i, i, values[0], values[-1])
+        super(SortedVector, self).insert_many(i, values)
+
+    def extend(self, iterable):
+        """
+        Adds given elements, keeping the order
+
+        Args:
+            iterable (iterable): given elements
+        """
+        self.merge_sorted(iterable)
+
+    def merge_sorted(self, other):
+        """
+        Merges elements of another vector or iterable in O(n + m) if they are acending, sorting them first otherwise
+
+        Args:
+            other (iterable): elements to be merged
+        """
+        if isinstance(other, Vector):
+            values = other.get(0, other.size()) if other.size() else []
+        else:
+            values = other
+        values = list(values) if self._dtype is None else np.asarray(values, dtype=self._dtype)
+        if len(values) == 0:
+            return
+
+        if self._dtype is not None:
+            values = np.sort(values, kind='stable')
+        elif any(values[k] < values[k - 1] for k in range(1, len(values))):
+            merge_sort(values)
+
+        size = self._size
+        super(SortedVector, self).insert_many(size, values)
+        self._preserve(0, self._size)
+        self._track_order(0, self._size + 1, -1)
+        if self._dtype is not None:
+            self._elements[:self._size] = merge_sorted_arrays(self._elements[:size], values)
+        else:
+            merge_runs(self._elements, None, 0, size, self._size)
+        self._track_order(0, self._size + 1, 1)
+
+    def partial_permute(self, start, end):
+        """
+        Sorted vector can't be permuted
+        """
+        raise ValueError('sorted vector can not be permuted')
+
+    def sort(self, low=None, high=None, key=None, reverse=False):
+        """
+        Sorted vector is already acending, other orders are not allowed
+        """
+        if key is not None or reverse:
+            raise ValueError('sorted vector only keeps acending order')
+
+    def bubblesort(self, start=None, end=None, acending=True):
+        """
+        Sorted vector is already acending, other orders are not allowed
+        """
+        self.sort(reverse=not acending)
+
+    def parallel_sort(self, low=None, high=None, key=None, reverse=False, workers=None):
+        """
+        Sorted vector is already acending, other orders are not allowed
+        """
+        self.sort(key=key, reverse=reverse)
+
+    def nth_element(self, k, low=None, high=None):
+        """
+        Sorted vector already has every element on its place
+        """
+        self.select(k, low, high)
+
+    def select(self, k, low=None, high=None):
+        """
+        Gets the element on index k, in O(1)
+
+        Args:
+            k (int): index in [low, high)
+            low (int): starting index
+            high (int): ending index
+        """
+        if low is None or high is None:
+            low, high = 0, self._size
+
+        if not (0 <= low <= high <= self._size and low <= k < high):
+            raise IndexError('index out of range')
+
+        return self._elements[k]
+
+    def lower_bound(self, element):
+        """
+        Returns the least index whose element is no less than given element
+        """
+        return self._bisect(element)
+
+    def upper_bound(self, element):
+        """
+        Returns the least index whose element is greater than given element
+        """
+        return self._bisect(element, right=True)
+
+    def count_range(self, low, high):
+        """
+        Counts elements in [low, high)
+
+        Args:
+            low (object): lower bound, inclusive
+            high (object): upper bound, exclusive
+        """
+        return max(self._bisect(high) - self._bisect(low), 0)
+
+    def irange(self, low=None, high=None):
+        """
+        Iterates over elements in [low, high)
+
+        Args:
+            low (object): lower bound, inclusive, no lower bound if None
+            high (object): upper bound, exclusive, no upper bound if None
+        """
+        start = 0 if low is None else self._bisect(low)
+        end = self._size if high is None else self._bisect(high)
+
+        return islice(self._elements, start, max(start, end))
+
+    def find(self, target):
+        """
+        Finds given target through binary search
+
+        Args:
+            target (object): target object to be found in vector
+
+        Returns:
+            result (int): least index of the target object found in vector, -1 if not found
+        """
+        i = self._bisect(target)
+
+        return i if i < self._size and self._elements[i] == target else -1
+
+    def search(self, target):
+        """
+        Finds given target through binary search, no need to check order
+
+        Args:
+            target (object): target object to be found in vector
+
+        Returns:
+            result (int): index of target object found in vector, -1 if not found
+        """
+        return self.find(target)
+
+    def count(self, target):
+        """
+        Counts elements equal to given target through binary search
+        """
+        return self._bisect(target, right=True) - self._bisect(target)
+
+    def __contains__(self, target):
+        """
+        Overloads membership test
+        """
+        return self.find(target) >= 0
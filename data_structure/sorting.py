@@ -0,0 +1,315 @@
+from bisect import bisect_left, bisect_right
+from itertools import chain
+
+import numpy as np
+
+# runs shorter than this are sorted by binary insertion before merging
+INSERTION_CUTOFF = 32
+# consecutive wins from one run before the merge switches to galloping
+MIN_GALLOP = 7
+# integers spanning up to this many values per element are counted directly
+COUNTING_RANGE_FACTOR = 4
+# bits of the digit each radix pass distributes on
+RADIX_BITS = 8
+# integers spanning more values than this are left to mergesort
+RADIX_RANGE_LIMIT = 1 << 32
+
+
+def insertion_sort(keys, items, low, high):
+    """
+    Sorts keys[low, high) acendingly through binary insertion, stable
+
+    Args:
+        keys (list): keys to be compared
+        items (list): elements moved along with keys, None if keys are the elements themselves
+        low (int): starting index
+        high (int): ending index
+    """
+    for i in range(low + 1, high):
+        key = keys[i]
+        if not key < keys[i - 1]:
+            continue
+
+        # bisect_right keeps equal keys in original order
+        position = bisect_right(keys, key, low, i - 1)
+
+        keys[position + 1:i + 1] = keys[position:i]
+        keys[position] = key
+        if items is not None:
+            item = items[i]
+            items[position + 1:i + 1] = items[position:i]
+            items[position] = item
+
+
+def merge_runs(keys, items, low, mid, high):
+    """
+    Merges the sorted keys[low, mid) and keys[mid, high) acendingly, stable
+
+    Elements already in place are skipped through binary search, and once a run
+    wins MIN_GALLOP times in a row the rest of its winning streak is located by
+    binary search and moved as one block
+
+    Args:
+        keys (list): keys to be compared
+        items (list): elements moved along with keys, None if keys are the elements themselves
+        low (int): starting index
+        mid (int): ending index of the left run
+        high (int): ending index
+    """
+    if low >= mid or mid >= high or not keys[mid] < keys[mid - 1]:
+        # runs are already in order
+        return
+
+    # left prefix not greater than the first right key stays where it is
+    low = bisect_right(keys, keys[mid], low, mid)
+    # right suffix not less than the last left key stays where it is
+    high = bisect_left(keys, keys[mid - 1], mid, high)
+
+    left_keys = keys[low:mid]
+    left_items = items[low:mid] if items is not None else None
+    left_size = mid - low
+
+    i, j, k = 0, mid, low
+    left_wins, right_wins = 0, 0
+    left_key, right_key = left_keys[0], keys[mid]
+    while True:
+        if right_key < left_key:
+            keys[k] = right_key
+            if items is not None:
+                items[k] = items[j]
+            j += 1
+            k += 1
+            right_wins += 1
+            left_wins = 0
+            if right_wins >= MIN_GALLOP and j < high:
+                end = bisect_left(keys, left_key, j, high)
+                keys[k:k + end - j] = keys[j:end]
+                if items is not None:
+                    items[k:k + end - j] = items[j:end]
+                k += end - j
+                j = end
+                right_wins = 0
+            if j == high:
+                break
+            right_key = keys[j]
+        else:
+            keys[k] = left_key
+            if items is not None:
+                items[k] = left_items[i]
+            i += 1
+            k += 1
+            left_wins += 1
+            right_wins = 0
+            if left_wins >= MIN_GALLOP and i < left_size:
+                end = bisect_right(left_keys, right_key, i, left_size)
+                keys[k:k + end - i] = left_keys[i:end]
+                if items is not None:
+                    items[k:k + end - i] = left_items[i:end]
+                k += end - i
+                i = end
+                left_wins = 0
+            if i == left_size:
+                break
+            left_key = left_keys[i]
+
+    # the rest of the right run is already in place
+    if i < left_size:
+        keys[k:k + left_size - i] = left_keys[i:]
+        if items is not None:
+            items[k:k + left_size - i] = left_items[i:]
+
+
+def merge_sort(elements, key=None, reverse=False):
+    """
+    Sorts the list in place through bottom-up mergesort, stable
+
+    Args:
+        elements (list): list to be sorted
+        key (callable): maps element to the key it's compared by, elements are compared directly if None
+        reverse (bool): True if sorting descendingly
+    """
+    size = len(elements)
+    if size < 2:
+        return
+
+    if reverse:
+        # sorting the reversed list acendingly and reversing back keeps equal elements in original order
+        elements.reverse()
+
+    if key is None:
+        keys, items = elements, None
+    else:
+        keys, items = [key(e) for e in elements], elements
+
+    for low in range(0, size, INSERTION_CUTOFF):
+        insertion_sort(keys, items, low, min(low + INSERTION_CUTOFF, size))
+
+    width = INSERTION_CUTOFF
+    while width < size:
+        for low in range(0, size - width, 2 * width):
+            merge_runs(keys, items, low, low + width, min(low + 2 * width, size))
+        width *= 2
+
+    if reverse:
+        elements.reverse()
+
+
+def _counting_range(size):
+    """
+    Returns the widest range of values counted directly for given number of elements
+    """
+    return COUNTING_RANGE_FACTOR * size + (1 << RADIX_BITS)
+
+
+def integer_sort(elements, reverse=False):
+    """
+    Sorts a list of ints in place through counting sort if their range is
+    small, or LSD radix sort on RADIX_BITS digits otherwise, stable
+
+    Equal ints are interchangeable, so both run in O(n + range) and
+    O(n * passes) without comparing elements
+
+    Args:
+        elements (list): list to be sorted
+        reverse (bool): True if sorting descendingly
+
+    Returns:
+        True if sorted, False if elements are not all ints or span more than RADIX_RANGE_LIMIT values, leaving them untouched
+    """
+    size = len(elements)
+    # bools and int subclasses may differ between equal values, leave them to mergesort
+    if size < 2 or any(type(e) is not int for e in elements):
+        return False
+
+    minimum, maximum = min(elements), max(elements)
+    span = maximum - minimum + 1
+    if span > RADIX_RANGE_LIMIT:
+        return False
+
+    if span <= _counting_range(size):
+        counts = [0] * span
+        for e in elements:
+            counts[e - minimum] += 1
+        values = range(minimum, maximum + 1)
+        if reverse:
+            values, counts = reversed(values), reversed(counts)
+        elements[:] = chain.from_iterable([value] * count for value, count in zip(values, counts) if count)
+        return True
+
+    mask = (1 << RADIX_BITS) - 1
+    keys = [e - minimum for e in elements]
+    for shift in range(0, (span - 1).bit_length(), RADIX_BITS):
+        buckets = [[] for _ in range(mask + 1)]
+        for k in keys:
+            buckets[(k >> shift) & mask].append(k)
+        keys = list(chain.from_iterable(buckets))
+    if reverse:
+        keys.reverse()
+    elements[:] = [k + minimum for k in keys]
+
+    return True
+
+
+def counting_sort_array(elements, reverse=False):
+    """
+    Sorts an integer numpy array through counting sort if its range is small
+
+    Args:
+        elements (numpy.ndarray): array to be sorted, not modified
+        reverse (bool): True if sorting descendingly
+
+    Returns:
+        sorted array, None if elements are not integers or span too many values
+    """
+    if elements.dtype.kind not in 'iu' or len(elements) < 2:
+        return None
+
+    minimum, maximum = int(elements.min()), int(elements.max())
+    if maximum - minimum + 1 > _counting_range(len(elements)):
+        return None
+
+    if elements.dtype.kind == 'u':
+        offsets = elements - elements.dtype.type(minimum)
+    else:
+        # narrow signed types overflow on the subtraction, whose result only fits int64
+        offsets = elements.astype(np.int64) - minimum
+    counts = np.bincount(offsets.astype(np.intp), minlength=maximum - minimum + 1)
+    result = np.repeat(np.arange(minimum, maximum + 1, dtype=elements.dtype), counts)
+
+    return result[::-1] if reverse else result
+
+
+def _median_of_three(elements, low, high):
+    """
+    Returns the median of the first, middle and last element of elements[low, high)
+    """
+    a, b, c = elements[low], elements[(low + high) >> 1], elements[high - 1]
+    if a < b:
+        return b if b < c else (c if a < c else a)
+
+    return a if a < c else (c if b < c else b)
+
+
+def _median_of_medians(elements, low, high):
+    """
+    Returns a pivot guaranteed to split elements[low, high) no worse than 30% / 70%
+    """
+    medians = []
+    for start in range(low, high, 5):
+        group = sorted(elements[start:min(start + 5, high)])
+        medians.append(group[(len(group) - 1) >> 1])
+
+    middle = (len(medians) - 1) >> 1
+    select_nth(medians, middle, 0, len(medians))
+
+    return medians[middle]
+
+
+def select_nth(elements, k, low, high):
+    """
+    Partially sorts elements[low, high) in place through introselect, so that
+    elements[k] is the one that would be there if the segment were sorted,
+    with no greater elements before it and no less elements after it
+
+    Quickselect with median-of-three pivots runs in expected O(n), and
+    switches to median-of-medians pivots after too many poor splits so that
+    the worst case stays O(n)
+
+    Args:
+        elements (list): list to be partitioned
+        k (int): index in [low, high)
+        low (int): starting index
+        high (int): ending index
+    """
+    if not low <= k < high:
+        raise IndexError('index out of range')
+
+    # each good split halves the segment, allow twice as many rounds as that
+    budget = 2 * max(high - low, 1).bit_length()
+    while high - low > 1:
+        if budget > 0:
+            pivot = _median_of_three(elements, low, high)
+            budget -= 1
+        else:
+            pivot = _median_of_medians(elements, low, high)
+
+        # three-way partition: [low, less) < pivot, [less, greater) == pivot, [greater, high) > pivot
+        less, i, greater = low, low, high
+        while i < greater:
+            element = elements[i]
+            if element < pivot:
+                elements[less], elements[i] = element, elements[less]
+                less += 1
+                i += 1
+            elif pivot < element:
+                greater -= 1
+                elements[greater], elements[i] = element, elements[greater]
+            else:
+                i += 1
+
+        if k < less:
+            high = less
+        elif k >= greater:
+            low = greater
+        else:
+            return
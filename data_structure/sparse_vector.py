@@ -0,0 +1,817 @@
+import functools
+import heapq
+import operator
+from bisect import bisect_left
+from itertools import repeat
+
+import numpy as np
+
+from data_structure import Vector
+from data_structure.vector import override_methods
+from data_structure.dedup import unique
+from data_structure.sorting import merge_sort
+
+DEFAULT_DENSITY_THRESHOLD = 0.1
+# below this size dense storage saves too little to switch to
+MIN_DENSE_SIZE = 64
+# vector operations without a sparse implementation, which run on dense storage
+DENSIFIED_METHODS = (
+    '__add__', '__radd__', '__iadd__', '__sub__', '__rsub__', '__isub__', '__mul__', '__rmul__', '__imul__',
+    '__truediv__', '__rtruediv__', '__itruediv__', '__lt__', '__le__', '__gt__', '__ge__', 'equal', 'not_equal',
+    'dot', 'expand', 'reserve', 'shrink_to_fit', 'build_index', 'binary_search_acending', 'binary_search_descending',
+    'partial_permute', 'permute', 'filter', 'merge')
+
+
+class SparseVector(Vector):
+
+    def __init__(self, *args, **kwargs):
+        """
+        Constructor
+
+        While few elements differ from default element, only those are saved
+        in a dict of index to element, and untouched slots read as default
+        element. The vector switches to dense storage once the ratio of saved
+        elements exceeds density threshold, if it has at least MIN_DENSE_SIZE
+        elements, and back to sparse storage after bulk updates or growing
+        appends leave it below half of the threshold
+
+        Args:
+            same as vector
+
+            default_capacity (int): default initial fixed size of dense storage
+            default_element (object): default element in vector
+            initial_iter (iterable): initial elements to initialize vector
+            density_threshold (float): ratio of non-default elements above which storage turns dense
+        """
+        self._density_threshold = kwargs.pop('density_threshold', DEFAULT_DENSITY_THRESHOLD)
+        self._entries = {}
+        self._sparse = True
+        super(SparseVector, self).__init__(*args, **kwargs)
+        if self._sparse:
+            self._elements, self._capacity = None, 0
+
+    def is_sparse(self):
+        """
+        Returns True if only non-default elements are saved
+        """
+        return self._sparse
+
+    def nonzero_count(self):
+        """
+        Returns number of elements differing from default element
+        """
+        if self._sparse:
+            return len(self._entries)
+
+        return self._size - self._count_default(0, self._size)
+
+    def _count_default(self, start, end):
+        """
+        Counts default elements in dense storage [start, end)
+        """
+        if self._dtype is not None:
+            return int(np.count_nonzero(self._elements[start:end] == self._default_element))
+
+        default = self._default_element
+        return sum(1 for i in range(start, end) if self._elements[i] == default)
+
+    def _densify(self):
+        """
+        Switches to dense storage
+        """
+        if not self._sparse:
+            return
+
+        capacity = max(self._default_capacity, 1)
+        while capacity < self._size:
+            capacity = max(capacity + 1, int(capacity * self._growth_factor))
+
+        self._capacity = capacity
+        self._elements = self._allocate(capacity)
+        for i, element in self._entries.items():
+            self._elements[i] = element
+        self._entries = {}
+        self._sparse = False
+        self._descents, self._ascents = None, None
+
+    def _sparsify(self):
+        """
+        Switches to sparse storage
+        """
+        if self._sparse:
+            return
+
+        default = self._default_element
+        if self._dtype is not None:
+            indices = np.flatnonzero(self._elements[:self._size] != default)
+            self._entries = dict(zip(indices.tolist(), self._elements[indices].tolist()))
+        else:
+            self._entries = {i: self._elements[i] for i in range(self._size) if self._elements[i] != default}
+        self._elements, self._capacity = None, 0
+        self._sparse = True
+        # sparse writes don't keep the index, it's rebuilt once lookups densify again
+        if self._index is not None:
+            self._index.invalidate()
+
+    def _check_density(self, recount=False):
+        """
+        Switches storage if density crossed the threshold
+
+        Args:
+            recount (bool): True if dense storage may go sparse, which costs a full scan
+        """
+        if self._sparse:
+            if self._size >= MIN_DENSE_SIZE and len(self._entries) > self._density_threshold * self._size:
+                self._densify()
+        elif recount and self.nonzero_count() < self._density_threshold / 2 * self._size:
+            self._sparsify()
+
+    def _runs(self):
+        """
+        Returns (index, element) in index order on sparse storage, each run of default elements as its first slot
+        """
+        default = self._default_element
+        runs = []
+        last = -1
+        for i in sorted(self._entries):
+            if i > last + 1:
+                runs.append((last + 1, default))
+            runs.append((i, self._entries[i]))
+            last = i
+        if last < self._size - 1:
+            runs.append((last + 1, default))
+
+        return runs
+
+    def _order_counts(self):
+        """
+        Returns (descents, ascents), counted over the saved elements in index order on sparse storage
+        """
+        if not self._sparse:
+            return super(SparseVector, self)._order_counts()
+
+        # runs of default elements add no pairs, so each run counts as one element
+        elements = [element for _, element in self._runs()]
+        try:
+            descents = sum(1 for k in range(1, len(elements)) if elements[k - 1] > elements[k])
+            ascents = sum(1 for k in range(1, len(elements)) if elements[k - 1] < elements[k])
+        except (TypeError, ValueError):
+            return None, None
+
+        return descents, ascents
+
+    def _set(self, i, element):
+        """
+        Saves element on index i of sparse storage
+        """
+        if element == self._default_element:
+            self._entries.pop(i, None)
+        else:
+            self._entries[i] = element
+
+    def __str__(self):
+        """
+        Overloads print statement
+        """
+        if not self._sparse:
+            return super(SparseVector, self).__str__()
+
+        return '[{}]'.format(','.join(str(self._entries.get(i, self._default_element)) for i in range(self._size)))
+
+    def __getitem__(self, index):
+        """
+        Overloads item indexing
+        """
+        if isinstance(index, slice):
+            if not self._sparse:
+                return super(SparseVector, self).__getitem__(index)
+            return [self._entries.get(i, self._default_element) for i in range(*index.indices(self._size))]
+
+        if not -self._size <= index < self._size:
+            raise IndexError('index out of range')
+
+        # dense storage would count negative index back from capacity
+        index %= self._size
+        if not self._sparse:
+            return super(SparseVector, self).__getitem__(index)
+
+        return self._entries.get(index, self._default_element)
+
+    def __setitem__(self, index, value):
+        """
+        Overloads item indexing
+        """
+        if isinstance(index, slice):
+            self._densify()
+            super(SparseVector, self).__setitem__(index, value)
+            return
+
+        if not -self._size <= index < self._size:
+            raise IndexError('index out of range')
+
+        index %= self._size
+        if not self._sparse:
+            super(SparseVector, self).__setitem__(index, value)
+            return
+
+        self._preserve(index, index + 1)
+        self._set(index, value)
+        self._check_density()
+
+    def copy_from(self, iter, dedup=None):
+        """
+        Copies content from given iterable, starting sparse
+
+        Args:
+            iter (iterable): iterable object from which contents are copied and put into vector
+            dedup (str): mode of dedup.unique dropping repeated elements on the way in, 'exact', 'approximate' or 'sorted', all kept if None
+        """
+        if dedup is not None:
+            iter = unique(iter, dedup)
+        self._preserve(0, self._size)
+        self._entries = {}
+        self._sparse = True
+        self._elements, self._capacity = None, 0
+        self._size = 0
+        self._descents, self._ascents = None, None
+        self.extend(iter)
+        self._check_density(recount=True)
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Converts the vector for numpy, a new array on sparse storage
+        """
+        if not self._sparse:
+            return super(SparseVector, self).__array__(dtype, copy)
+
+        return np.array(self[:], dtype=self._dtype if dtype is None else dtype)
+
+    def compare_with_iterable(self, iter):
+        """
+        Compares each element in vector with given iterable
+        """
+        if not self._sparse:
+            return super(SparseVector, self).compare_with_iterable(iter)
+
+        return self._size == len(iter) and all(self.get(i) == e for i, e in enumerate(iter))
+
+    def append(self, element):
+        """
+        Appends given element
+        """
+        if not self._sparse:
+            grows = self._size == self._capacity
+            super(SparseVector, self).append(element)
+            if grows:
+                # a scan per growth is amortized O(1) per append
+                self._check_density(recount=True)
+            return
+
+        self._preserve(self._size, self._size + 1)
+        self._set(self._size, element)
+        self._size += 1
+        self._check_density()
+
+    def put(self, i, element):
+        """
+        Updates element of index i
+
+        Args:
+            i (int): index
+            element (object): the given element to be updated on index i
+        """
+        if not self._sparse:
+            return super(SparseVector, self).put(i, element)
+
+        if 0 <= i < self._size:
+            self._preserve(i, i + 1)
+            self._set(i, element)
+            self._check_density()
+        else:
+            raise IndexError('index out of range')
+
+    def get(self, i, j=None):
+        """
+        Gets element of index [i, j), untouched slots read as default element
+
+        Args:
+            i, j (int): index
+        """
+        if not self._sparse:
+            return super(SparseVector, self).get(i, j)
+
+        if j is None:
+            if 0 <= i < self._size:
+                return self._entries.get(i, self._default_element)
+            else:
+                raise IndexError('index out of range')
+
+        if 0 <= i < j <= self._size:
+            segment = [self._entries.get(k, self._default_element) for k in range(i, j)]
+            return segment if self._dtype is None else np.array(segment, dtype=self._dtype)
+        else:
+            raise IndexError('invalid index range')
+
+    def take(self, indices):
+        """
+        Gets elements of given indices, checking bounds once for the batch
+
+        Args:
+            indices (iterable): index of each element
+        """
+        if not self._sparse:
+            return super(SparseVector, self).take(indices)
+
+        indices = list(indices)
+        if indices and (min(indices) < 0 or max(indices) >= self._size):
+            raise IndexError('index out of range')
+        elements = [self._entries.get(i, self._default_element) for i in indices]
+
+        return elements if self._dtype is None else np.array(elements, dtype=self._dtype)
+
+    def put_many(self, indices, values):
+        """
+        Updates elements of given indices, checking bounds once for the batch
+
+        Args:
+            indices (iterable): index of each element, the last value wins for repeated indices
+            values (iterable): the given elements to be updated on the indices
+        """
+        if not self._sparse:
+            return super(SparseVector, self).put_many(indices, values)
+
+        indices, values = list(indices), list(values)
+        if len(indices) != len(values):
+            raise ValueError('numbers of indices and values differ')
+        if indices and (min(indices) < 0 or max(indices) >= self._size):
+            raise IndexError('index out of range')
+
+        self._preserve_indices(indices)
+        for i, value in zip(indices, values):
+            self._set(i, value)
+        self._check_density()
+
+    def insert(self, i, element):
+        """
+        Inserts element on given index, shifting saved indices in O(number of non-default elements)
+
+        Args:
+            i (int): index
+            element (object): given element to be inserted into vector
+        """
+        if not self._sparse:
+            return super(SparseVector, self).insert(i, element)
+
+        self.insert_many(i, [element])
+
+    def insert_many(self, i, iterable):
+        """
+        Inserts elements on given index, shifting saved indices once
+
+        Args:
+            i (int): index
+            iterable (iterable): given elements to be inserted into vector
+        """
+        if not self._sparse:
+            capacity = self._capacity
+            super(SparseVector, self).insert_many(i, iterable)
+            if self._capacity != capacity:
+                self._check_density(recount=True)
+            return
+
+        if not 0 <= i <= self._size:
+            raise IndexError('index out of range')
+
+        values = list(iterable)
+        count = len(values)
+        if count == 0:
+            return
+
+        self._preserve(i, self._size + count)
+        if i < self._size:
+            self._entries = {(k + count if k >= i else k): e for k, e in self._entries.items()}
+        for k, element in enumerate(values):
+            if element != self._default_element:
+                self._entries[i + k] = element
+        self._size += count
+        self._check_density()
+
+    def extend(self, iterable):
+        """
+        Appends given elements
+        """
+        self.insert_many(self._size, iterable)
+
+    def remove_range(self, start, end):
+        """
+        Removes vector segment [start, end)
+
+        Args:
+            start (int): starting index
+            end (int): ending index
+        """
+        if not self._sparse:
+            super(SparseVector, self).remove_range(start, end)
+            self._check_density(recount=True)
+            return
+
+        if 0 <= start < end <= self._size:
+            count = end - start
+            self._preserve(start, self._size)
+            self._entries = {(k - count if k >= end else k): e for k, e in self._entries.items() if not start <= k < end}
+            self._size -= count
+            self._check_density()
+        else:
+            raise IndexError('starting and ending index out of valid range')
+
+    def partial_remove(self, start, end):
+        """
+        Removes vector segment [start, end)
+        """
+        self.remove_range(start, end)
+
+    def remove(self, i):
+        """
+        Removes element on index i
+        """
+        self.remove_range(i, i + 1)
+
+    def _first_default(self, start=0):
+        """
+        Returns the least index no less than start holding default element in sparse storage, -1 if none
+        """
+        i = start
+        while i in self._entries:
+            i += 1
+
+        return i if i < self._size else -1
+
+    def find(self, target):
+        """
+        Finds given target in O(number of non-default elements)
+
+        Args:
+            target (object): target object to be found in vector
+
+        Returns:
+            result (int): least index of the target object found in vector, -1 if not found
+        """
+        if not self._sparse:
+            return super(SparseVector, self).find(target)
+
+        if target == self._default_element:
+            return self._first_default()
+
+        matches = [i for i, e in self._entries.items() if e == target]
+        return min(matches) if matches else -1
+
+    def search(self, target):
+        """
+        Finds given target in vector
+        """
+        if not self._sparse:
+            return super(SparseVector, self).search(target)
+
+        return self.find(target)
+
+    def search_many(self, targets):
+        """
+        Finds each of given targets in vector in one batch, indexing the non-default elements once
+        """
+        if not self._sparse:
+            return super(SparseVector, self).search_many(targets)
+
+        targets = list(targets)
+        try:
+            positions = {}
+            for i, element in reversed(self._runs()):
+                positions[element] = i
+            result = [positions.get(target, -1) for target in targets]
+        except TypeError:
+            result = [self.find(target) for target in targets]
+
+        return result if self._dtype is None else np.array(result, dtype=np.intp)
+
+    def count(self, target):
+        """
+        Counts elements equal to given target in O(number of non-default elements)
+        """
+        if not self._sparse:
+            return super(SparseVector, self).count(target)
+
+        result = sum(1 for e in self._entries.values() if e == target)
+        defaults = self._size - len(self._entries)
+        if defaults and target == self._default_element:
+            result += defaults
+
+        return result
+
+    def __contains__(self, target):
+        """
+        Overloads membership test
+        """
+        if not self._sparse:
+            return super(SparseVector, self).__contains__(target)
+
+        return self.find(target) >= 0
+
+    def unsorted(self, acending=True):
+        """
+        Checks if the vector is unsorted, comparing each run of default elements once
+        """
+        if not self._sparse:
+            return super(SparseVector, self).unsorted(acending)
+
+        result = -1
+        if self._size <= 1:
+            return result
+
+        descents, ascents = self._order_counts()
+        if (descents if acending else ascents) == 0:
+            return result
+
+        runs = self._runs()
+        for k in range(1, len(runs)):
+            left, right = runs[k - 1][1], runs[k][1]
+            if (left > right) if acending else (left < right):
+                return runs[k][0]
+
+        return result
+
+    def _scalar(self, element):
+        """
+        Returns saved element as numpy scalar if the vector is typed, the way dense storage reads it
+        """
+        return element if self._dtype is None else self._dtype.type(element)
+
+    def sum(self):
+        """
+        Returns sum of the elements, adding the default elements as one product
+        """
+        if not self._sparse:
+            return super(SparseVector, self).sum()
+
+        defaults = self._size - len(self._entries)
+        if self._dtype is not None:
+            result = np.array(list(self._entries.values()), dtype=self._dtype).sum()
+            if defaults:
+                result = result + np.asarray(self._default_element, dtype=self._dtype) * defaults
+            return result
+
+        result = sum(self._entries.values())
+        if defaults:
+            result += self._default_element * defaults
+
+        return result
+
+    def mean(self):
+        """
+        Returns arithmetic mean of the elements
+        """
+        if not self._sparse:
+            return super(SparseVector, self).mean()
+
+        self._check_not_empty()
+        return self.sum() / self._size
+
+    def _extreme(self, better):
+        """
+        Returns (index, element) of the first element no other element is better than on sparse storage
+
+        Args:
+            better (callable): better(a, b) is True if a should replace b
+        """
+        self._check_not_empty()
+        runs = self._runs()
+        index, element = runs[0]
+        for i, e in runs[1:]:
+            if better(e, element):
+                index, element = i, e
+
+        return index, element
+
+    def min(self):
+        """
+        Returns the least element
+        """
+        if not self._sparse:
+            return super(SparseVector, self).min()
+
+        return self._scalar(self._extreme(operator.lt)[1])
+
+    def max(self):
+        """
+        Returns the greatest element
+        """
+        if not self._sparse:
+            return super(SparseVector, self).max()
+
+        return self._scalar(self._extreme(operator.gt)[1])
+
+    def argmin(self):
+        """
+        Returns the least index of the least element
+        """
+        if not self._sparse:
+            return super(SparseVector, self).argmin()
+
+        return self._extreme(operator.lt)[0]
+
+    def argmax(self):
+        """
+        Returns the least index of the greatest element
+        """
+        if not self._sparse:
+            return super(SparseVector, self).argmax()
+
+        return self._extreme(operator.gt)[0]
+
+    def deduplicate(self):
+        """
+        Deduplicates the vector, keeping first occurrences in order
+        """
+        if not self._sparse:
+            super(SparseVector, self).deduplicate()
+            self._check_density(recount=True)
+            return
+
+        self._preserve(0, self._size)
+        first_default = self._first_default()
+        lookup = {}
+        result = []
+        for i in sorted(self._entries):
+            if 0 <= first_default < i:
+                result.append(self._default_element)
+                first_default = -1
+            element = self._entries[i]
+            if not lookup.get(element, False):
+                result.append(element)
+                lookup[element] = True
+        if first_default >= 0:
+            result.append(self._default_element)
+
+        self._entries = {}
+        self._size = 0
+        self.extend(result)
+
+    def sort(self, low=None, high=None, key=None, reverse=False):
+        """
+        Sorts the vector[low, high), stable, in O(m log m) for m non-default elements in range
+
+        Args:
+            low (int): starting index
+            high (int): ending index
+            key (callable): maps element to the key it's compared by, elements are compared directly if None
+            reverse (bool): True if sorting descendingly
+        """
+        if not self._sparse:
+            return super(SparseVector, self).sort(low, high, key=key, reverse=reverse)
+
+        if low is None or high is None:
+            low, high = 0, self._size
+
+        if not 0 <= low <= high <= self._size:
+            raise IndexError('starting and ending index out of valid range')
+
+        length = high - low
+        if length < 2:
+            return
+
+        # order of each element in the sequence being sorted acendingly,
+        # which is reversed for descending sorts to keep the sort stable
+        if reverse:
+            entries = sorted((high - 1 - i, e) for i, e in self._entries.items() if low <= i < high)
+        else:
+            entries = sorted((i - low, e) for i, e in self._entries.items() if low <= i < high)
+        orders = [order for order, _ in entries]
+
+        key = key or (lambda e: e)
+        default_key = key(self._default_element)
+        merge_sort(entries, key=lambda entry: key(entry[1]))
+
+        less = [entry for entry in entries if key(entry[1]) < default_key]
+        greater = [entry for entry in entries if default_key < key(entry[1])]
+        equal = [entry for entry in entries if not key(entry[1]) < default_key and not default_key < key(entry[1])]
+
+        positions = []
+        for position, (_, e) in enumerate(less):
+            positions.append((position, e))
+        for rank, (order, e) in enumerate(equal):
+            # default elements keep their original order among elements of equal key
+            defaults_before = order - bisect_left(orders, order)
+            positions.append((len(less) + rank + defaults_before, e))
+        for position, (_, e) in enumerate(greater):
+            positions.append((length - len(greater) + position, e))
+
+        self._preserve(low, high)
+        for i in [i for i in self._entries if low <= i < high]:
+            del self._entries[i]
+        for position, e in positions:
+            self._entries[high - 1 - position if reverse else low + position] = e
+
+    def mergesort(self, low=None, high=None, acending=True):
+        """
+        Sorts the vector[low, high)
+        """
+        self.sort(low, high, reverse=not acending)
+
+    def bubblesort(self, start=None, end=None, acending=True):
+        """
+        Sorts the vector[start, end)
+        """
+        if not self._sparse:
+            return super(SparseVector, self).bubblesort(start, end, acending)
+
+        self.sort(start, end, reverse=not acending)
+
+    def nth_element(self, k, low=None, high=None):
+        """
+        Puts the element that would be on index k if sorted there, by sorting the non-default elements
+        """
+        if not self._sparse:
+            return super(SparseVector, self).nth_element(k, low, high)
+
+        if low is None or high is None:
+            low, high = 0, self._size
+        if not (0 <= low <= high <= self._size and low <= k < high):
+            raise IndexError('index out of range')
+
+        self.sort(low, high)
+
+    def select(self, k, low=None, high=None):
+        """
+        Gets the element that would be on index k if the vector[low, high) were sorted, leaving the vector untouched
+        """
+        if not self._sparse:
+            return super(SparseVector, self).select(k, low, high)
+
+        if low is None or high is None:
+            low, high = 0, self._size
+        if not (0 <= low <= high <= self._size and low <= k < high):
+            raise IndexError('index out of range')
+
+        default = self._default_element
+        elements = [e for i, e in self._entries.items() if low <= i < high]
+        less = sorted(e for e in elements if e < default)
+        greater = sorted(e for e in elements if default < e)
+        rank = k - low
+        if rank < len(less):
+            return less[rank]
+        if rank >= high - low - len(greater):
+            return greater[rank - (high - low - len(greater))]
+
+        return default
+
+    def top_k(self, k, key=None, low=None, high=None):
+        """
+        Gets the k largest elements of the vector[low, high), streaming over the non-default elements
+        """
+        if not self._sparse:
+            return super(SparseVector, self).top_k(k, key, low, high)
+
+        if low is None or high is None:
+            low, high = 0, self._size
+        if not 0 <= low <= high <= self._size:
+            raise IndexError('starting and ending index out of valid range')
+
+        elements = [e for i, e in self._entries.items() if low <= i < high]
+        defaults = repeat(self._default_element, min(k, high - low - len(elements)))
+
+        return heapq.nlargest(k, elements + list(defaults), key=key)
+
+    def parallel_sort(self, low=None, high=None, key=None, reverse=False, workers=None):
+        """
+        Sorts the vector[low, high), sparse storage is sorted in place without a process pool
+        """
+        if not self._sparse:
+            return super(SparseVector, self).parallel_sort(low, high, key, reverse, workers)
+
+        self.sort(low, high, key=key, reverse=reverse)
+
+
+def _densified(method, keep_dense=False):
+    """
+    Wraps vector method so that it runs on dense storage, switching back afterwards if density allows
+
+    Args:
+        method (callable): vector method
+        keep_dense (bool): True if the method hands out the dense storage, which has to stay in use
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self._sparse:
+            return method(self, *args, **kwargs)
+
+        self._densify()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            if not keep_dense:
+                self._check_density(recount=True)
+
+    return wrapper
+
+
+override_methods(SparseVector, DENSIFIED_METHODS, _densified)
+# views keep reading the storage handed out
+override_methods(SparseVector, ('_buffer',), functools.partial(_densified, keep_dense=True))
@@ -1,37 +1,204 @@
+import numpy as np
+
 from data_structure import Vector
 
 class Stack(Vector):
-    
+
     def __init__(self, *args, **kwargs):
         """
         Constructor
 
+        Push and pop work straight on the buffer in O(1). If tracked, min and
+        max are kept in O(1) through monotonic stacks of the positions where
+        the running minimum / maximum changes; writes through other vector
+        operations mark them stale, and they are rebuilt on the next query
+
         Args:
             same as vector
-            
+
             default_capacity (int): default initial fixed size
             default_element (object): default element in vector
             initial_iter (iterable): initial elements to initialize vector
+            track_min (bool): True if keeping min() O(1)
+            track_max (bool): True if keeping max() O(1)
         """
+        # positions of elements less / greater than every element below them, None if not tracked
+        self._mins = [] if kwargs.pop('track_min', False) else None
+        self._maxs = [] if kwargs.pop('track_max', False) else None
+        self._aggregates_stale = False
         super(Stack, self).__init__(*args, **kwargs)
 
+    def _save_chunks(self, start, end):
+        """
+        Marks the monotonic stacks stale before any write but push and pop, then hands chunks to snapshots
+        """
+        self._aggregates_stale = True
+        super(Stack, self)._save_chunks(start, end)
+
+    def _track_push(self, i):
+        """
+        Pushes position i onto the monotonic stacks if it's a new minimum / maximum
+        """
+        elements = self._elements
+        if self._mins is not None and (not self._mins or elements[i] < elements[self._mins[-1]]):
+            self._mins.append(i)
+        if self._maxs is not None and (not self._maxs or elements[i] > elements[self._maxs[-1]]):
+            self._maxs.append(i)
+
+    def _track_pop(self, i):
+        """
+        Pops position i off the monotonic stacks
+        """
+        if self._mins and self._mins[-1] == i:
+            self._mins.pop()
+        if self._maxs and self._maxs[-1] == i:
+            self._maxs.pop()
+
+    def _refresh_aggregates(self):
+        """
+        Rebuilds stale monotonic stacks in O(n)
+        """
+        if not self._aggregates_stale:
+            return
+
+        if self._mins is not None:
+            self._mins = []
+        if self._maxs is not None:
+            self._maxs = []
+        for i in range(self._size):
+            self._track_push(i)
+        self._aggregates_stale = False
+
     def top(self):
         """
-        Returns top element of the stack        
+        Returns top element of the stack
         """
-        return self.get(i=self._size - 1)
+        if self._size == 0:
+            raise IndexError('top of empty stack')
+
+        return self._elements[self._size - 1]
 
     def push(self, element):
         """
         Pushes given element onto top of stack
         """
-        self.append(element)
+        size = self._size
+        if self._snapshots:
+            super(Stack, self)._save_chunks(size, size + 1)
+        if size == self._capacity:
+            self._ensure_capacity(size + 1)
+        self._elements[size] = element
+        self._size = size + 1
+        # the order is recounted if a search ever needs it
+        self._descents, self._ascents = None, None
+        if self._index is not None:
+            self._index.add(self._elements[size], size)
+        if not self._aggregates_stale:
+            self._track_push(size)
 
     def pop(self):
         """
         Gets top element of the stack
         """
-        top = self.top()
-        self.remove(self._size - 1)
+        size = self._size - 1
+        if size < 0:
+            raise IndexError('pop from empty stack')
+
+        if self._snapshots:
+            super(Stack, self)._save_chunks(size, size + 1)
+        top = self._elements[size]
+        if self._index is not None:
+            self._index.discard(top, size)
+        if not self._aggregates_stale:
+            self._track_pop(size)
+        # releases the reference held by the slot
+        self._elements[size] = self._default_element
+        self._size = size
+        self._descents, self._ascents = None, None
+        if self._shrink_threshold is not None:
+            self._shrink_if_sparse()
+
+        return top
+
+    def push_many(self, iterable):
+        """
+        Pushes given elements in order, the last one ending on top, writing them as one block
+
+        Args:
+            iterable (iterable): given elements
+        """
+        if not isinstance(iterable, (list, tuple, np.ndarray)):
+            iterable = list(iterable)
+        count = len(iterable)
+        if count == 0:
+            return
+
+        size = self._size
+        if self._snapshots:
+            super(Stack, self)._save_chunks(size, size + count)
+        self._ensure_capacity(size + count)
+        self._elements[size:size + count] = iterable
+        self._size = size + count
+        self._descents, self._ascents = None, None
+        if self._index is not None:
+            self._index.add_many(size, self._values(size, size + count))
+        if not self._aggregates_stale:
+            for i in range(size, size + count):
+                self._track_push(i)
+
+    def pop_many(self, count):
+        """
+        Pops given number of elements as one block
+
+        Args:
+            count (int): number of elements
+
+        Returns:
+            list of popped elements in popping order, the top first, or numpy array if the stack is typed
+        """
+        if not 0 <= count <= self._size:
+            raise IndexError('not enough elements to pop')
+
+        size = self._size
+        start = size - count
+        if self._snapshots:
+            super(Stack, self)._save_chunks(start, size)
+        popped = self._elements[start:size][::-1]
+        if self._dtype is not None:
+            popped = popped.copy()
+        if self._index is not None:
+            self._index.discard_many(start, self._values(start, size))
+        if not self._aggregates_stale:
+            for i in range(size - 1, start - 1, -1):
+                self._track_pop(i)
+        self._elements[start:size] = self._allocate(count)
+        self._size = start
+        self._descents, self._ascents = None, None
+        if self._shrink_threshold is not None:
+            self._shrink_if_sparse()
+
+        return popped
+
+    def min(self):
+        """
+        Returns the least element, in O(1) if tracked
+        """
+        if self._mins is None:
+            return super(Stack, self).min()
+
+        self._check_not_empty()
+        self._refresh_aggregates()
+
+        return self._elements[self._mins[-1]]
+
+    def max(self):
+        """
+        Returns the greatest element, in O(1) if tracked
+        """
+        if self._maxs is None:
+            return super(Stack, self).max()
+
+        self._check_not_empty()
+        self._refresh_aggregates()
 
-        return top
\ No newline at end of file
+        return self._elements[self._maxs[-1]]
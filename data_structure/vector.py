@@ -1,13 +1,30 @@
+import heapq
 import random
+import weakref
+from bisect import bisect_left
+from itertools import islice
+
+import numpy as np
+
+from data_structure.dedup import unique
+from data_structure.sorting import counting_sort_array, integer_sort, merge_sort, merge_runs, select_nth
+from data_structure.parallel_sort import parallel_merge_sort
+from data_structure.vector_view import VectorView
+from data_structure.vector_index import VectorIndex
+from data_structure.vector_snapshot import CHUNK_SIZE, VectorSnapshot
 
 DEFAULT_SIZE = 8
+DEFAULT_GROWTH_FACTOR = 2
 
 class Vector(object):
     def __init__(
         self, 
         default_capacity=DEFAULT_SIZE, 
         default_element=None, 
-        initial_iter=None):
+        initial_iter=None,
+        dtype=None,
+        growth_factor=DEFAULT_GROWTH_FACTOR,
+        shrink_threshold=None):
         """
         Constructor
 
@@ -15,16 +32,283 @@ class Vector(object):
             default_capacity (int): default initial fixed size
             default_element (object): default element in vector
             initial_iter (iterable): initial elements to initialize vector
+            dtype (str): numpy dtype, e.g. 'f8' or 'i8', elements are saved in a typed numpy buffer if given
+            growth_factor (float): the fixed space is multiplied by this factor when it's full
+            shrink_threshold (float): the fixed space is divided by growth factor when load drops below this ratio, e.g. 0.25, never shrinks if None
         """  
+        if growth_factor <= 1:
+            raise ValueError('growth factor must be greater than 1')
+        if shrink_threshold is not None and not 0 < shrink_threshold < 1 / growth_factor:
+            # shrinking right after growing would thrash
+            raise ValueError('shrink threshold must be in (0, 1 / growth factor)')
+
         self._size = 0
         self._default_capacity = default_capacity
         self._capacity = default_capacity
+        self._growth_factor = growth_factor
+        self._shrink_threshold = shrink_threshold
+        self._dtype = None if dtype is None else np.dtype(dtype)
+        if self._dtype is not None and default_element is None:
+            # typed buffer can't hold None, pad with zero instead
+            default_element = self._dtype.type(0)
         self._default_element = default_element
-        self._elements = [default_element for _ in range(default_capacity)]
+        self._elements = self._allocate(default_capacity)
+        # numbers of adjacent pairs breaking acending / descending order, both None if unknown
+        self._descents, self._ascents = 0, 0
+        # live snapshots sharing the storage, None until the first snapshot
+        self._snapshots = None
+        # hash index of values to positions, None unless built
+        self._index = None
 
         if initial_iter is not None:
             self.copy_from(initial_iter)
 
+    def _allocate(self, capacity):
+        """
+        Allocates storage filled with default element
+
+        Args:
+            capacity (int): number of slots
+
+        Returns:
+            list, or numpy array if the vector is typed
+        """
+        if self._dtype is not None:
+            return np.full(capacity, self._default_element, dtype=self._dtype)
+
+        return [self._default_element] * capacity
+
+    def _count_order(self, start, end):
+        """
+        Counts adjacent pairs (i - 1, i) breaking order for i in [start, end)
+
+        Args:
+            start (int): starting index
+            end (int): ending index
+
+        Returns:
+            (descents, ascents): numbers of pairs with vector[i - 1] > vector[i] and vector[i - 1] < vector[i]
+        """
+        start, end = max(start, 1), min(end, self._size)
+        if start >= end:
+            return 0, 0
+
+        if self._dtype is not None:
+            left, right = self._elements[start - 1:end - 1], self._elements[start:end]
+            return int(np.count_nonzero(left > right)), int(np.count_nonzero(left < right))
+
+        descents, ascents = 0, 0
+        elements = self._elements
+        for i in range(start, end):
+            if elements[i - 1] > elements[i]:
+                descents += 1
+            elif elements[i - 1] < elements[i]:
+                ascents += 1
+
+        return descents, ascents
+
+    def _track_order(self, start, end, sign):
+        """
+        Adds (sign = 1) or subtracts (sign = -1) the order breaking pairs of [start, end) to the cached counts
+
+        Args:
+            start (int): starting index
+            end (int): ending index
+            sign (int): 1 after a segment is written, -1 before it is overwritten
+        """
+        if self._descents is None or self._ascents is None:
+            return
+
+        try:
+            descents, ascents = self._count_order(start, end)
+        except (TypeError, ValueError):
+            # elements can't be ordered, leave it to the next full check
+            self._descents, self._ascents = None, None
+            return
+
+        self._descents += sign * descents
+        self._ascents += sign * ascents
+
+    def _track_slot(self, i, sign):
+        """
+        Adds (sign = 1) or subtracts (sign = -1) the pairs (i - 1, i) and (i, i + 1) to the cached counts,
+        comparing the neighbouring elements directly, for single element writes
+
+        Args:
+            i (int): index of the element written
+            sign (int): 1 after the element is written, -1 before it is overwritten
+        """
+        if self._descents is None or self._ascents is None:
+            return
+
+        elements = self._elements
+        has_left, has_right = i > 0, i + 1 < self._size
+        if self._dtype is None:
+            current = elements[i]
+            left = elements[i - 1] if has_left else None
+            right = elements[i + 1] if has_right else None
+        else:
+            # python scalars compare faster than numpy ones
+            current = elements.item(i)
+            left = elements.item(i - 1) if has_left else None
+            right = elements.item(i + 1) if has_right else None
+        descents, ascents = 0, 0
+        try:
+            if has_left:
+                if left > current:
+                    descents = 1
+                elif left < current:
+                    ascents = 1
+            if has_right:
+                if current > right:
+                    descents += 1
+                elif current < right:
+                    ascents += 1
+        except (TypeError, ValueError):
+            # elements can't be ordered, leave it to the next full check
+            self._descents, self._ascents = None, None
+            return
+
+        self._descents += sign * descents
+        self._ascents += sign * ascents
+
+    def _track_write(self, i, element):
+        """
+        Writes element on index i, updating the cached counts by comparing the old and the new element with their neighbours
+
+        Args:
+            i (int): index
+            element (object): the given element
+        """
+        elements = self._elements
+        if self._descents is None or self._ascents is None:
+            elements[i] = element
+            return
+
+        has_left, has_right = i > 0, i + 1 < self._size
+        if self._dtype is None:
+            old = elements[i]
+            elements[i] = new = element
+            left = elements[i - 1] if has_left else None
+            right = elements[i + 1] if has_right else None
+        else:
+            old = elements.item(i)
+            elements[i] = element
+            # reads the element back as the buffer may have cast it
+            new = elements.item(i)
+            left = elements.item(i - 1) if has_left else None
+            right = elements.item(i + 1) if has_right else None
+        descents, ascents = 0, 0
+        try:
+            if has_left:
+                if left > new:
+                    descents += 1
+                elif left < new:
+                    ascents += 1
+                if left > old:
+                    descents -= 1
+                elif left < old:
+                    ascents -= 1
+            if has_right:
+                if new > right:
+                    descents += 1
+                elif new < right:
+                    ascents += 1
+                if old > right:
+                    descents -= 1
+                elif old < right:
+                    ascents -= 1
+        except (TypeError, ValueError):
+            # elements can't be ordered, leave it to the next full check
+            self._descents, self._ascents = None, None
+            return
+
+        self._descents += descents
+        self._ascents += ascents
+
+    def _track_pair(self, p, sign):
+        """
+        Adds (sign = 1) or subtracts (sign = -1) the pair (p - 1, p) to the cached counts if it breaks order,
+        comparing the two elements directly
+
+        Args:
+            p (int): right index of the pair, ignored if there's no such pair
+            sign (int): 1 after the element is written, -1 before it is overwritten
+        """
+        if self._descents is None or self._ascents is None or not 0 < p < self._size:
+            return
+
+        elements = self._elements
+        if self._dtype is None:
+            left, right = elements[p - 1], elements[p]
+        else:
+            # python scalars compare faster than numpy ones
+            left, right = elements.item(p - 1), elements.item(p)
+        try:
+            if left > right:
+                self._descents += sign
+            elif left < right:
+                self._ascents += sign
+        except (TypeError, ValueError):
+            # elements can't be ordered, leave it to the next full check
+            self._descents, self._ascents = None, None
+
+    def _track_pairs(self, positions, sign):
+        """
+        Adds (sign = 1) or subtracts (sign = -1) the order breaking pairs (p - 1, p) for given positions to the cached counts
+
+        Args:
+            positions (iterable): right index of each pair, counted once even if repeated
+            sign (int): 1 after the elements are written, -1 before they are overwritten
+        """
+        if self._descents is None or self._ascents is None:
+            return
+
+        if self._dtype is not None:
+            positions = np.unique(positions)
+            positions = positions[(positions >= 1) & (positions < self._size)]
+            left, right = self._elements[positions - 1], self._elements[positions]
+            self._descents += sign * int(np.count_nonzero(left > right))
+            self._ascents += sign * int(np.count_nonzero(left < right))
+            return
+
+        for p in set(positions):
+            self._track_pair(p, sign)
+
+    def _order_counts(self):
+        """
+        Returns cached (descents, ascents), recounting the whole vector if unknown
+        """
+        if self._descents is None or self._ascents is None:
+            try:
+                self._descents, self._ascents = self._count_order(1, self._size)
+            except (TypeError, ValueError):
+                return None, None
+
+        return self._descents, self._ascents
+
+    @property
+    def is_acending(self):
+        """
+        True if the vector is sorted acendingly
+        """
+        descents, _ = self._order_counts()
+        return descents == 0
+
+    @property
+    def is_descending(self):
+        """
+        True if the vector is sorted descendingly
+        """
+        _, ascents = self._order_counts()
+        return ascents == 0
+
+    def dtype(self):
+        """
+        Returns numpy dtype of the typed vector, None if elements are python objects
+        """
+        return self._dtype
+
     def __str__(self):
         """
         Overloads print statement
@@ -58,21 +342,30 @@ class Vector(object):
             i (int): index
             value (object): data to be saved in the i-th element in vector
         """
-
+        if isinstance(index, slice):
+            self._preserve(0, self._size)
+        else:
+            i = index + self._size if index < 0 else index
+            self._preserve(i, i + 1)
         self._elements[index] = value
+        self._descents, self._ascents = None, None
 
-    def copy_from(self, iter):
+    def copy_from(self, iter, dedup=None):
         """
         Copies content from given iterable
 
         Args:
             iter (iterable): iterable object from which contents are copied and put into vector
+            dedup (str): mode of dedup.unique dropping repeated elements on the way in, 'exact', 'approximate' or 'sorted', all kept if None
         """        
+        if dedup is not None:
+            iter = unique(iter, dedup)
+        self._preserve(0, self._size)
         self._size = 0
         self._capacity = self._default_capacity        
-        self._elements = [self._default_element for _ in range(self._capacity)]
-        for e in iter:
-            self.append(e)
+        self._descents, self._ascents = 0, 0
+        self._elements = self._allocate(self._capacity)
+        self.extend(iter)
 
     def compare_with_iterable(self, iter):
         """
@@ -99,10 +392,14 @@ class Vector(object):
         """
         Appends given element
         """
+        self._save_chunks(self._size, self._size + 1)
         # applies more space if necessary
         self.expand()
         self._elements[self._size] = element
         self._size += 1
+        self._track_slot(self._size - 1, 1)
+        if self._index is not None:
+            self._index.add(self._elements[self._size - 1], self._size - 1)
 
     def put(self, i, element):
         """
@@ -113,7 +410,12 @@ class Vector(object):
             element (object): the given element to be updated on index i
         """
         if 0 <= i < self._size:
-            self._elements[i] = element
+            self._save_chunks(i, i + 1)
+            if self._index is not None:
+                self._index.discard(self._elements[i], i)
+            self._track_write(i, element)
+            if self._index is not None:
+                self._index.add(self._elements[i], i)
         else:
             raise IndexError('index out of range')
 
@@ -135,6 +437,401 @@ class Vector(object):
             else:
                 raise IndexError('invalid index range')
 
+    def take(self, indices):
+        """
+        Gets elements of given indices, checking bounds once for the batch
+
+        Args:
+            indices (iterable): index of each element
+
+        Returns:
+            list of elements, or numpy array if the vector is typed
+        """
+        if self._dtype is not None:
+            indices = np.asarray(indices, dtype=np.intp)
+            if len(indices) and (indices.min() < 0 or indices.max() >= self._size):
+                raise IndexError('index out of range')
+            return self._elements[indices]
+
+        indices = list(indices)
+        if indices and (min(indices) < 0 or max(indices) >= self._size):
+            raise IndexError('index out of range')
+        elements = self._elements
+
+        return [elements[i] for i in indices]
+
+    def put_many(self, indices, values):
+        """
+        Updates elements of given indices, checking bounds once for the batch
+
+        Args:
+            indices (iterable): index of each element, the last value wins for repeated indices
+            values (iterable): the given elements to be updated on the indices
+        """
+        if self._dtype is not None:
+            indices = np.asarray(indices, dtype=np.intp)
+        else:
+            indices = list(indices)
+        values = list(values) if self._dtype is None else np.asarray(values, dtype=self._dtype)
+        if len(indices) != len(values):
+            raise ValueError('numbers of indices and values differ')
+        if len(indices) == 0:
+            return
+        if self._dtype is not None:
+            low, high = indices.min(), indices.max()
+        else:
+            low, high = min(indices), max(indices)
+        if low < 0 or high >= self._size:
+            raise IndexError('index out of range')
+
+        self._preserve_indices(indices)
+        if self._index is not None:
+            # each index once, however many times it's written
+            touched = set(indices.tolist() if self._dtype is not None else indices)
+            for i in touched:
+                self._index.discard(self._elements[i], i)
+        if self._dtype is not None:
+            positions = np.concatenate((indices, indices + 1))
+            self._track_pairs(positions, -1)
+            self._elements[indices] = values
+        else:
+            positions = indices + [i + 1 for i in indices]
+            self._track_pairs(positions, -1)
+            elements = self._elements
+            for i, value in zip(indices, values):
+                elements[i] = value
+        self._track_pairs(positions, 1)
+        if self._index is not None:
+            for i in touched:
+                self._index.add(self._elements[i], i)
+
+    def view(self, i=0, j=None):
+        """
+        Gets a view on element of index [i, j) without copying
+
+        Args:
+            i, j (int): index, j defaults to vector size
+
+        Returns:
+            VectorView referencing the vector storage
+        """
+        if j is None:
+            j = self._size
+
+        if 0 <= i <= j <= self._size:
+            return VectorView(self, i, j - i)
+        else:
+            raise IndexError('invalid index range')
+
+    def _buffer(self):
+        """
+        Returns the storage where element of index i lives on slot i
+        """
+        return self._elements
+
+    def snapshot(self):
+        """
+        Freezes the vector in O(1), sharing storage until writes copy the chunks they change
+
+        Returns:
+            VectorSnapshot of current elements
+        """
+        if self._snapshots is None:
+            self._snapshots = weakref.WeakSet()
+        snapshot = VectorSnapshot(self)
+        self._snapshots.add(snapshot)
+
+        return snapshot
+
+    def _preserve(self, start, end):
+        """
+        Hands the chunks covering [start, end) to live snapshots and drops the index positions before they are overwritten
+
+        Args:
+            start (int): starting index
+            end (int): ending index
+        """
+        self._save_chunks(start, end)
+        if self._index is not None:
+            self._index.invalidate()
+
+    def _save_chunks(self, start, end):
+        """
+        Hands the chunks covering [start, end) to live snapshots, for writes that keep the index up to date themselves
+
+        Args:
+            start (int): starting index
+            end (int): ending index
+        """
+        if self._snapshots:
+            for snapshot in list(self._snapshots):
+                snapshot._save(start, end)
+
+    def _preserve_indices(self, indices):
+        """
+        Hands the chunks holding given indices to live snapshots before they are overwritten
+
+        Args:
+            indices (iterable): index of each element to be overwritten
+        """
+        if self._snapshots:
+            for chunk in set(int(i) // CHUNK_SIZE for i in indices):
+                self._preserve(chunk * CHUNK_SIZE, (chunk + 1) * CHUNK_SIZE)
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Converts the vector for numpy, a view on the live elements if typed
+        """
+        if self._dtype is None:
+            return np.array(self._elements[:self._size], dtype=dtype)
+
+        values = self._elements[:self._size]
+        if dtype is not None:
+            values = values.astype(dtype, copy=False)
+
+        return values.copy() if copy else values
+
+    def _operand(self, other):
+        """
+        Converts the other operand of an elementwise operation
+
+        Args:
+            other (object): scalar, vector or array-like of vector size
+
+        Returns:
+            numpy scalar or array
+        """
+        if self._dtype is None:
+            raise TypeError('elementwise operations need a typed vector')
+
+        operand = np.asarray(other)
+        if operand.ndim and len(operand) != self._size:
+            raise ValueError('operand size differs from vector size')
+
+        return operand
+
+    def _elementwise(self, ufunc, other, reflected=False):
+        """
+        Applies numpy ufunc to the elements and the other operand in one pass
+
+        Args:
+            ufunc (numpy.ufunc): elementwise operation
+            other (object): scalar, vector or array-like of vector size
+            reflected (bool): True if the vector is the right operand
+
+        Returns:
+            new typed vector, of dtype bool for comparisons
+        """
+        operand = self._operand(other)
+        values = self._elements[:self._size]
+
+        return _from_array(ufunc(operand, values) if reflected else ufunc(values, operand))
+
+    def _inplace(self, ufunc, other):
+        """
+        Applies numpy ufunc writing into the buffer, no temporary array is made
+
+        Args:
+            ufunc (numpy.ufunc): elementwise operation
+            other (object): scalar, vector or array-like of vector size, cast to the vector dtype
+
+        Returns:
+            the vector itself
+        """
+        operand = self._operand(other)
+        self._preserve(0, self._size)
+        values = self._elements[:self._size]
+        ufunc(values, operand, out=values, casting='same_kind')
+        self._descents, self._ascents = None, None
+
+        return self
+
+    def __add__(self, other):
+        """
+        Elementwise addition, returns a new typed vector
+        """
+        return self._elementwise(np.add, other)
+
+    def __radd__(self, other):
+        """
+        Elementwise addition with the vector as the right operand
+        """
+        return self._elementwise(np.add, other, reflected=True)
+
+    def __iadd__(self, other):
+        """
+        Elementwise addition in place
+        """
+        return self._inplace(np.add, other)
+
+    def __sub__(self, other):
+        """
+        Elementwise subtraction, returns a new typed vector
+        """
+        return self._elementwise(np.subtract, other)
+
+    def __rsub__(self, other):
+        """
+        Elementwise subtraction with the vector as the right operand
+        """
+        return self._elementwise(np.subtract, other, reflected=True)
+
+    def __isub__(self, other):
+        """
+        Elementwise subtraction in place
+        """
+        return self._inplace(np.subtract, other)
+
+    def __mul__(self, other):
+        """
+        Elementwise multiplication, returns a new typed vector
+        """
+        return self._elementwise(np.multiply, other)
+
+    def __rmul__(self, other):
+        """
+        Elementwise multiplication with the vector as the right operand
+        """
+        return self._elementwise(np.multiply, other, reflected=True)
+
+    def __imul__(self, other):
+        """
+        Elementwise multiplication in place
+        """
+        return self._inplace(np.multiply, other)
+
+    def __truediv__(self, other):
+        """
+        Elementwise division, returns a new typed vector
+        """
+        return self._elementwise(np.true_divide, other)
+
+    def __rtruediv__(self, other):
+        """
+        Elementwise division with the vector as the right operand
+        """
+        return self._elementwise(np.true_divide, other, reflected=True)
+
+    def __itruediv__(self, other):
+        """
+        Elementwise division in place
+        """
+        return self._inplace(np.true_divide, other)
+
+    def __lt__(self, other):
+        """
+        Elementwise comparison, returns a new typed vector of dtype bool as a mask
+        """
+        return self._elementwise(np.less, other)
+
+    def __le__(self, other):
+        """
+        Elementwise comparison, returns a new typed vector of dtype bool as a mask
+        """
+        return self._elementwise(np.less_equal, other)
+
+    def __gt__(self, other):
+        """
+        Elementwise comparison, returns a new typed vector of dtype bool as a mask
+        """
+        return self._elementwise(np.greater, other)
+
+    def __ge__(self, other):
+        """
+        Elementwise comparison, returns a new typed vector of dtype bool as a mask
+        """
+        return self._elementwise(np.greater_equal, other)
+
+    def equal(self, other):
+        """
+        Compares elements for equality, == keeps comparing vector identity
+
+        Returns:
+            new typed vector of dtype bool
+        """
+        return self._elementwise(np.equal, other)
+
+    def not_equal(self, other):
+        """
+        Compares elements for inequality
+
+        Returns:
+            new typed vector of dtype bool
+        """
+        return self._elementwise(np.not_equal, other)
+
+    def dot(self, other):
+        """
+        Returns the inner product with a vector or array-like of vector size
+        """
+        return np.dot(self._elements[:self._size], self._operand(other))
+
+    def sum(self):
+        """
+        Returns sum of the elements, 0 if the vector is empty
+        """
+        if self._dtype is not None:
+            return self._elements[:self._size].sum()
+
+        return sum(self._elements[:self._size])
+
+    def _check_not_empty(self):
+        """
+        Raises ValueError if there's nothing to reduce
+        """
+        if self._size == 0:
+            raise ValueError('vector is empty')
+
+    def min(self):
+        """
+        Returns the least element
+        """
+        self._check_not_empty()
+        if self._dtype is not None:
+            return self._elements[:self._size].min()
+
+        return min(self._elements[:self._size])
+
+    def max(self):
+        """
+        Returns the greatest element
+        """
+        self._check_not_empty()
+        if self._dtype is not None:
+            return self._elements[:self._size].max()
+
+        return max(self._elements[:self._size])
+
+    def argmin(self):
+        """
+        Returns the least index of the least element
+        """
+        self._check_not_empty()
+        if self._dtype is not None:
+            return int(self._elements[:self._size].argmin())
+
+        return min(range(self._size), key=self._elements.__getitem__)
+
+    def argmax(self):
+        """
+        Returns the least index of the greatest element
+        """
+        self._check_not_empty()
+        if self._dtype is not None:
+            return int(self._elements[:self._size].argmax())
+
+        return max(range(self._size), key=self._elements.__getitem__)
+
+    def mean(self):
+        """
+        Returns arithmetic mean of the elements
+        """
+        self._check_not_empty()
+        if self._dtype is not None:
+            return self._elements[:self._size].mean()
+
+        return sum(self._elements[:self._size]) / self._size
+
     def size(self):
         """
         Returns vector size
@@ -156,13 +853,84 @@ class Vector(object):
         """
         return (self._size == 0)
 
+    def capacity(self):
+        """
+        Returns size of the fixed space
+        """
+        return self._capacity
+
     def expand(self):
         """
-        Doubles the fixed space if necessary
+        Grows the fixed space by growth factor if necessary
         """
         if self._size == self._capacity:
-            self._elements += [self._default_element for _ in self._elements]
-            self._capacity *= 2
+            self._ensure_capacity(self._capacity + 1)
+
+    def _ensure_capacity(self, capacity):
+        """
+        Grows the fixed space by growth factor until it holds given number of elements, reallocating at most once
+
+        Args:
+            capacity (int): number of elements to hold
+        """
+        if capacity <= self._capacity:
+            return
+
+        new_capacity = max(self._capacity, 1)
+        while new_capacity < capacity:
+            new_capacity = max(new_capacity + 1, int(new_capacity * self._growth_factor))
+
+        self._resize(new_capacity)
+
+    def _resize(self, capacity):
+        """
+        Reallocates the fixed space to given size, which is no less than vector size
+
+        Args:
+            capacity (int): new size of the fixed space
+        """
+        if capacity > self._capacity:
+            if self._dtype is not None:
+                self._elements = np.concatenate((self._elements, self._allocate(capacity - self._capacity)))
+            else:
+                self._elements += self._allocate(capacity - self._capacity)
+        elif capacity < self._capacity:
+            if self._dtype is not None:
+                # copies so that the larger buffer can be freed
+                self._elements = self._elements[:capacity].copy()
+            else:
+                del self._elements[capacity:]
+        self._capacity = capacity
+
+    def _shrink_if_sparse(self):
+        """
+        Divides the fixed space by growth factor while load is below shrink threshold
+        """
+        if self._shrink_threshold is None:
+            return
+
+        capacity = self._capacity
+        while capacity > self._default_capacity and self._size < capacity * self._shrink_threshold:
+            capacity = max(self._default_capacity, int(capacity / self._growth_factor))
+
+        if capacity < self._capacity:
+            self._resize(capacity)
+
+    def reserve(self, capacity):
+        """
+        Reallocates the fixed space once so that it holds at least given number of elements
+
+        Args:
+            capacity (int): number of elements to hold
+        """
+        if capacity > self._capacity:
+            self._resize(capacity)
+
+    def shrink_to_fit(self):
+        """
+        Releases the fixed space not used by elements
+        """
+        self._resize(max(self._size, 1))
 
     def unsorted(self, acending=True):
         """
@@ -178,6 +946,18 @@ class Vector(object):
         if self._size <= 1:
             return result
 
+        descents, ascents = self._order_counts()
+        if (descents if acending else ascents) == 0:
+            return result
+
+        if self._dtype is not None:
+            elements = self._elements[:self._size]
+            if acending:
+                violations = np.flatnonzero(elements[:-1] > elements[1:])
+            else:
+                violations = np.flatnonzero(elements[:-1] < elements[1:])
+            return int(violations[0]) + 1 if len(violations) else result
+
         for i in range(1, self._size):
             if acending:
                 if self._elements[i - 1] > self._elements[i]:
@@ -190,9 +970,39 @@ class Vector(object):
 
         return result
 
+    def build_index(self):
+        """
+        Builds a hash index of values to positions, kept up to date through writes,
+        so that find, count and membership test take O(1) on average
+
+        Elements must be hashable
+        """
+        self._index = VectorIndex(self)
+        self._index._ensure()
+
+    def drop_index(self):
+        """
+        Drops the hash index
+        """
+        self._index = None
+
+    def index_memory_usage(self):
+        """
+        Returns approximate bytes taken by the hash index, 0 if there is none
+        """
+        return 0 if self._index is None else self._index.memory_usage()
+
+    def _values(self, i, j):
+        """
+        Returns elements of index [i, j) as python objects, the way the index keys them
+        """
+        values = self._elements[i:j]
+
+        return values.tolist() if self._dtype is not None else values
+
     def find(self, target):
         """
-        Finds given target in unsorted vector
+        Finds given target in unsorted vector, through the hash index if built
 
         Args:
             target (object): target object to be found in vector
@@ -200,8 +1010,15 @@ class Vector(object):
         Returns:
             result (int): least index of the target object found in vector, -1 if not found
         """
+        if self._index is not None:
+            return self._index.find(target)
+
         result = -1
 
+        if self._dtype is not None:
+            matches = np.flatnonzero(self._elements[:self._size] == target)
+            return int(matches[0]) if len(matches) else result
+
         for i in range(self._size):
             if self._elements[i] == target:
                 result = i
@@ -209,6 +1026,27 @@ class Vector(object):
 
         return result
 
+    def count(self, target):
+        """
+        Counts elements equal to given target, through the hash index if built
+        """
+        if self._index is not None:
+            return self._index.count(target)
+
+        if self._dtype is not None:
+            return int(np.count_nonzero(self._elements[:self._size] == target))
+
+        return sum(1 for e in self._elements[:self._size] if e == target)
+
+    def __contains__(self, target):
+        """
+        Overloads membership test, only live elements are considered
+        """
+        if self._index is not None:
+            return target in self._index
+
+        return self.find(target) >= 0
+
     def search(self, target):
         """
         Finds given target in vector
@@ -221,9 +1059,10 @@ class Vector(object):
         """
         result = -1
 
-        if self.unsorted(True) < 0:
+        # sortedness is cached, so only unsorted vectors pay for a linear scan
+        if self.is_acending:
             result = self.binary_search_acending(target)
-        elif self.unsorted(False) < 0:
+        elif self.is_descending:
             result = self.binary_search_descending(target)
         else:
             result = self.find(target)
@@ -240,6 +1079,10 @@ class Vector(object):
         Returns:
             result (int): index of target object found in vector, -1 if not found
         """        
+        if self._dtype is not None:
+            i = int(np.searchsorted(self._elements[:self._size], target, side='left'))
+            return i if i < self._size and self._elements[i] == target else -1
+
         low, high = 0, self._size
 
         while low < high:
@@ -263,6 +1106,11 @@ class Vector(object):
         Returns:
             result (int): index of target object found in vector, -1 if not found
         """  
+        if self._dtype is not None:
+            # searches the reversed view of the descending vector, which is acending
+            i = self._size - int(np.searchsorted(self._elements[:self._size][::-1], target, side='right'))
+            return i if 0 <= i < self._size and self._elements[i] == target else -1
+
         low, high = 0, self._size
 
         while low < high:
@@ -276,6 +1124,102 @@ class Vector(object):
 
         return -1
 
+    def search_many(self, targets):
+        """
+        Finds each of given targets in vector in one batch
+
+        Sorted vectors are swept once from left to right, each search starting
+        from the previous match, so sorted targets never revisit the prefix
+        already passed; unsorted vectors are indexed once instead of scanned
+        per target
+
+        Args:
+            targets (iterable): target objects to be found in vector
+
+        Returns:
+            least index of each target found in vector, -1 if not found, as numpy array if the vector is typed
+        """
+        if self._dtype is not None:
+            return self._search_many_typed(np.asarray(targets))
+
+        targets = list(targets)
+        result = [-1] * len(targets)
+        elements, size = self._elements, self._size
+        if size == 0:
+            return result
+
+        acending = self.is_acending
+        if not acending and not self.is_descending:
+            try:
+                positions = {}
+                for i in range(size - 1, -1, -1):
+                    positions[elements[i]] = i
+                return [positions.get(target, -1) for target in targets]
+            except TypeError:
+                return [self.find(target) for target in targets]
+
+        order = range(len(targets))
+        if any(targets[k] < targets[k - 1] if acending else targets[k] > targets[k - 1] for k in range(1, len(targets))):
+            order = sorted(order, key=targets.__getitem__, reverse=not acending)
+
+        i = 0
+        for k in order:
+            target = targets[k]
+            if acending:
+                i = bisect_left(elements, target, i, size)
+                if i < size and elements[i] == target:
+                    result[k] = i
+                continue
+
+            low = high = i
+            step = 1
+            # gallops to bracket the first element no greater than target, then bisects
+            while high < size and elements[high] > target:
+                low = high + 1
+                high += step
+                step <<= 1
+            high = min(high, size)
+            while low < high:
+                mid = (low + high) >> 1
+                if elements[mid] > target:
+                    low = mid + 1
+                else:
+                    high = mid
+            i = low
+            if i < size and elements[i] == target:
+                result[k] = i
+
+        return result
+
+    def _search_many_typed(self, targets):
+        """
+        Finds each of given targets in typed vector through vectorized binary search
+
+        Args:
+            targets (numpy.ndarray): target values
+
+        Returns:
+            numpy array of least index of each target, -1 if not found
+        """
+        elements, size = self._elements[:self._size], self._size
+        if size == 0:
+            return np.full(len(targets), -1, dtype=np.intp)
+
+        if self.is_acending:
+            indices = np.searchsorted(elements, targets, side='left')
+        elif self.is_descending:
+            # searches the reversed view of the descending vector, which is acending
+            indices = size - np.searchsorted(elements[::-1], targets, side='right')
+        else:
+            values, first = np.unique(elements, return_index=True)
+            found = np.searchsorted(values, targets, side='left')
+            clipped = np.minimum(found, len(values) - 1)
+            return np.where(values[clipped] == targets, first[clipped], -1)
+
+        clipped = np.minimum(indices, size - 1)
+
+        return np.where((indices < size) & (elements[clipped] == targets), indices, -1)
+
     def insert(self, i, element):
         """
         Inserts element on given index
@@ -284,16 +1228,62 @@ class Vector(object):
             i (int): index
             element (object): given element to be inserted into vector                
         """
-        self._size += 1
+        if not 0 <= i <= self._size:
+            raise IndexError('index out of range')
+
+        self._save_chunks(i, self._size + 1)
+        self._track_pair(i, -1)
+        # applies more space if necessary
         self.expand()        
+        self._size += 1
 
-        if 0 <= i < self._size:
-            for j in range(self._size - 1, i, -1):
-                self._elements[j] = self._elements[j - 1]
-            self._elements[i] = element
-        else:
+        # moves the tail as one block
+        self._elements[i + 1:self._size] = self._elements[i:self._size - 1]
+        self._elements[i] = element
+        self._track_slot(i, 1)
+        if self._index is not None:
+            if i < self._size - 1:
+                self._index.shift(i, 1)
+            self._index.add(self._elements[i], i)
+
+    def insert_many(self, i, iterable):
+        """
+        Inserts elements on given index, reserving space once and moving the tail as one block
+
+        Args:
+            i (int): index
+            iterable (iterable): given elements to be inserted into vector
+        """
+        if not 0 <= i <= self._size:
             raise IndexError('index out of range')
 
+        if not isinstance(iterable, (list, tuple, np.ndarray)):
+            iterable = list(iterable)
+        count = len(iterable)
+        if count == 0:
+            return
+
+        self._save_chunks(i, self._size + count)
+        self._track_order(i, i + 1, -1)
+        self._ensure_capacity(self._size + count)
+        self._elements[i + count:self._size + count] = self._elements[i:self._size]
+        self._elements[i:i + count] = iterable
+        self._size += count
+        self._track_order(i, i + count + 1, 1)
+        if self._index is not None:
+            if i < self._size - count:
+                self._index.shift(i, count)
+            self._index.add_many(i, self._values(i, i + count))
+
+    def extend(self, iterable):
+        """
+        Appends given elements
+
+        Args:
+            iterable (iterable): given elements to be appended
+        """
+        self.insert_many(self._size, iterable)
+
     def partial_permute(self, start, end):
         """
         Permutes vector segment [start, end)
@@ -302,11 +1292,14 @@ class Vector(object):
             start (int): starting index
             end (int): ending index
         """
+        self._preserve(start, end)
+        self._track_order(start, end + 1, -1)
         for i in range(end - 1, start, -1):
             temp = self._elements[i]
             swap_index = random.randint(start, i - 1)            
             self._elements[i] = self._elements[swap_index]
             self._elements[swap_index] = temp            
+        self._track_order(start, end + 1, 1)
 
     def permute(self):
         """
@@ -318,16 +1311,41 @@ class Vector(object):
         """
         Removes vector segment [start, end)
 
+        Args:
+            start (int): starting index
+            end (int): ending index
+        """
+        self.remove_range(start, end)
+
+    def remove_range(self, start, end):
+        """
+        Removes vector segment [start, end), moving the tail as one block
+
         Args:
             start (int): starting index
             end (int): ending index
         """
         current_size = self._size
         if 0 <= start < end <= current_size:
+            self._save_chunks(start, current_size)
+            single = end - start == 1
+            if single:
+                self._track_slot(start, -1)
+            else:
+                self._track_order(start, end + 1, -1)
+            if self._index is not None:
+                self._index.discard_many(start, self._values(start, end))
+                if end < current_size:
+                    self._index.shift(end, start - end)
             self._size = current_size - (end - start)
-            for i in range(end, current_size):
-                self._elements[start] = self._elements[i]                
-                start += 1
+            self._elements[start:self._size] = self._elements[end:current_size]
+            # releases references held by the vacated slots
+            self._elements[self._size:current_size] = self._allocate(end - start)
+            if single:
+                self._track_pair(start, 1)
+            else:
+                self._track_order(start, start + 1, 1)
+            self._shrink_if_sparse()
         else:
             raise IndexError('starting and ending index out of valid range')
 
@@ -344,6 +1362,17 @@ class Vector(object):
         """
         Deduplicates the vector
         """
+        self._preserve(0, self._size)
+        if self._dtype is not None:
+            # keeps the first occurrence of each value in original order
+            _, first = np.unique(self._elements[:self._size], return_index=True)
+            first.sort()
+            self._elements[:len(first)] = self._elements[first]
+            self._size = len(first)
+            self._descents, self._ascents = None, None
+            self._shrink_if_sparse()
+            return
+
         lookup = {}
         slow, fast = 0, 0
 
@@ -356,7 +1385,43 @@ class Vector(object):
 
             fast += 1
 
+        self._elements[slow:self._size] = self._allocate(self._size - slow)
+        self._size = slow
+        self._descents, self._ascents = None, None
+        self._shrink_if_sparse()
+
+    def filter(self, mask):
+        """
+        Keeps the elements whose mask is True in place, in original order, as deduplicate does
+
+        Args:
+            mask (iterable): bools of vector size, e.g. a vector returned by a comparison
+        """
+        if self._dtype is not None:
+            mask = np.asarray(mask, dtype=bool)
+        else:
+            mask = list(mask)
+        if len(mask) != self._size:
+            raise ValueError('mask size differs from vector size')
+
+        self._preserve(0, self._size)
+        if self._dtype is not None:
+            kept = self._elements[:self._size][mask]
+            slow = len(kept)
+            self._elements[:slow] = kept
+        else:
+            slow = 0
+            for fast in range(self._size):
+                if mask[fast]:
+                    self._elements[slow] = self._elements[fast]
+                    slow += 1
+
+        self._elements[slow:self._size] = self._allocate(self._size - slow)
         self._size = slow
+        # a subsequence of a vector sorted both ways is constant, any other order has to be recounted
+        if (self._descents, self._ascents) != (0, 0):
+            self._descents, self._ascents = None, None
+        self._shrink_if_sparse()
 
     def bubblesort(self, start=None, end=None, acending=True):
         """
@@ -371,6 +1436,8 @@ class Vector(object):
             start, end = 0, self._size
         
         if 0 <= start < end <= self._size:
+            self._preserve(start, end)
+            self._track_order(start, end + 1, -1)
             unsorted = True
             while unsorted:
                 unsorted = False
@@ -383,31 +1450,85 @@ class Vector(object):
 
             if not acending:
                 self._elements[start:end] = self._elements[start:end][::-1]
+            self._track_order(start, end + 1, 1)
         else:
             raise IndexError('starting and ending index out of valid range')
 
-    def mergesort(self, low=None, high=None, acending=True):
+    def sort(self, low=None, high=None, key=None, reverse=False):
         """
-        Sorts the vector[low, high) through mergesort
+        Sorts the vector[low, high) in place through bottom-up mergesort with insertion sort on short runs, stable
+
+        Ints, or typed integer vectors, within a bounded range are counted or radix sorted instead of compared
 
         Args:
             low (int): starting index
             high (int): ending index
-            acending (bool): True if sorting acendingly, False if descendingly
+            key (callable): maps element to the key it's compared by, elements are compared directly if None
+            reverse (bool): True if sorting descendingly
         """
         if low is None or high is None:
             low, high = 0, self._size
 
+        if not 0 <= low <= high <= self._size:
+            raise IndexError('starting and ending index out of valid range')
+
         if high - low < 2:
             return
-        
-        mid = (low + high) >> 1
-        self.mergesort(low, mid)
-        self.mergesort(mid, high)
-        self.merge(low, mid, high)
 
-        if not acending:
-            self._elements[low:high] = self._elements[low:high][::-1]
+        self._preserve(low, high)
+        self._track_order(low, high + 1, -1)
+        if self._dtype is not None and key is None:
+            segment = counting_sort_array(self._elements[low:high], reverse)
+            if segment is None:
+                segment = self._elements[low:high]
+                # reversing around a stable sort keeps equal elements in original order
+                if reverse:
+                    segment = segment[::-1]
+                segment = np.sort(segment, kind='stable')
+                segment = segment[::-1] if reverse else segment
+            self._elements[low:high] = segment
+        else:
+            segment = list(self._elements[low:high])
+            if key is not None or not integer_sort(segment, reverse):
+                merge_sort(segment, key=key, reverse=reverse)
+            self._elements[low:high] = segment
+        self._track_order(low, high + 1, 1)
+
+    def parallel_sort(self, low=None, high=None, key=None, reverse=False, workers=None):
+        """
+        Sorts the vector[low, high) by sorting chunks in a process pool and merging the sorted runs, stable
+
+        Args:
+            low (int): starting index
+            high (int): ending index
+            key (callable): maps element to the key it's compared by, must be picklable, not supported by typed vector
+            reverse (bool): True if sorting descendingly
+            workers (int): number of worker processes, number of cpus if None
+        """
+        if low is None or high is None:
+            low, high = 0, self._size
+
+        if not 0 <= low <= high <= self._size:
+            raise IndexError('starting and ending index out of valid range')
+
+        if high - low < 2:
+            return
+
+        self._preserve(low, high)
+        self._track_order(low, high + 1, -1)
+        self._elements[low:high] = parallel_merge_sort(self._elements[low:high], key=key, reverse=reverse, workers=workers)
+        self._track_order(low, high + 1, 1)
+
+    def mergesort(self, low=None, high=None, acending=True):
+        """
+        Sorts the vector[low, high) through mergesort
+
+        Args:
+            low (int): starting index
+            high (int): ending index
+            acending (bool): True if sorting acendingly, False if descendingly
+        """
+        self.sort(low, high, reverse=not acending)
 
     def merge(self, low, mid, high):
         """
@@ -418,35 +1539,124 @@ class Vector(object):
             high (int): ending index
             mid (int): floor((low + high) / 2)
         """
-        left, right = low, mid
-        temp_container = []        
-        while left < mid or right < high:
-            left_element = self._elements[left] if left < mid else None
-            right_element = self._elements[right] if right < high else None
+        self._preserve(low, high)
+        self._track_order(low, high + 1, -1)
+        if self._dtype is not None:
+            # numpy's stable sort detects the two runs
+            self._elements[low:high] = np.sort(self._elements[low:high], kind='stable')
+        else:
+            segment = self._elements[low:high]
+            merge_runs(segment, None, 0, mid - low, high - low)
+            self._elements[low:high] = segment
+        self._track_order(low, high + 1, 1)
 
-            if left_element is not None and right_element is not None:                
-                if left_element < right_element:
-                    temp_container.append(left_element)
-                    left += 1
-                else:
-                    temp_container.append(right_element)
-                    right += 1
-                continue
-            
-            if left_element is not None:
-                temp_container.append(left_element)
-                left += 1
-                continue
+    def nth_element(self, k, low=None, high=None):
+        """
+        Partially sorts the vector[low, high) so that vector[k] is the element that would be there if sorted,
+        with no greater elements before it and no less elements after it, in O(n)
 
-            if right_element is not None:
-                temp_container.append(right_element)
-                right += 1
-                continue
+        Args:
+            k (int): index in [low, high)
+            low (int): starting index
+            high (int): ending index
+        """
+        if low is None or high is None:
+            low, high = 0, self._size
+
+        if not (0 <= low <= high <= self._size and low <= k < high):
+            raise IndexError('index out of range')
 
-        self._elements[low:high] = temp_container
-            
+        self._preserve(low, high)
+        self._track_order(low, high + 1, -1)
+        if self._dtype is not None:
+            self._elements[low:high] = np.partition(self._elements[low:high], k - low)
+        else:
+            segment = self._elements[low:high]
+            select_nth(segment, k - low, 0, high - low)
+            self._elements[low:high] = segment
+        self._track_order(low, high + 1, 1)
+
+    def select(self, k, low=None, high=None):
+        """
+        Gets the element that would be on index k if the vector[low, high) were sorted, in O(n), leaving the vector untouched
 
+        Args:
+            k (int): index in [low, high)
+            low (int): starting index
+            high (int): ending index
+        """
+        if low is None or high is None:
+            low, high = 0, self._size
+
+        if not (0 <= low <= high <= self._size and low <= k < high):
+            raise IndexError('index out of range')
 
+        if self._dtype is not None:
+            return np.partition(self._elements[low:high], k - low)[k - low]
 
-    
+        segment = self._elements[low:high]
+        select_nth(segment, k - low, 0, high - low)
+
+        return segment[k - low]
+
+    def top_k(self, k, key=None, low=None, high=None):
+        """
+        Gets the k largest elements of the vector[low, high) through a bounded heap, in O(n log k)
+
+        Args:
+            k (int): number of elements
+            key (callable): maps element to the key it's compared by, elements are compared directly if None
+            low (int): starting index
+            high (int): ending index
+
+        Returns:
+            list of the k largest elements, descending
+        """
+        if low is None or high is None:
+            low, high = 0, self._size
+
+        if not 0 <= low <= high <= self._size:
+            raise IndexError('starting and ending index out of valid range')
 
+        if k <= 0:
+            return []
+
+        if self._dtype is not None and key is None:
+            segment = self._elements[low:high]
+            if k < len(segment):
+                segment = segment[np.argpartition(segment, len(segment) - k)[len(segment) - k:]]
+            return np.sort(segment, kind='stable')[::-1].tolist()
+
+        # streams over the segment, the heap never holds more than k elements
+        return heapq.nlargest(k, islice(self._elements, low, high), key=key)
+
+
+def _from_array(array):
+    """
+    Wraps a new numpy array as a typed vector without copying it
+    """
+    vector = Vector(max(len(array), 1), dtype=array.dtype)
+    if len(array):
+        vector._elements, vector._size = array, len(array)
+        vector._descents, vector._ascents = None, None
+
+    return vector
+
+
+def override_methods(cls, names, wrap):
+    """
+    Overrides given vector methods on a subclass of vector with wrapped versions, for subclasses whose storage
+    has to be brought into vector layout before the inherited code reads it
+
+    Args:
+        cls (type): subclass of vector
+        names (iterable): names of the vector methods to override, none of which the subclass defines itself
+        wrap (callable): maps vector method to the method the subclass gets
+    """
+    for name in names:
+        method = vars(Vector).get(name)
+        if not callable(method):
+            raise AttributeError('vector has no method {}'.format(name))
+        if name in vars(cls):
+            raise TypeError('{} defines {} itself'.format(cls.__name__, name))
+        setattr(cls, name, wrap(method))
@@ -0,0 +1,206 @@
+import sys
+
+# shifts kept pending before the index is rebuilt instead
+MAX_PENDING_SHIFTS = 32
+# an entry packs position * _SPAN + shifts logged before it, one int instead of a pair
+_SPAN = MAX_PENDING_SHIFTS + 1
+
+
+class VectorIndex(object):
+
+    def __init__(self, vector):
+        """
+        Constructor
+
+        Maps each value of the vector to its positions, kept in acending
+        order so that the least one is first and a given one is found by
+        binary search. Appends and puts update it in O(1) on average;
+        inserts and removes in the middle only log a shift (start, delta),
+        and a stored position is fixed up on lookup by replaying the shifts
+        logged after it was stored, which keeps the order. Any other write
+        drops the positions, and they are rebuilt on the next lookup
+
+        Args:
+            vector (Vector): indexed vector, whose elements must be hashable
+        """
+        self._vector = vector
+        # value to entries in acending order of position, each packing a position with the number of shifts logged before it was stored, None when stale
+        self._positions = None
+        self._shifts = []
+
+    def invalidate(self):
+        """
+        Drops the positions, rebuilt on the next lookup
+        """
+        self._positions = None
+        self._shifts = []
+
+    def _ensure(self):
+        """
+        Rebuilds the positions from the vector if they're stale
+        """
+        if self._positions is not None:
+            return
+
+        size = self._vector.size()
+        values = self._vector.get(0, size) if size else []
+        if self._vector.dtype() is not None and size:
+            values = values.tolist()
+
+        positions = {}
+        try:
+            for i, value in enumerate(values):
+                positions.setdefault(value, []).append(i * _SPAN)
+        except TypeError:
+            raise TypeError('indexed elements must be hashable')
+        self._positions, self._shifts = positions, []
+
+    def _resolve(self, entry):
+        """
+        Replays the shifts logged after the entry was stored
+
+        Returns:
+            current position
+        """
+        position, epoch = divmod(entry, _SPAN)
+        for start, delta in self._shifts[epoch:]:
+            if position >= start:
+                position += delta
+
+        return position
+
+    def _bisect(self, entries, position):
+        """
+        Returns the first k whose entry is on position or beyond
+
+        Args:
+            entries (list): entries in acending order of position
+            position (int): position searched for
+        """
+        low, high = 0, len(entries)
+        while low < high:
+            middle = (low + high) // 2
+            if self._resolve(entries[middle]) < position:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def add(self, value, position):
+        """
+        Records value written on position, after any shift the write caused
+        """
+        if self._positions is None:
+            return
+
+        try:
+            entries = self._positions.setdefault(value, [])
+        except TypeError:
+            # left to the rebuild, which reports the unhashable element
+            self.invalidate()
+            return
+
+        entry = position * _SPAN + len(self._shifts)
+        if not entries or self._resolve(entries[-1]) < position:
+            # appending keeps the order without a search
+            entries.append(entry)
+        else:
+            entries.insert(self._bisect(entries, position), entry)
+
+    def add_many(self, start, values):
+        """
+        Records values written from position start on
+        """
+        if self._positions is None:
+            return
+
+        for k, value in enumerate(values):
+            self.add(value, start + k)
+
+    def discard(self, value, position):
+        """
+        Forgets value on position, before the write overwriting or removing it
+        """
+        if self._positions is None:
+            return
+
+        entries = self._positions.get(value)
+        if entries:
+            k = len(entries) - 1
+            if self._resolve(entries[k]) != position:
+                k = self._bisect(entries, position)
+            if k < len(entries) and self._resolve(entries[k]) == position:
+                del entries[k]
+                if not entries:
+                    del self._positions[value]
+                return
+
+        self.invalidate()
+
+    def discard_many(self, start, values):
+        """
+        Forgets values from position start on
+        """
+        if self._positions is None:
+            return
+
+        for k, value in enumerate(values):
+            self.discard(value, start + k)
+
+    def shift(self, start, delta):
+        """
+        Logs that positions from start on moved by delta
+        """
+        if self._positions is None:
+            return
+
+        if len(self._shifts) >= MAX_PENDING_SHIFTS:
+            self.invalidate()
+        else:
+            self._shifts.append((start, delta))
+
+    def _lookup(self, value):
+        """
+        Returns the stored positions of value, none for unhashable value as it can't equal an indexed one
+        """
+        self._ensure()
+        try:
+            return self._positions.get(value, ())
+        except TypeError:
+            return ()
+
+    def find(self, value):
+        """
+        Returns the least position of value, -1 if not found
+        """
+        entries = self._lookup(value)
+        if not entries:
+            return -1
+
+        return self._resolve(entries[0])
+
+    def count(self, value):
+        """
+        Returns number of positions holding value
+        """
+        return len(self._lookup(value))
+
+    def __contains__(self, value):
+        """
+        Overloads membership test
+        """
+        return len(self._lookup(value)) > 0
+
+    def memory_usage(self):
+        """
+        Returns approximate bytes taken by the index, apart from the values it shares with the vector
+        """
+        if self._positions is None:
+            return sys.getsizeof(self._shifts)
+
+        total = sys.getsizeof(self._positions) + sys.getsizeof(self._shifts)
+        for entries in self._positions.values():
+            total += sys.getsizeof(entries) + sum(sys.getsizeof(entry) for entry in entries)
+
+        return total
@@ -0,0 +1,133 @@
+import numpy as np
+
+# elements saved per copy-on-write chunk
+CHUNK_SIZE = 4096
+# bytes of a list slot, which references its element
+POINTER_SIZE = np.dtype(np.intp).itemsize
+
+
+class VectorSnapshot(object):
+
+    def __init__(self, vector):
+        """
+        Constructor
+
+        A snapshot shares the storage of the vector and reads through to it.
+        Before a write touches indices the snapshot still shares, the vector
+        hands the affected chunks of CHUNK_SIZE elements to the snapshot, so
+        taking a snapshot is O(1) and each write copies at most the chunks it
+        changes, once per snapshot
+
+        Args:
+            vector (Vector): vector to be frozen
+        """
+        self._vector = vector
+        self._length = vector.size()
+        # chunk index to the chunk saved before the vector overwrote it
+        self._chunks = {}
+
+    def _save(self, start, end):
+        """
+        Saves the chunks covering [start, end) that are still shared, called by the vector before writing
+
+        Args:
+            start (int): starting index
+            end (int): ending index
+        """
+        end = min(end, self._length)
+        if start >= end:
+            return
+
+        for chunk in range(start // CHUNK_SIZE, (end + CHUNK_SIZE - 1) // CHUNK_SIZE):
+            if chunk not in self._chunks:
+                low = chunk * CHUNK_SIZE
+                segment = self._vector.get(low, min(low + CHUNK_SIZE, self._length))
+                self._chunks[chunk] = segment.copy() if isinstance(segment, np.ndarray) else list(segment)
+
+    def size(self):
+        """
+        Returns snapshot size
+        """
+        return self._length
+
+    def __len__(self):
+        """
+        Returns snapshot size
+        """
+        return self._length
+
+    def get(self, i, j=None):
+        """
+        Gets element of index [i, j) as it was when the snapshot was taken
+
+        Args:
+            i, j (int): index
+        """
+        if j is None:
+            if not 0 <= i < self._length:
+                raise IndexError('index out of range')
+            chunk = self._chunks.get(i // CHUNK_SIZE)
+            return self._vector.get(i) if chunk is None else chunk[i % CHUNK_SIZE]
+
+        if not 0 <= i < j <= self._length:
+            raise IndexError('invalid index range')
+
+        segments = []
+        for chunk in range(i // CHUNK_SIZE, (j - 1) // CHUNK_SIZE + 1):
+            low = max(i, chunk * CHUNK_SIZE)
+            high = min(j, (chunk + 1) * CHUNK_SIZE)
+            if chunk in self._chunks:
+                offset = chunk * CHUNK_SIZE
+                segments.append(self._chunks[chunk][low - offset:high - offset])
+            else:
+                segments.append(self._vector.get(low, high))
+
+        if self._vector.dtype() is not None:
+            return np.concatenate(segments)
+
+        return [e for segment in segments for e in segment]
+
+    def __getitem__(self, index):
+        """
+        Overloads item indexing
+        """
+        if index < 0:
+            index += self._length
+
+        return self.get(index)
+
+    def __iter__(self):
+        """
+        Iterates over elements chunk by chunk
+        """
+        for low in range(0, self._length, CHUNK_SIZE):
+            for e in self.get(low, min(low + CHUNK_SIZE, self._length)):
+                yield e
+
+    def __str__(self):
+        """
+        Overloads print statement
+        """
+        return '[{}]'.format(','.join(str(e) for e in self))
+
+    def materialize(self):
+        """
+        Copies the snapshot
+
+        Returns:
+            list, or numpy array if the vector is typed
+        """
+        if self._length == 0:
+            return [] if self._vector.dtype() is None else np.empty(0, dtype=self._vector.dtype())
+
+        # segments are joined into a new list or array
+        return self.get(0, self._length)
+
+    def memory_usage(self):
+        """
+        Returns (shared, copied) bytes of element slots, shared with the vector or saved by the snapshot
+        """
+        itemsize = POINTER_SIZE if self._vector.dtype() is None else self._vector.dtype().itemsize
+        copied = sum(len(chunk) for chunk in self._chunks.values())
+
+        return (self._length - copied) * itemsize, copied * itemsize
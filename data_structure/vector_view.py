@@ -0,0 +1,172 @@
+from bisect import bisect_left
+from itertools import islice
+
+import numpy as np
+
+
+class VectorView(object):
+
+    def __init__(self, vector, offset, length):
+        """
+        Constructor
+
+        A view references the segment [offset, offset + length) of the vector
+        without copying it, so later writes through the vector are visible
+
+        Args:
+            vector (Vector): vector whose storage is referenced
+            offset (int): starting index in vector
+            length (int): number of elements in view
+        """
+        self._vector = vector
+        self._offset = offset
+        self._length = length
+
+    def _bounds(self):
+        """
+        Returns (buffer, start, end) of the referenced segment
+
+        Raises:
+            IndexError if the vector has shrunk below the view
+        """
+        if self._offset + self._length > self._vector.size():
+            raise IndexError('view out of vector range')
+
+        return self._vector._buffer(), self._offset, self._offset + self._length
+
+    def size(self):
+        """
+        Returns view size
+        """
+        return self._length
+
+    def __len__(self):
+        """
+        Returns view size
+        """
+        return self._length
+
+    def __getitem__(self, index):
+        """
+        Overloads item indexing
+
+        Args:
+            index (int or slice): index, or slice with step 1 which returns a nested view
+
+        Returns:
+            data saved in the index-th element in view, or view on the slice
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                raise ValueError('view only supports slices with step 1')
+            return VectorView(self._vector, self._offset + start, max(stop - start, 0))
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('index out of range')
+
+        buffer, start, _ = self._bounds()
+        return buffer[start + index]
+
+    def __iter__(self):
+        """
+        Iterates over elements in view
+        """
+        buffer, start, end = self._bounds()
+        return islice(buffer, start, end)
+
+    def __str__(self):
+        """
+        Overloads print statement
+        """
+        return '[{}]'.format(','.join(str(e) for e in self))
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Returns numpy array on the segment, zero-copy if the vector is typed
+        """
+        buffer, start, end = self._bounds()
+        if isinstance(buffer, np.ndarray):
+            return buffer[start:end] if dtype is None else buffer[start:end].astype(dtype)
+
+        return np.array(buffer[start:end], dtype=dtype)
+
+    def memoryview(self):
+        """
+        Returns memoryview on the segment of a typed vector without copying
+
+        The memoryview keeps referencing the current buffer even if the vector reallocates later
+        """
+        buffer, start, end = self._bounds()
+        if not isinstance(buffer, np.ndarray):
+            raise TypeError('memoryview requires a typed vector')
+
+        return memoryview(buffer[start:end])
+
+    def materialize(self):
+        """
+        Copies the segment
+
+        Returns:
+            list, or numpy array if the vector is typed
+        """
+        buffer, start, end = self._bounds()
+        segment = buffer[start:end]
+
+        return segment.copy() if isinstance(segment, np.ndarray) else segment
+
+    def find(self, target):
+        """
+        Finds given target in view
+
+        Args:
+            target (object): target object to be found in view
+
+        Returns:
+            result (int): least index of the target object found in view, -1 if not found
+        """
+        buffer, start, end = self._bounds()
+        if isinstance(buffer, np.ndarray):
+            matches = np.flatnonzero(buffer[start:end] == target)
+            return int(matches[0]) if len(matches) else -1
+
+        for i in range(start, end):
+            if buffer[i] == target:
+                return i - start
+
+        return -1
+
+    def search(self, target):
+        """
+        Finds given target in view, through binary search if the vector is sorted
+
+        Args:
+            target (object): target object to be found in view
+
+        Returns:
+            result (int): index of target object found in view, -1 if not found
+        """
+        buffer, start, end = self._bounds()
+
+        if self._vector.is_acending:
+            if isinstance(buffer, np.ndarray):
+                i = start + int(np.searchsorted(buffer[start:end], target, side='left'))
+            else:
+                i = bisect_left(buffer, target, start, end)
+            return i - start if i < end and buffer[i] == target else -1
+
+        if self._vector.is_descending:
+            low, high = start, end
+            while low < high:
+                mid = (low + high) >> 1
+                if buffer[mid] > target:
+                    low = mid + 1
+                elif buffer[mid] < target:
+                    high = mid
+                else:
+                    return mid - start
+            return -1
+
+        return self.find(target)
@@ -1,6 +1,22 @@
 from .list_tests import TestList
 from .queue_tests import TestQueue
 from .stack_tests import TestStack
-from .vector_tests import TestVector
+from .vector_tests import TestVector, TestTypedVector
 from .binary_tree_tests import TestBinaryTree
-from .graph_tests import TestGraph
\ No newline at end of file
+from .graph_tests import TestGraph
+from .sorting_tests import TestSorting
+from .vector_view_tests import TestVectorView
+from .mapped_vector_tests import TestMappedVector
+from .parallel_sort_tests import TestParallelSort
+from .sorted_vector_tests import TestSortedVector
+from .sparse_vector_tests import TestSparseVector
+from .gap_vector_tests import TestGapVector
+from .vector_snapshot_tests import TestVectorSnapshot
+from .external_sort_tests import TestExternalSort
+from .bloom_filter_tests import TestBloomFilter
+from .dedup_tests import TestDedup
+from .persistent_stack_tests import TestPersistentStack
+from .blocking_queue_tests import TestBlockingQueue
+from .blocking_stack_tests import TestBlockingStack
+from .async_queue_tests import TestAsyncQueue
+from .shared_queue_tests import TestSharedQueue
\ No newline at end of file
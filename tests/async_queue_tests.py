@@ -0,0 +1,130 @@
+import asyncio
+import unittest
+
+from data_structure import AsyncQueue
+
+
+class TestAsyncQueue(unittest.TestCase):
+
+    @classmethod
+    def tearDownClass(self):
+        print ("All tests for async queue completed")
+
+    def test_put_get(self):
+        """Test FIFO order and non-waiting calls"""
+        async def run():
+            queue = AsyncQueue(capacity=3)
+            for x in range(3):
+                await queue.put(x)
+            self.assertEqual(True, queue.full())
+            self.assertRaises(asyncio.QueueFull, queue.put_nowait, 3)
+            self.assertEqual([0, 1, 2], [await queue.get() for _ in range(3)])
+            self.assertRaises(asyncio.QueueEmpty, queue.get_nowait)
+
+        asyncio.run(run())
+
+    def test_backpressure(self):
+        """Test producer waiting on full queue until consumer catches up"""
+        async def run():
+            queue = AsyncQueue(capacity=2)
+            received = []
+
+            async def produce():
+                for x in range(10):
+                    await queue.put(x)
+                    self.assertLessEqual(queue.size(), 2)
+
+            async def consume():
+                for _ in range(10):
+                    received.append(await queue.get())
+                    await asyncio.sleep(0)
+
+            await asyncio.gather(produce(), consume())
+            self.assertEqual(list(range(10)), received)
+
+        asyncio.run(run())
+
+    def test_get_batch(self):
+        """Test getting batches, woken once the batch is there"""
+        async def run():
+            queue = AsyncQueue(capacity=8)
+            batch = asyncio.ensure_future(queue.get_batch(3))
+            for x in range(2):
+                queue.put_nowait(x)
+            await asyncio.sleep(0)
+            self.assertEqual(False, batch.done())
+            queue.put_nowait(2)
+            queue.put_nowait(3)
+            self.assertEqual([0, 1, 2], await batch)
+            # fewer elements on timeout
+            self.assertEqual([3], await queue.get_batch(5, timeout=0.01))
+            self.assertEqual([], await queue.get_batch(5, timeout=0))
+            with self.assertRaises(ValueError):
+                await queue.get_batch(9)
+
+        asyncio.run(run())
+
+    def test_cancel(self):
+        """Test cancelled getter passing its wake-up on"""
+        async def run():
+            queue = AsyncQueue()
+            first = asyncio.ensure_future(queue.get())
+            second = asyncio.ensure_future(queue.get())
+            await asyncio.sleep(0)
+            queue.put_nowait('a')
+            first.cancel()
+            self.assertEqual('a', await second)
+            self.assertEqual(True, first.cancelled())
+
+            # a woken batch getter cancelled before it runs hands its elements on
+            batch = asyncio.ensure_future(queue.get_batch(3))
+            other = asyncio.ensure_future(queue.get_batch(3))
+            await asyncio.sleep(0)
+            for x in range(3):
+                queue.put_nowait(x)
+            batch.cancel()
+            self.assertEqual([0, 1, 2], await asyncio.wait_for(other, 1))
+
+            # timing out hands the elements waited for on
+            batch = asyncio.ensure_future(queue.get_batch(3, timeout=0.01))
+            single = asyncio.ensure_future(queue.get())
+            await asyncio.sleep(0)
+            queue.put_nowait('b')
+            self.assertEqual('b', await asyncio.wait_for(single, 1))
+            self.assertEqual([], await batch)
+
+        asyncio.run(run())
+
+    def test_batch_waiting(self):
+        """Test getters behind a batch still waiting for more being served first"""
+        async def run():
+            queue = AsyncQueue()
+            batch = asyncio.ensure_future(queue.get_batch(10))
+            single = asyncio.ensure_future(queue.get())
+            await asyncio.sleep(0)
+            for x in range(3):
+                queue.put_nowait(x)
+            self.assertEqual(0, await asyncio.wait_for(single, 1))
+            batch.cancel()
+            self.assertEqual([1, 2], await queue.get_batch(2, timeout=0))
+
+        asyncio.run(run())
+
+    def test_join(self):
+        """Test waiting until every element is marked done"""
+        async def run():
+            queue = AsyncQueue()
+            for x in range(4):
+                queue.put_nowait(x)
+
+            async def work():
+                elements = await queue.get_batch(4)
+                await asyncio.sleep(0)
+                queue.task_done(len(elements))
+
+            worker = asyncio.ensure_future(work())
+            await asyncio.wait_for(queue.join(), 1)
+            self.assertEqual(True, worker.done())
+            self.assertRaises(ValueError, queue.task_done)
+
+        asyncio.run(run())
@@ -0,0 +1,67 @@
+import threading
+import unittest
+from queue import Empty, Full
+
+from data_structure import BlockingQueue
+
+
+class TestBlockingQueue(unittest.TestCase):
+
+    @classmethod
+    def tearDownClass(self):
+        print ("All tests for blocking queue completed")
+
+    def setUp(self):
+        self.queue = BlockingQueue(capacity=4)
+
+    def test_put_get(self):
+        """Test FIFO order around the ring buffer"""
+        for round in range(3):
+            for x in range(4):
+                self.queue.put(x)
+            self.assertEqual(True, self.queue.full())
+            self.assertEqual([0, 1, 2, 3], [self.queue.get() for _ in range(4)])
+        self.assertEqual(True, self.queue.empty())
+
+    def test_timeout(self):
+        """Test timing out on full and empty queue"""
+        self.assertRaises(Empty, self.queue.get, timeout=0)
+        self.assertRaises(Empty, self.queue.get, timeout=0.01)
+        for x in range(4):
+            self.queue.put(x, timeout=0)
+        self.assertRaises(Full, self.queue.put, 4, timeout=0.01)
+        self.assertRaises(ValueError, BlockingQueue, 0)
+
+    def test_drain(self):
+        """Test draining available elements at once"""
+        for x in range(4):
+            self.queue.put(x)
+        self.assertEqual([0, 1, 2], self.queue.drain(3))
+        self.assertEqual([3], self.queue.drain())
+        self.assertEqual([], self.queue.drain())
+
+    def test_threads(self):
+        """Test producers and consumers blocking on a small queue"""
+        count, producers, consumers = 500, 3, 3
+        results = []
+        lock = threading.Lock()
+
+        def produce(base):
+            for x in range(count):
+                self.queue.put(base + x)
+
+        def consume():
+            taken = []
+            for _ in range(count):
+                taken.append(self.queue.get(timeout=10))
+            with lock:
+                results.extend(taken)
+
+        threads = [threading.Thread(target=produce, args=(k * count,)) for k in range(producers)]
+        threads += [threading.Thread(target=consume) for _ in range(consumers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(list(range(producers * count)), sorted(results))
+        self.assertEqual(0, self.queue.size())
@@ -0,0 +1,46 @@
+import threading
+import unittest
+from queue import Empty, Full
+
+from data_structure import BlockingStack
+
+
+class TestBlockingStack(unittest.TestCase):
+
+    @classmethod
+    def tearDownClass(self):
+        print ("All tests for blocking stack completed")
+
+    def setUp(self):
+        self.stack = BlockingStack(capacity=4)
+
+    def test_put_get(self):
+        """Test LIFO order and timeouts"""
+        for x in range(4):
+            self.stack.put(x)
+        self.assertRaises(Full, self.stack.put, 4, timeout=0.01)
+        self.assertEqual(3, self.stack.get())
+        self.assertEqual([2, 1], self.stack.drain(2))
+        self.assertEqual([0], self.stack.drain())
+        self.assertRaises(Empty, self.stack.get, timeout=0)
+
+    def test_threads(self):
+        """Test producers and consumers blocking on a small stack"""
+        count = 500
+        results = []
+
+        def produce(base):
+            for x in range(count):
+                self.stack.put(base + x)
+
+        def consume():
+            for _ in range(count):
+                results.append(self.stack.get(timeout=10))
+
+        threads = [threading.Thread(target=produce, args=(k * count,)) for k in range(2)]
+        threads += [threading.Thread(target=consume) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(list(range(2 * count)), sorted(results))
@@ -0,0 +1,36 @@
+import unittest
+
+from data_structure import BloomFilter
+
+
+class TestBloomFilter(unittest.TestCase):
+
+    @classmethod
+    def tearDownClass(self):
+        print ("All tests for bloom filter completed")
+
+    def test_add(self):
+        """Test adding elements, hashable or not"""
+        bloom = BloomFilter(capacity=100)
+        self.assertTrue(bloom.add(1))
+        self.assertFalse(bloom.add(1))
+        self.assertTrue(bloom.add([1, 2]))
+        self.assertIn([1, 2], bloom)
+        self.assertIn(1, bloom)
+        self.assertEqual(2, len(bloom))
+
+    def test_error_rate(self):
+        """Test no false negatives and false positives below the error rate beyond capacity"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(10000):
+            bloom.add(i)
+        self.assertTrue(all(i in bloom for i in range(10000)))
+        false_positives = sum(i in bloom for i in range(10000, 30000))
+        self.assertLess(false_positives, 20000 * 0.01)
+        # grown slices make it larger than one sized for the capacity
+        self.assertGreater(bloom.memory_usage(), BloomFilter(capacity=1000).memory_usage())
+
+    def test_invalid(self):
+        """Test invalid arguments"""
+        self.assertRaises(ValueError, BloomFilter, 0)
+        self.assertRaises(ValueError, BloomFilter, 10, 1.5)
@@ -0,0 +1,97 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from data_structure import GapVector, List, Queue, SparseVector, Vector
+from data_structure.dedup import unique, unique_exact
+
+
+def first_occurrences(iterable):
+    seen = []
+    for e in iterable:
+        if e not in seen:
+            seen.append(e)
+    return seen
+
+
+class TestDedup(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        random.seed(0)
+        self.random_list = [random.randint(0, 300) for _ in range(2000)]
+
+    @classmethod
+    def tearDownClass(self):
+        print ("All tests for dedup completed")
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_exact(self):
+        """Test exact dedup keeping first occurrences in order"""
+        self.assertEqual(first_occurrences(self.random_list), list(unique(self.random_list)))
+        self.assertEqual([], list(unique([])))
+
+    def test_exact_equality(self):
+        """Test hashable elements compared by == as in Vector.deduplicate"""
+        elements = [random.choice([0, 1, 2, 1.0, 2.0, True, False, 'a', (1,)]) for _ in range(200)]
+        vector = Vector(initial_iter=elements)
+        vector.deduplicate()
+        self.assertEqual(vector.get(0, vector.size()), list(unique(elements)))
+        self.assertEqual([1, {1: 2}], list(unique([1, 1.0, True, {1: 2}, {1: 2}])))
+        # hashable elements needn't be picklable until they are spilled
+        local = lambda: None
+        self.assertEqual([local, 1], list(unique([local, 1, local])))
+
+    def test_exact_spill(self):
+        """Test exact dedup spilling to disk and merging runs"""
+        result = unique_exact(self.random_list, max_items=7, temp_dir=self.directory)
+        self.assertEqual(first_occurrences(self.random_list), list(result))
+        self.assertEqual([], os.listdir(self.directory))
+
+        # closing early removes the spilled runs as well
+        result = unique_exact(self.random_list, max_items=3, temp_dir=self.directory)
+        for _ in range(10):
+            next(result)
+        self.assertNotEqual([], os.listdir(self.directory))
+        result.close()
+        self.assertEqual([], os.listdir(self.directory))
+
+    def test_unhashable_and_key(self):
+        """Test unhashable elements and keys"""
+        elements = [[1, 2], [3], [1, 2], {'a': 1}, [3], {'a': 1}]
+        self.assertEqual([[1, 2], [3], {'a': 1}], list(unique(elements, max_items=2, temp_dir=self.directory)))
+        self.assertEqual([[1, 2], [3]], list(unique(elements[:3], key=len)))
+        self.assertEqual(['a', 'B'], list(unique(['a', 'A', 'B', 'b'], 'sorted', key=str.lower)))
+
+    def test_approximate(self):
+        """Test approximate dedup never keeping a duplicate"""
+        result = list(unique(self.random_list, 'approximate', capacity=50, error_rate=0.01))
+        expected = first_occurrences(self.random_list)
+        self.assertEqual(len(result), len(set(result)))
+        # kept elements stay in order of first occurrence
+        self.assertEqual([e for e in expected if e in set(result)], result)
+        self.assertGreaterEqual(len(result), len(expected) * 0.95)
+
+    def test_sorted(self):
+        """Test dropping adjacent duplicates"""
+        self.assertEqual(sorted(set(self.random_list)), list(unique(sorted(self.random_list), 'sorted')))
+        self.assertEqual([1, 2, 1], list(unique([1, 1, 2, 2, 1], 'sorted')))
+        self.assertRaises(ValueError, unique, [], 'fuzzy')
+
+    def test_copy_from(self):
+        """Test dedup while copying into vectors and lists"""
+        expected = first_occurrences(self.random_list)
+        for vector in (Vector(), Vector(dtype='i8'), GapVector(), SparseVector(), Queue()):
+            vector.copy_from(self.random_list, dedup='exact')
+            self.assertEqual(expected, list(vector.get(0, vector.size())))
+        linked = List()
+        linked.copy_from(sorted(self.random_list), dedup='sorted')
+        self.assertEqual(sorted(set(self.random_list)), [linked[i] for i in range(len(linked))])
+        self.assertEqual(len(set(self.random_list)), len(linked))
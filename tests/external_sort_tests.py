@@ -0,0 +1,65 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from data_structure.external_sort import external_sort, external_sort_file, read_run
+
+
+def first(pair):
+    return pair[0]
+
+
+class TestExternalSort(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        random.seed(0)
+        self.random_list = [random.randint(0, 20) for _ in range(1000)]
+
+    @classmethod
+    def tearDownClass(self):
+        print ("All tests for external sort completed")
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_objects(self):
+        """Test sorting python objects through several merge passes"""
+        # 64 elements per chunk and fan in 2 give 16 runs merged in 4 passes
+        result = external_sort(self.random_list, memory_budget=64 * 2 * 36, fan_in=2, temp_dir=self.directory)
+        self.assertEqual(sorted(self.random_list), list(result))
+        self.assertEqual([], os.listdir(self.directory))
+
+    def test_stable(self):
+        """Test equal keys keep input order, acendingly and descendingly"""
+        pairs = [(x, i) for i, x in enumerate(self.random_list)]
+        for reverse in (False, True):
+            result = external_sort(pairs, key=first, reverse=reverse, memory_budget=4096, fan_in=3)
+            self.assertEqual(sorted(pairs, key=first, reverse=reverse), list(result))
+
+    def test_typed(self):
+        """Test sorting typed values through block merge"""
+        for reverse in (False, True):
+            result = list(external_sort(self.random_list, dtype='i4', reverse=reverse, memory_budget=800, fan_in=4))
+            self.assertEqual(sorted(self.random_list, reverse=reverse), result)
+        self.assertRaises(ValueError, list, external_sort(self.random_list, dtype='i4', key=first))
+        self.assertRaises(ValueError, list, external_sort(self.random_list, fan_in=1))
+        self.assertEqual([], list(external_sort([])))
+
+    def test_file(self):
+        """Test sorting a file of raw values into another file"""
+        data = np.random.RandomState(0).random_sample(5000)
+        input_path = os.path.join(self.directory, 'input.bin')
+        output_path = os.path.join(self.directory, 'output.bin')
+        data.tofile(input_path)
+        external_sort_file(input_path, output_path, dtype='f8', memory_budget=8000, fan_in=4)
+        self.assertEqual(np.sort(data).tolist(), np.fromfile(output_path, dtype='f8').tolist())
+        blocks = list(read_run(output_path, dtype='f8', block_size=2000))
+        self.assertEqual([2000, 2000, 1000], [len(block) for block in blocks])
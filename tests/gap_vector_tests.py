@@ -0,0 +1,62 @@
+import unittest
+
+from data_structure import GapVector, Vector
+
+
+class TestGapVector(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.initial_list = [i for i in range(10)]
+
+    @classmethod
+    def tearDownClass(self):
+        print ("All tests for gap vector completed")
+
+    def setUp(self):
+        self.vector = GapVector(16, 0, initial_iter=self.initial_list)
+
+    def test_insert(self):
+        """Test inserting around the cursor"""
+        for x in 'abc':
+            self.vector.insert(3 + 'abc'.index(x), x)
+        self.assertEqual(6, self.vector._gap)
+        self.assertEqual([0,1,2,'a','b','c',3,4,5,6,7,8,9], list(self.vector))
+        self.assertEqual(True, isinstance(self.vector, Vector))
+
+    def test_remove(self):
+        """Test removing around the cursor"""
+        self.vector.remove(5)
+        self.vector.remove(4)
+        self.vector.partial_remove(2, 4)
+        self.assertEqual(2, self.vector._gap)
+        self.assertEqual([0,1,6,7,8,9], list(self.vector))
+        self.assertEqual(6, self.vector.size())
+
+    def test_indexing(self):
+        """Test index translation across the gap"""
+        self.vector.insert(4, 'x')
+        self.assertEqual('x', self.vector[4])
+        self.assertEqual(4, self.vector.get(5))
+        self.assertEqual(9, self.vector[-1])
+        self.vector.put(10, 'y')
+        self.vector[0] = 'z'
+        self.assertEqual(['z',1,2,3,'x',4,5,6,7,8,'y'], self.vector.get(0, self.vector.size()))
+        self.assertRaises(IndexError, self.vector.get, 11)
+
+    def test_growth(self):
+        """Test growing with the gap in the middle"""
+        for x in range(20):
+            self.vector.insert(5, x)
+        self.assertEqual(30, self.vector.size())
+        self.assertEqual([0,1,2,3,4] + list(range(19, -1, -1)) + [5,6,7,8,9], list(self.vector))
+
+    def test_vector_operations(self):
+        """Test other operations see the elements in order"""
+        self.vector.insert(2, 11)
+        self.vector.append(12)
+        self.assertEqual(2, self.vector.find(11))
+        self.vector.mergesort()
+        self.assertEqual(None, self.vector._gap)
+        self.assertEqual(list(range(10)) + [11,12], list(self.vector))
+        self.assertEqual(11, self.vector.search(12))
@@ -0,0 +1,79 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from data_structure import MappedVector
+
+
+class TestMappedVector(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.initial_list = [i for i in range(5)]
+
+    @classmethod
+    def tearDownClass(self):
+        print ("All tests for mapped vector completed")
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'vector.bin')
+        self.vector = MappedVector(self.path, dtype='i8', default_capacity=4, initial_iter=self.initial_list)
+
+    def tearDown(self):
+        self.vector.close()
+        shutil.rmtree(self.directory)
+
+    def test_append(self):
+        """Test appending grows the file"""
+        self.assertEqual(8, self.vector.capacity())
+        for x in range(5, 20):
+            self.vector.append(x)
+        self.assertEqual(20, self.vector.size())
+        self.assertEqual(32, self.vector.capacity())
+        self.assertEqual(64 + 32 * 8, os.path.getsize(self.path))
+        self.assertEqual(list(range(20)), self.vector.get(0, 20).tolist())
+
+    def test_put_get(self):
+        """Test updating and reading elements"""
+        self.vector.put(2, 20)
+        self.assertEqual(20, self.vector.get(2))
+        self.assertEqual([1, 20, 3], self.vector.get(1, 4).tolist())
+        self.assertRaises(IndexError, self.vector.get, 5)
+
+    def test_binary_search(self):
+        """Test binary search against mapped file"""
+        self.assertEqual(3, self.vector.binary_search_acending(3))
+        self.assertEqual(-1, self.vector.binary_search_acending(7))
+        self.assertEqual(4, self.vector.search(4))
+
+    def test_reopen(self):
+        """Test reopening keeps size, capacity, dtype and elements"""
+        self.vector.append(5)
+        self.vector.close()
+        self.vector = MappedVector(self.path, dtype='f8')
+        self.assertEqual('int64', self.vector.dtype().name)
+        self.assertEqual(6, self.vector.size())
+        self.assertEqual(8, self.vector.capacity())
+        self.assertEqual(list(range(6)), self.vector.get(0, 6).tolist())
+        self.assertEqual(True, self.vector.is_acending)
+
+    def test_shrink(self):
+        """Test shrinking the file"""
+        self.vector.shrink_to_fit()
+        self.assertEqual(5, self.vector.capacity())
+        self.assertEqual(64 + 5 * 8, os.path.getsize(self.path))
+        self.assertEqual(list(range(5)), self.vector.get(0, 5).tolist())
+
+        memory = self.vector.view(0, 2).memoryview()
+        self.vector.remove_range(0, 3)
+        self.assertRaises(BufferError, self.vector.shrink_to_fit)
+        memory.release()
+        self.vector.shrink_to_fit()
+        self.assertEqual(2, self.vector.capacity())
+
+
+if __name__ == '__main__':
+
+    unittest.main(verbosity=1)
@@ -0,0 +1,75 @@
+import random
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from data_structure import Vector
+from data_structure import parallel_sort
+from data_structure.parallel_sort import chunk_bounds, merge_sorted_arrays, parallel_merge_sort
+
+
+def first(pair):
+    return pair[0]
+
+
+class TestParallelSort(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        random.seed(0)
+        self.random_list = [random.randint(0, 20) for _ in range(200)]
+
+    @classmethod
+    def tearDownClass(self):
+        print ("All tests for parallel sort completed")
+
+    def setUp(self):
+        # lets small inputs go through the process pool
+        self.patcher = mock.patch.object(parallel_sort, 'MIN_CHUNK_SIZE', 10)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_chunk_bounds(self):
+        """Test splitting into chunks"""
+        self.assertEqual([(0, 3), (3, 6), (6, 10)], chunk_bounds(10, 3))
+        self.assertEqual([(0, 1), (1, 2)], chunk_bounds(2, 4))
+
+    def test_merge_sorted_arrays(self):
+        """Test merging sorted numpy arrays"""
+        merged = merge_sorted_arrays(np.array([1, 3, 3, 7]), np.array([0, 3, 8]))
+        self.assertEqual([0, 1, 3, 3, 3, 7, 8], merged.tolist())
+
+    def test_objects(self):
+        """Test stable parallel sort of python objects"""
+        pairs = [(x, i) for i, x in enumerate(self.random_list)]
+        self.assertEqual(sorted(pairs, key=first), parallel_merge_sort(pairs, key=first, workers=4))
+        self.assertEqual(sorted(pairs, key=first, reverse=True),
+                         parallel_merge_sort(pairs, key=first, reverse=True, workers=3))
+
+    def test_typed(self):
+        """Test parallel sort of numpy array in shared memory"""
+        elements = np.array(self.random_list, dtype='i8')
+        self.assertEqual(sorted(self.random_list), parallel_merge_sort(elements, workers=4).tolist())
+        self.assertEqual(sorted(self.random_list, reverse=True),
+                         parallel_merge_sort(elements, reverse=True, workers=2).tolist())
+        self.assertRaises(ValueError, parallel_merge_sort, elements, key=abs)
+
+    def test_vector(self):
+        """Test sorting vector segment in parallel"""
+        vector = Vector(initial_iter=self.random_list)
+        vector.parallel_sort(workers=2)
+        self.assertEqual(sorted(self.random_list), vector.get(0, vector.size()))
+        self.assertEqual(True, vector.is_acending)
+
+        vector = Vector(dtype='f8', initial_iter=self.random_list)
+        vector.parallel_sort(50, 150, reverse=True, workers=2)
+        expected = self.random_list[:50] + sorted(self.random_list[50:150], reverse=True) + self.random_list[150:]
+        self.assertEqual(expected, vector.get(0, vector.size()).tolist())
+
+
+if __name__ == '__main__':
+
+    unittest.main(verbosity=1)
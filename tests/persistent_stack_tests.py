@@ -0,0 +1,56 @@
+import unittest
+
+from data_structure import PersistentStack, Stack, Vector
+
+
+class TestPersistentStack(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.initial_list = [i for i in range(5)]
+
+    @classmethod
+    def tearDownClass(self):
+        print ("All tests for persistent stack completed")
+
+    def setUp(self):
+        self.stack = PersistentStack(self.initial_list)
+
+    def test_push_pop(self):
+        """Test versions staying unchanged by pushes and pops"""
+        pushed = self.stack.push(5)
+        popped = self.stack.pop()
+        self.assertEqual(5, pushed.top())
+        self.assertEqual(3, popped.top())
+        self.assertEqual(4, self.stack.top())
+        self.assertEqual([0, 1, 2, 3, 4], self.stack.to_list())
+        self.assertEqual(6, len(pushed))
+        self.assertEqual(4, popped.size())
+        # branches share the cells below their top
+        self.assertIs(self.stack._cell, pushed.pop()._cell)
+        self.assertIs(popped._cell, self.stack._cell[1])
+
+    def test_empty(self):
+        """Test popping and peeking on empty stack"""
+        stack = PersistentStack()
+        self.assertEqual(True, stack.empty())
+        self.assertRaises(IndexError, stack.pop)
+        self.assertRaises(IndexError, stack.top)
+        self.assertRaises(IndexError, stack.pop_many, 1)
+
+    def test_batches(self):
+        """Test pushing and popping batches"""
+        pushed = self.stack.push_many([5, 6])
+        self.assertEqual([6, 5, 4, 3, 2, 1, 0], list(pushed))
+        self.assertEqual([0, 1], pushed.pop_many(5).to_list())
+        self.assertEqual(True, pushed.pop_many(7).empty())
+        self.assertEqual('[0,1,2,3,4]', str(self.stack))
+
+    def test_conversion(self):
+        """Test converting to and from Stack and Vector"""
+        stack = self.stack.to_stack()
+        self.assertEqual(4, stack.pop())
+        self.assertEqual(True, self.stack.to_vector().compare_with_iterable(self.initial_list))
+        self.assertEqual([0, 1, 2, 3], PersistentStack(stack).to_list())
+        self.assertEqual(0, PersistentStack(Vector()).size())
+        self.assertEqual(0, self.stack.to_stack(track_min=True).min())
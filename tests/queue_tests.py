@@ -50,7 +50,93 @@ class TestQueue(unittest.TestCase):
             self.assertEqual(x, self.queue.dequeue())
 
         self.assertEqual(0, self.queue.size())
-        
+
+    def test_wraparound(self):
+        """
+        Test interleaving enqueue and dequeue across the buffer boundary
+        """
+        expected = [4, 3, 2, 1, 0] + list(range(5, 40))
+        for x in range(5, 40):
+            self.queue.enqueue(x)
+            self.assertEqual(expected[x - 5], self.queue.dequeue())
+            self.assertEqual(x, self.queue.tail())
+
+        self.assertEqual(5, self.queue.size())
+        self.assertEqual(8, self.queue._capacity)
+        self.assertEqual(35, self.queue.head())
+        self.assertEqual([39, 38, 37, 36, 35], self.queue.get(0, 5))
+        self.assertEqual(37, self.queue[2])
+
+    def test_indexing(self):
+        """
+        Test indexing within size across the buffer boundary
+        """
+        for x in range(5, 8):
+            self.queue.enqueue(x)
+            self.queue.dequeue()
+        self.assertEqual([7, 6, 5, 0, 1], list(self.queue))
+        self.assertEqual(1, self.queue[-1])
+        # reading without the buffer leaves it wrapped
+        offset = self.queue._offset
+        self.assertEqual(None, self.queue.dtype())
+        self.assertEqual(offset, self.queue._offset)
+        self.queue[-5] = 9
+        self.assertEqual(9, self.queue.tail())
+        self.assertIn(0, self.queue)
+        self.assertNotIn(2, self.queue)
+        self.assertRaises(IndexError, self.queue.__getitem__, 5)
+        self.assertRaises(IndexError, self.queue.__getitem__, -6)
+        self.assertRaises(IndexError, self.queue.__setitem__, 5, 0)
+
+    def test_dequeue_many(self):
+        """
+        Test popping blocks, wrapped around the buffer boundary or not
+        """
+        for dtype in (None, 'i8'):
+            queue = Queue(8, dtype=dtype)
+            for x in range(6):
+                queue.enqueue(x)
+            self.assertEqual([0, 1, 2], list(queue.dequeue_many(3)))
+            for x in range(6, 10):
+                queue.enqueue(x)
+            self.assertEqual([3, 4, 5, 6, 7], list(queue.dequeue_many(5)))
+            self.assertEqual([], list(queue.dequeue_many(0)))
+            self.assertEqual([8, 9], list(queue.dequeue_many(2)))
+            self.assertRaises(IndexError, queue.dequeue_many, 1)
+
+    def test_growth(self):
+        """
+        Test growing a wrapped buffer keeps FIFO order
+        """
+        self.queue.dequeue()
+        self.queue.dequeue()
+        for x in range(5, 25):
+            self.queue.enqueue(x)
+
+        self.assertEqual(23, self.queue.size())
+        self.assertEqual(32, self.queue._capacity)
+        for x in [2, 1, 0] + list(range(5, 25)):
+            self.assertEqual(x, self.queue.dequeue())
+
+        self.assertEqual(True, self.queue.empty())
+        self.assertRaises(IndexError, self.queue.dequeue)
+
+
+    def test_shrink(self):
+        """
+        Test draining a wrapped queue gives space back
+        """
+        queue = Queue(4, shrink_threshold=0.25)
+        for x in range(3):
+            queue.enqueue(x)
+            queue.dequeue()
+        for x in range(64):
+            queue.enqueue(x)
+        self.assertEqual(64, queue.capacity())
+        for x in range(60):
+            self.assertEqual(x, queue.dequeue())
+        self.assertEqual(16, queue.capacity())
+        self.assertEqual([63, 62, 61, 60], queue.get(0, 4))
 
 
 if __name__ == '__main__':
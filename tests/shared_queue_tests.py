@@ -0,0 +1,148 @@
+import multiprocessing
+import unittest
+from queue import Empty, Full
+
+import numpy as np
+
+from data_structure import SharedQueue
+
+RECORD = [('id', 'i8'), ('value', 'f8')]
+
+
+def produce(queue, base, count):
+    for x in range(base, base + count):
+        queue.put((x, x / 2))
+    queue.close()
+
+
+def produce_batches(queue, count, batch):
+    for start in range(0, count, batch):
+        queue.put_many(np.arange(start, min(start + batch, count)))
+    queue.close()
+
+
+def consume(queue, results, count):
+    taken = 0
+    total = 0
+    while taken < count:
+        view = queue.acquire(timeout=10)
+        records = np.asarray(view)
+        taken += len(records)
+        total += int(records.sum())
+        del records
+        view.release()
+        queue.release()
+    results.put(total)
+    queue.close()
+    results.close()
+
+
+class TestSharedQueue(unittest.TestCase):
+
+    @classmethod
+    def tearDownClass(self):
+        print ("All tests for shared queue completed")
+
+    def setUp(self):
+        self.queue = SharedQueue(RECORD, capacity=4)
+
+    def tearDown(self):
+        self.queue.close()
+        self.queue.unlink()
+
+    def test_put_get(self):
+        """Test FIFO order of typed records around the ring buffer"""
+        for round in range(3):
+            for x in range(4):
+                self.queue.put((x, x / 2))
+            self.assertEqual(True, self.queue.full())
+            records = [self.queue.get() for _ in range(4)]
+            self.assertEqual([0, 1, 2, 3], [int(record['id']) for record in records])
+            self.assertEqual(1.5, records[3]['value'])
+        self.assertEqual(True, self.queue.empty())
+        self.assertEqual(np.dtype(RECORD), self.queue.dtype())
+
+    def test_timeout(self):
+        """Test timing out on full and empty queue"""
+        self.assertRaises(Empty, self.queue.get, timeout=0)
+        self.assertRaises(Empty, self.queue.get_many, timeout=0.01)
+        self.assertRaises(Empty, self.queue.acquire, timeout=0)
+        for x in range(4):
+            self.queue.put((x, 0), timeout=0)
+        self.assertRaises(Full, self.queue.put, (4, 0), timeout=0.01)
+        self.assertRaises(Full, self.queue.put_many, [(4, 0)], timeout=0)
+        self.assertRaises(ValueError, self.queue.put_many, [(0, 0)] * 5)
+        self.assertRaises(ValueError, SharedQueue, 'i8', 0)
+        self.assertRaises(ValueError, SharedQueue, object)
+
+    def test_batches(self):
+        """Test batches wrapping around the ring buffer"""
+        self.queue.put_many([(0, 0), (1, 0), (2, 0)])
+        self.assertEqual([0, 1], list(self.queue.get_many(2)['id']))
+        self.queue.put_many([(3, 0), (4, 0), (5, 0)])
+        self.assertRaises(Full, self.queue.put_many, [(6, 0)] * 2, timeout=0)
+        self.assertEqual(4, self.queue.size())
+        self.assertEqual([2, 3, 4, 5], list(self.queue.get_many()['id']))
+        self.queue.put_many([])
+        self.assertEqual(0, self.queue.size())
+
+    def test_acquire_release(self):
+        """Test reading records in place until they are released"""
+        self.queue.put_many([(0, 0), (1, 0), (2, 0)])
+        self.queue.get_many(2)
+        self.queue.put_many([(3, 0), (4, 0), (5, 0)])
+        # the view stops on the last slot of the ring
+        view = self.queue.acquire()
+        self.assertEqual([2, 3], list(np.asarray(view)['id']))
+        self.assertRaises(RuntimeError, self.queue.get)
+        self.assertRaises(ValueError, self.queue.release, 3)
+        self.queue.release(1)
+        view.release()
+        self.assertEqual(3, self.queue.size())
+        view = self.queue.acquire(max_items=1)
+        self.assertEqual([3], list(np.asarray(view)['id']))
+        view.release()
+        self.queue.release()
+        self.assertRaises(RuntimeError, self.queue.release)
+        self.assertEqual([4, 5], list(self.queue.get_many()['id']))
+
+    def test_processes(self):
+        """Test a producer process feeding a consumer process in batches"""
+        count = 5000
+        queue = SharedQueue('i8', capacity=64)
+        results = SharedQueue('i8', capacity=1)
+        processes = [
+            multiprocessing.Process(target=produce_batches, args=(queue, count, 48)),
+            multiprocessing.Process(target=consume, args=(queue, results, count))]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(30)
+        self.assertEqual([0, 0], [process.exitcode for process in processes])
+        self.assertEqual(count * (count - 1) // 2, int(results.get(timeout=0)))
+        self.assertEqual(True, queue.empty())
+        for shared in (queue, results):
+            shared.close()
+            shared.unlink()
+
+    def test_multiple_producers(self):
+        """Test several producer processes sharing the tail"""
+        count, producers = 1000, 3
+        queue = SharedQueue(RECORD, capacity=16, multi_producer=True, multi_consumer=True)
+        processes = [multiprocessing.Process(target=produce, args=(queue, k * count, count))
+                     for k in range(producers)]
+        for process in processes:
+            process.start()
+        ids = []
+        while len(ids) < count * producers:
+            ids.extend(queue.get_many(timeout=10)['id'].tolist())
+        for process in processes:
+            process.join(30)
+        self.assertEqual([0] * producers, [process.exitcode for process in processes])
+        self.assertEqual(list(range(count * producers)), sorted(ids))
+        # each producer's records keep their order
+        for k in range(producers):
+            mine = [x for x in ids if k * count <= x < (k + 1) * count]
+            self.assertEqual(sorted(mine), mine)
+        queue.close()
+        queue.unlink()
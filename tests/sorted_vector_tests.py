@@ -0,0 +1,108 @@
+import unittest
+
+from data_structure import SortedVector, Vector
+
+
+class TestSortedVector(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.random_list = [5,1,4,2,3,4]
+
+    @classmethod
+    def tearDownClass(self):
+        print ("All tests for sorted vector completed")
+
+    def setUp(self):
+        self.vector = SortedVector(8, initial_iter=self.random_list)
+
+    def test_constructor(self):
+        """Test initial elements are sorted"""
+        self.assertEqual([1,2,3,4,4,5], self.vector.get(0, self.vector.size()))
+        self.assertEqual(True, isinstance(self.vector, Vector))
+
+    def test_add(self):
+        """Test binary-search insertion"""
+        self.assertEqual(5, self.vector.add(4))
+        self.assertEqual(0, self.vector.add(0))
+        self.assertEqual(8, self.vector.add(9))
+        self.assertEqual([0,1,2,3,4,4,4,5,9], self.vector.get(0, self.vector.size()))
+        self.assertEqual(True, self.vector.is_acending)
+
+    def test_bounds(self):
+        """Test lower and upper bound"""
+        self.assertEqual(3, self.vector.lower_bound(4))
+        self.assertEqual(5, self.vector.upper_bound(4))
+        self.assertEqual(0, self.vector.lower_bound(-1))
+        self.assertEqual(6, self.vector.upper_bound(7))
+
+    def test_range(self):
+        """Test counting and iterating over range"""
+        self.assertEqual(4, self.vector.count_range(2, 4.5))
+        self.assertEqual(0, self.vector.count_range(4, 2))
+        self.assertEqual(2, SortedVector(initial_iter=[1, 3, 2, 3]).count(3))
+        self.assertEqual([2,3,4,4], list(self.vector.irange(2, 5)))
+        self.assertEqual([4,4,5], list(self.vector.irange(low=4)))
+        self.assertEqual([], list(self.vector.irange(3, 1)))
+
+    def test_search(self):
+        """Test finding elements"""
+        self.assertEqual(3, self.vector.search(4))
+        self.assertEqual(3, self.vector.find(4))
+        self.assertEqual(-1, self.vector.find(6))
+        self.assertEqual(True, 5 in self.vector)
+
+    def test_selection(self):
+        """Test selection keeps order"""
+        self.vector.nth_element(2)
+        self.assertEqual([1,2,3,4,4,5], self.vector.get(0, self.vector.size()))
+        self.assertEqual(4, self.vector.select(3))
+        self.assertEqual([5, 4], self.vector.top_k(2))
+
+    def test_merge_sorted(self):
+        """Test merging another sorted vector and unsorted iterables"""
+        self.vector.merge_sorted(SortedVector(initial_iter=[0, 4, 6]))
+        self.assertEqual([0,1,2,3,4,4,4,5,6], self.vector.get(0, self.vector.size()))
+        self.vector.extend([10, -1])
+        self.assertEqual([-1,0,1,2,3,4,4,4,5,6,10], self.vector.get(0, self.vector.size()))
+
+    def test_order_invariant(self):
+        """Test updates breaking order are rejected"""
+        self.assertRaises(ValueError, self.vector.append, 0)
+        self.assertRaises(ValueError, self.vector.put, 0, 3)
+        self.assertRaises(ValueError, self.vector.insert, 2, 9)
+        self.assertRaises(ValueError, self.vector.insert_many, 2, [2, 1])
+        self.assertRaises(ValueError, self.vector.permute)
+        self.assertRaises(ValueError, self.vector.mergesort, acending=False)
+        self.vector.put(0, 0)
+        self.vector.insert(6, 7)
+        self.vector.insert_many(2, [2.5, 3])
+        self.assertEqual([0,2,2.5,3,3,4,4,5,7], self.vector.get(0, self.vector.size()))
+
+    def test_typed(self):
+        """Test typed sorted vector"""
+        vector = SortedVector(dtype='i8', initial_iter=self.random_list)
+        self.assertEqual([1,2,3,4,4,5], vector.get(0, vector.size()).tolist())
+        vector.add(3)
+        vector.merge_sorted([6, 0])
+        self.assertEqual([0,1,2,3,3,4,4,5,6], vector.get(0, vector.size()).tolist())
+        self.assertEqual(2, vector.count_range(4, 5))
+
+    def test_inplace_arithmetic(self):
+        """Test adding elements after in-place operators"""
+        vector = SortedVector(dtype='i8', initial_iter=self.random_list)
+        vector += 1
+        vector.add(4)
+        self.assertEqual([2,3,4,4,5,5,6], vector.get(0, vector.size()).tolist())
+        with self.assertRaises(ValueError):
+            vector *= -1
+        vector.add(7)
+        vector.insert(0, 1)
+        self.assertEqual([1,2,3,4,4,5,5,6,7], vector.get(0, vector.size()).tolist())
+        self.assertEqual(True, vector.is_acending)
+        self.assertEqual(False, vector.is_descending)
+
+
+if __name__ == '__main__':
+
+    unittest.main(verbosity=1)
@@ -0,0 +1,98 @@
+import random
+import unittest
+
+import numpy as np
+
+from data_structure.sorting import counting_sort_array, insertion_sort, integer_sort, merge_runs, merge_sort, select_nth
+
+
+class TestSorting(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        random.seed(0)
+        self.random_list = [random.randint(0, 50) for _ in range(500)]
+
+    @classmethod
+    def tearDownClass(self):
+        print ("All tests for sorting completed")
+
+    def test_insertion_sort(self):
+        """Test binary insertion sort on a segment"""
+        elements = [5,1,4,2,3]
+        insertion_sort(elements, None, 1, 4)
+        self.assertEqual([5,1,2,4,3], elements)
+
+    def test_merge_runs(self):
+        """Test merging two sorted runs"""
+        elements = [1,3,5,7,2,4,6,8]
+        merge_runs(elements, None, 0, 4, 8)
+        self.assertEqual([1,2,3,4,5,6,7,8], elements)
+
+        # galloping over long winning streaks
+        elements = list(range(0, 40, 2)) + list(range(100)) + [200]
+        merge_runs(elements, None, 0, 20, len(elements))
+        self.assertEqual(sorted(elements), elements)
+
+    def test_merge_sort(self):
+        """Test bottom-up mergesort"""
+        elements = list(self.random_list)
+        merge_sort(elements)
+        self.assertEqual(sorted(self.random_list), elements)
+        merge_sort(elements, reverse=True)
+        self.assertEqual(sorted(self.random_list, reverse=True), elements)
+
+    def test_stable(self):
+        """Test equal keys keep original order with key and reverse"""
+        pairs = [(x, i) for i, x in enumerate(self.random_list)]
+        elements = list(pairs)
+        merge_sort(elements, key=lambda pair: pair[0])
+        self.assertEqual(sorted(pairs, key=lambda pair: pair[0]), elements)
+        elements = list(pairs)
+        merge_sort(elements, key=lambda pair: pair[0], reverse=True)
+        self.assertEqual(sorted(pairs, key=lambda pair: pair[0], reverse=True), elements)
+
+    def test_integer_sort(self):
+        """Test counting and radix sort on ints"""
+        for elements in (list(self.random_list), [random.randint(-2 ** 31, 2 ** 20) for _ in range(500)]):
+            for reverse in (False, True):
+                result = list(elements)
+                self.assertEqual(True, integer_sort(result, reverse=reverse))
+                self.assertEqual(sorted(elements, reverse=reverse), result)
+
+        elements = [3, 1.5, 2]
+        self.assertEqual(False, integer_sort(elements))
+        self.assertEqual(False, integer_sort([True, False]))
+        self.assertEqual(False, integer_sort([0, 2 ** 40]))
+        self.assertEqual([3, 1.5, 2], elements)
+
+    def test_counting_sort_array(self):
+        """Test counting sort on integer arrays"""
+        elements = np.array(self.random_list, dtype='i4')
+        self.assertEqual(sorted(self.random_list), counting_sort_array(elements).tolist())
+        self.assertEqual(sorted(self.random_list, reverse=True), counting_sort_array(elements, reverse=True).tolist())
+        self.assertEqual(None, counting_sort_array(np.array([0, 2 ** 40])))
+        for dtype in ('i1', 'i2'):
+            wide = np.array([100, -100, 5, 127, -128], dtype=dtype)
+            self.assertEqual([-128, -100, 5, 100, 127], counting_sort_array(wide).tolist())
+        self.assertEqual([2 ** 64 - 2, 2 ** 64 - 1], counting_sort_array(np.array([2 ** 64 - 1, 2 ** 64 - 2], dtype='u8')).tolist())
+        self.assertEqual(None, counting_sort_array(np.array([0.5, 1.5])))
+
+    def test_select_nth(self):
+        """Test introselect partitions around k"""
+        for k in (0, 137, 499):
+            elements = list(self.random_list)
+            select_nth(elements, k, 0, len(elements))
+            self.assertEqual(sorted(self.random_list)[k], elements[k])
+            self.assertEqual(True, max(elements[:k] + [elements[k]]) == elements[k])
+            self.assertEqual(True, min(elements[k:]) == elements[k])
+
+        # already sorted input with many duplicates
+        elements = sorted(self.random_list)
+        select_nth(elements, 250, 100, 400)
+        self.assertEqual(sorted(self.random_list)[250], elements[250])
+
+
+if __name__ == '__main__':
+
+    unittest.main(verbosity=1)
@@ -0,0 +1,168 @@
+import random
+import unittest
+
+import numpy as np
+
+from data_structure import SparseVector, Vector
+
+
+class TestSparseVector(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.random_list = [0] * 100
+        self.random_list[7], self.random_list[30], self.random_list[64] = 5, -2, 5
+
+    @classmethod
+    def tearDownClass(self):
+        print ("All tests for sparse vector completed")
+
+    def setUp(self):
+        self.vector = SparseVector(8, 0, initial_iter=self.random_list, density_threshold=0.1)
+
+    def test_constructor(self):
+        """Test only non-default elements are saved"""
+        self.assertEqual(True, self.vector.is_sparse())
+        self.assertEqual(3, self.vector.nonzero_count())
+        self.assertEqual(100, self.vector.size())
+        self.assertEqual(True, self.vector.compare_with_iterable(self.random_list))
+        self.assertEqual(True, isinstance(self.vector, Vector))
+
+    def test_get_put(self):
+        """Test untouched slots read as default element"""
+        self.assertEqual(0, self.vector.get(0))
+        self.assertEqual(5, self.vector[7])
+        self.assertEqual(5, self.vector[-36])
+        self.assertEqual([0,5,0], self.vector.get(6, 9))
+        self.vector.put(7, 0)
+        self.vector[99] = 1
+        self.assertEqual(3, self.vector.nonzero_count())
+        self.assertEqual(1, self.vector[99])
+        self.assertRaises(IndexError, self.vector.get, 100)
+        self.assertEqual(100, len(list(self.vector)))
+        self.vector[-2] = 3
+        self.assertEqual(3, self.vector.get(98))
+        self.assertRaises(IndexError, self.vector.__setitem__, 100, 7)
+        self.assertRaises(IndexError, self.vector.__setitem__, -101, 7)
+        self.assertEqual(True, self.vector.is_sparse())
+        self.assertEqual(-1, self.vector.find(7))
+
+    def test_insert_remove(self):
+        """Test saved indices shift on insertion and removal"""
+        self.vector.insert(0, 3)
+        self.vector.insert_many(10, [0, 4])
+        self.assertEqual(103, self.vector.size())
+        self.assertEqual([3,0,0,0,0,0,0,0,5,0,0,4], self.vector.get(0, 12))
+        self.vector.partial_remove(0, 9)
+        self.vector.remove(0)
+        self.assertEqual(93, self.vector.size())
+        self.assertEqual([0,4,0], self.vector.get(0, 3))
+        self.assertEqual(True, self.vector.is_sparse())
+
+    def test_find(self):
+        """Test finding without densifying"""
+        self.assertEqual(7, self.vector.find(5))
+        self.assertEqual(30, self.vector.search(-2))
+        self.assertEqual(0, self.vector.find(0))
+        self.assertEqual(-1, self.vector.find(9))
+        self.assertEqual(True, self.vector.is_sparse())
+
+    def test_deduplicate(self):
+        """Test deduplicating without densifying"""
+        self.vector.put(0, 5)
+        self.vector.deduplicate()
+        self.assertEqual([5,0,-2], self.vector.get(0, self.vector.size()))
+
+    def test_sort(self):
+        """Test sorting without densifying, compared with dense vector"""
+        for key, reverse in [(None, False), (None, True), (abs, False), (abs, True)]:
+            data = [random.choice([0, 0, 0, 0, 1, -1, 2, -3]) for _ in range(200)]
+            vector = SparseVector(8, 0, initial_iter=data, density_threshold=1)
+            vector.sort(13, 170, key=key, reverse=reverse)
+            data[13:170] = sorted(data[13:170], key=key, reverse=reverse)
+            self.assertEqual(True, vector.is_sparse())
+            self.assertEqual(data, vector.get(0, vector.size()))
+
+    def test_select(self):
+        """Test selection and top k"""
+        self.assertEqual(-2, self.vector.select(0))
+        self.assertEqual(0, self.vector.select(50))
+        self.assertEqual(5, self.vector.select(99))
+        self.assertEqual([5,5,0], self.vector.top_k(3))
+        self.vector.nth_element(98)
+        self.assertEqual(5, self.vector.get(98))
+        self.assertEqual(True, self.vector.is_sparse())
+
+    def test_density(self):
+        """Test switching between sparse and dense storage"""
+        for i in range(20):
+            self.vector.put(i, i + 1)
+        self.assertEqual(False, self.vector.is_sparse())
+        self.assertEqual(20, self.vector.get(19))
+        self.vector.partial_remove(0, 20)
+        self.assertEqual(True, self.vector.is_sparse())
+        self.assertEqual([0,-2,0], self.vector.get(9, 12))
+
+        vector = SparseVector(default_element=0)
+        vector.append(1)
+        self.assertEqual(True, vector.is_sparse())
+        vector.extend([2] * 70)
+        self.assertEqual(False, vector.is_sparse())
+        vector[-1] = 3
+        self.assertEqual([2, 3], [vector[-2], vector.get(70)])
+        self.assertRaises(IndexError, vector.__getitem__, 71)
+        for _ in range(2000):
+            vector.append(0)
+        self.assertEqual(True, vector.is_sparse())
+        self.assertEqual(2071, vector.size())
+
+    def test_order(self):
+        """Test order queries staying on sparse storage"""
+        self.assertEqual(False, self.vector.is_acending)
+        self.assertEqual(False, self.vector.is_descending)
+        for i in (7, 30, 64):
+            self.vector.put(i, 0)
+        self.assertEqual(True, self.vector.is_acending)
+        self.assertEqual(True, self.vector.is_descending)
+        self.vector.put_many([98, 99], [3, 6])
+        self.assertEqual(True, self.vector.is_acending)
+        self.vector.put(0, 1)
+        self.assertEqual(False, self.vector.is_acending)
+        self.assertEqual(True, self.vector.is_sparse())
+
+    def test_reductions(self):
+        """Test reading without densifying"""
+        self.assertIn(-2, self.vector)
+        self.assertIn(0, self.vector)
+        self.assertNotIn(3, self.vector)
+        self.assertEqual([2, 97, 0], [self.vector.count(5), self.vector.count(0), self.vector.count(3)])
+        self.assertEqual(8, self.vector.sum())
+        self.assertEqual(0.08, self.vector.mean())
+        self.assertEqual([-2, 5], [self.vector.min(), self.vector.max()])
+        self.assertEqual([30, 7], [self.vector.argmin(), self.vector.argmax()])
+        self.assertEqual([7, 0, 30, -1], self.vector.search_many([5, 0, -2, 3]))
+        self.assertEqual(8, self.vector.unsorted())
+        self.assertEqual(7, self.vector.unsorted(acending=False))
+        self.vector.view(5, 10)
+        self.assertEqual(True, self.vector.is_sparse())
+
+        vector = SparseVector(8, 0, initial_iter=[0, 0, 3, 0] * 30, dtype='i8', density_threshold=0.5)
+        self.assertEqual([90, 0, 3, 0, 2], [vector.sum(), vector.min(), vector.max(), vector.argmin(), vector.argmax()])
+        self.assertEqual([2, 0, -1], vector.search_many([3, 0, 1]).tolist())
+        self.assertEqual(True, vector.is_sparse())
+
+    def test_dense_fallback(self):
+        """Test other operations run on dense storage, switching back if density allows"""
+        self.vector.permute()
+        self.assertEqual(True, self.vector.is_sparse())
+        self.vector.mergesort()
+        self.assertEqual([-2,0], self.vector.get(0, 2))
+        self.assertEqual([5,5], self.vector.get(98, 100))
+        vector = SparseVector(8, 0, initial_iter=self.random_list, dtype='i8')
+        self.assertEqual(54, vector.dot(vector))
+        self.assertEqual(True, vector.is_sparse())
+        self.assertEqual([0, 5, 0], np.asarray(vector)[6:9].tolist())
+        self.assertEqual(True, vector.is_sparse())
+        # reading through a view needs the storage it references
+        self.assertEqual(5, vector.view(5, 10)[2])
+        self.assertEqual(False, vector.is_sparse())
@@ -48,6 +48,46 @@ class TestStack(unittest.TestCase):
         
 
 
+    def test_empty(self):
+        """
+        Test popping and peeking on empty stack
+        """
+        stack = Stack()
+        self.assertRaises(IndexError, stack.pop)
+        self.assertRaises(IndexError, stack.top)
+        self.assertRaises(IndexError, stack.pop_many, 1)
+
+    def test_batches(self):
+        """
+        Test pushing and popping batches
+        """
+        self.stack.push_many(range(5, 8))
+        self.assertEqual(7, self.stack.top())
+        self.assertEqual([7, 6, 5, 4], self.stack.pop_many(4))
+        self.assertEqual(4, self.stack.size())
+        self.assertEqual([], self.stack.pop_many(0))
+        self.assertEqual(0, self.stack._elements[4])
+
+    def test_min_max(self):
+        """
+        Test tracked min and max through pushes, pops and other writes
+        """
+        stack = Stack(track_min=True, track_max=True, initial_iter=[3, 1, 4])
+        self.assertEqual(1, stack.min())
+        self.assertEqual(4, stack.max())
+        stack.push(1)
+        stack.push(5)
+        self.assertEqual(5, stack.max())
+        stack.pop()
+        stack.pop()
+        self.assertEqual(1, stack.min())
+        stack.pop()
+        stack.put(1, 0)
+        self.assertEqual(0, stack.min())
+        stack.pop_many(1)
+        self.assertEqual(3, stack.max())
+        self.assertEqual(3, Stack(initial_iter=[3, 5]).min())
+
 if __name__ == '__main__':
 
     unittest.main(verbosity=1)  
\ No newline at end of file
@@ -0,0 +1,88 @@
+import gc
+import unittest
+from unittest import mock
+
+from data_structure import GapVector, Queue, SparseVector, Vector, VectorSnapshot
+
+
+class TestVectorSnapshot(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.initial_list = [i for i in range(10)]
+
+    @classmethod
+    def tearDownClass(self):
+        print ("All tests for vector snapshot completed")
+
+    def setUp(self):
+        # small chunks so that a few writes touch several of them
+        self.patches = [mock.patch('data_structure.vector_snapshot.CHUNK_SIZE', 4),
+                        mock.patch('data_structure.vector.CHUNK_SIZE', 4)]
+        for patch in self.patches:
+            patch.start()
+        self.vector = Vector(8, initial_iter=self.initial_list)
+        self.snapshot = self.vector.snapshot()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+
+    def test_shared(self):
+        """Test snapshot shares storage until written"""
+        self.assertEqual(True, isinstance(self.snapshot, VectorSnapshot))
+        self.assertEqual(10, len(self.snapshot))
+        self.assertEqual(self.initial_list, list(self.snapshot))
+        self.assertEqual((80, 0), self.snapshot.memory_usage())
+        self.vector.append(10)
+        self.assertEqual((80, 0), self.snapshot.memory_usage())
+
+    def test_copy_on_write(self):
+        """Test writes copy only the chunks they change"""
+        self.vector.put(5, -1)
+        self.vector[9] = -1
+        self.assertEqual(-1, self.vector.get(5))
+        self.assertEqual(5, self.snapshot[5])
+        self.assertEqual(9, self.snapshot[-1])
+        self.assertEqual((32, 48), self.snapshot.memory_usage())
+        self.vector.put(6, -2)
+        self.assertEqual((32, 48), self.snapshot.memory_usage())
+        self.assertEqual(self.initial_list, self.snapshot.get(0, 10))
+
+    def test_structural_changes(self):
+        """Test snapshot survives insertion, removal, sorting and copying"""
+        self.vector.insert(0, 100)
+        self.vector.mergesort(acending=False)
+        self.vector.partial_remove(0, 8)
+        self.assertEqual(self.initial_list, list(self.snapshot))
+        another = self.vector.snapshot()
+        self.vector.copy_from([7, 7])
+        self.assertEqual([2, 1, 0], list(another))
+        self.assertEqual(self.initial_list, self.snapshot.materialize())
+
+    def test_release(self):
+        """Test dropped snapshots stop receiving chunks"""
+        del self.snapshot
+        gc.collect()
+        self.assertEqual(0, len(self.vector._snapshots))
+
+    def test_subclasses(self):
+        """Test snapshots of queue, gap vector and sparse vector"""
+        queue = Queue(8, 0, initial_iter=self.initial_list)
+        snapshot = queue.snapshot()
+        queue.enqueue(-1)
+        queue.dequeue()
+        self.assertEqual(self.initial_list, list(snapshot))
+
+        vector = GapVector(8, 0, initial_iter=self.initial_list)
+        vector.insert(3, -1)
+        snapshot = vector.snapshot()
+        vector.remove(1)
+        self.assertEqual([0, 1, 2, -1] + self.initial_list[3:], list(snapshot))
+
+        vector = SparseVector(8, 0, initial_iter=[0] * 50 + [3])
+        snapshot = vector.snapshot()
+        vector.put(0, 1)
+        self.assertEqual(True, vector.is_sparse())
+        self.assertEqual([0, 0], snapshot.get(0, 2))
+        self.assertEqual(3, snapshot[50])
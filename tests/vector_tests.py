@@ -1,6 +1,9 @@
 import unittest
 
+import numpy as np
+
 from data_structure import Vector
+from data_structure.vector import override_methods
 
 
 class TestVector(unittest.TestCase):
@@ -103,6 +106,39 @@ class TestVector(unittest.TestCase):
         self.vector.put(3, 5)
         self.assertEqual(3, self.vector.unsorted(acending=False))
 
+    def test_cached_order(self):
+        """Test sortedness is tracked through updates"""
+        self.assertEqual(True, self.vector.is_acending)
+        self.assertEqual(False, self.vector.is_descending)
+        self.vector.append(5)
+        self.vector.insert(0, -1)
+        self.assertEqual(True, self.vector.is_acending)
+        self.assertEqual(0, self.vector._descents)
+        self.vector.put(3, 10)
+        self.assertEqual(False, self.vector.is_acending)
+        self.vector.put(3, 2)
+        self.assertEqual(True, self.vector.is_acending)
+        self.vector.insert(2, 7)
+        self.assertEqual(False, self.vector.is_acending)
+        self.vector.remove(2)
+        self.assertEqual(True, self.vector.is_acending)
+        self.vector.mergesort(acending=False)
+        self.assertEqual(True, self.vector.is_descending)
+        self.assertEqual(0, self.vector._ascents)
+        self.vector.copy_from([None, 1])
+        self.assertEqual(False, self.vector.is_acending)
+        self.assertEqual(1, self.vector.search(1))
+
+        # elements without a truth value for comparisons leave the order unknown
+        vector = Vector()
+        vector.append(np.array([1, 2]))
+        vector.append(np.array([3, 4]))
+        vector.put(0, np.array([5, 6]))
+        vector.insert(1, np.array([7, 8]))
+        vector.remove(0)
+        self.assertEqual(2, vector.size())
+        self.assertEqual(None, vector._descents)
+
     def test_search(self):
         """Test searching element from vector"""                        
         self.assertEqual(4, self.vector.get(self.vector.search(4)))
@@ -125,6 +161,56 @@ class TestVector(unittest.TestCase):
         self.assertEqual(7, self.vector.size())
         self.assertEqual(True, self.vector.compare_with_iterable(range(-1, 6, 1)))
 
+    def test_insert_many(self):
+        """Test inserting a batch of elements into vector"""
+        self.vector.insert_many(2, [-1, -2, -3, -4])
+        self.assertEqual([0,1,-1,-2,-3,-4,2,3,4], self.vector.get(0, self.vector.size()))
+        self.assertEqual(16, self.vector._capacity)
+        self.vector.insert_many(0, iter([7]))
+        self.assertEqual(7, self.vector.get(0))
+        self.assertRaises(IndexError, self.vector.insert_many, 20, [1])
+
+    def test_extend(self):
+        """Test appending a batch of elements to vector"""
+        self.vector.extend(range(5, 40))
+        self.assertEqual(40, self.vector.size())
+        self.assertEqual(64, self.vector._capacity)
+        self.assertEqual(True, self.vector.compare_with_iterable(range(40)))
+        self.assertEqual(True, self.vector.is_acending)
+
+    def test_remove_range(self):
+        """Test removing a segment from vector"""
+        self.vector.remove_range(1, 4)
+        self.assertEqual([0, 4], self.vector.get(0, self.vector.size()))
+        self.assertEqual(0, self.vector[2])
+        self.assertRaises(IndexError, self.vector.remove_range, 1, 3)
+
+    def test_growth_policy(self):
+        """Test growth factor and shrink threshold"""
+        vector = Vector(4, growth_factor=1.5, shrink_threshold=0.25, initial_iter=range(5))
+        self.assertEqual(6, vector.capacity())
+        vector.extend(range(5, 20))
+        self.assertEqual(28, vector.capacity())
+        vector.remove_range(2, 18)
+        self.assertEqual(12, vector.capacity())
+        self.assertEqual([0, 1, 18, 19], vector.get(0, vector.size()))
+        vector.remove_range(0, 4)
+        self.assertEqual(4, vector.capacity())
+        self.assertRaises(ValueError, Vector, growth_factor=1)
+        self.assertRaises(ValueError, Vector, shrink_threshold=0.5)
+
+    def test_reserve(self):
+        """Test reserving and releasing fixed space"""
+        self.vector.reserve(100)
+        self.assertEqual(100, self.vector.capacity())
+        self.vector.reserve(10)
+        self.assertEqual(100, self.vector.capacity())
+        self.vector.shrink_to_fit()
+        self.assertEqual(5, self.vector.capacity())
+        self.vector.append(5)
+        self.assertEqual(10, self.vector.capacity())
+        self.assertEqual(True, self.vector.compare_with_iterable(range(6)))
+
     def test_permute(self):
         """Test permutation"""                               
         self.vector.partial_permute(1, 2)
@@ -188,6 +274,299 @@ class TestVector(unittest.TestCase):
         self.vector.mergesort(low=1, high=4, acending=False)
         self.assertEqual([5,4,2,1,3], self.vector.get(0, self.vector.size()))
 
+    def test_sort(self):
+        """Test sorting with key and reverse"""
+        self.vector.copy_from([3, None, 1, None, 2])
+        self.vector.sort(key=lambda x: -1 if x is None else x)
+        self.assertEqual([None, None, 1, 2, 3], self.vector.get(0, self.vector.size()))
+        self.vector.copy_from(['b', 'A', 'a', 'B'])
+        self.vector.sort(key=str.lower, reverse=True)
+        self.assertEqual(['b', 'B', 'A', 'a'], self.vector.get(0, self.vector.size()))
+        self.vector.copy_from(self.random_list)
+        self.vector.sort(1, 4, reverse=True)
+        self.assertEqual([5,4,2,1,3], self.vector.get(0, self.vector.size()))
+        self.assertRaises(IndexError, self.vector.sort, 2, 6)
+
+    def test_integer_sort(self):
+        """Test sorting ints without comparisons"""
+        self.vector.copy_from([7, 3, 9, 3, 0, 2 ** 33, -5])
+        self.vector.mergesort(low=1, high=6)
+        self.assertEqual([7, 0, 3, 3, 9, 2 ** 33, -5], self.vector.get(0, 7))
+        self.vector.mergesort(acending=False)
+        self.assertEqual([2 ** 33, 9, 7, 3, 3, 0, -5], self.vector.get(0, 7))
+        self.assertEqual(True, self.vector.is_descending)
+
+    def test_nth_element(self):
+        """Test partial sorting around index k"""
+        self.vector.copy_from([7, 1, 9, 3, 5, 3, 8])
+        self.vector.nth_element(3)
+        self.assertEqual(5, self.vector.get(3))
+        self.assertEqual(True, all(x <= 5 for x in self.vector.get(0, 3)))
+        self.assertEqual(True, all(x >= 5 for x in self.vector.get(4, 7)))
+        self.vector.copy_from(self.random_list)
+        self.vector.nth_element(1, low=1, high=4)
+        self.assertEqual([5, 1], self.vector.get(0, 2))
+        self.assertRaises(IndexError, self.vector.nth_element, 4, 1, 4)
+
+    def test_select(self):
+        """Test selecting k-th smallest element"""
+        self.vector.copy_from(self.random_list)
+        self.assertEqual(3, self.vector.select(2))
+        self.assertEqual(4, self.vector.select(3, low=1, high=4))
+        self.assertEqual(self.random_list, self.vector.get(0, self.vector.size()))
+
+    def test_top_k(self):
+        """Test getting k largest elements"""
+        self.vector.copy_from(self.random_list)
+        self.assertEqual([5, 4], self.vector.top_k(2))
+        self.assertEqual([1, 2], self.vector.top_k(2, key=lambda x: -x))
+        self.assertEqual([4, 2, 1], self.vector.top_k(5, low=1, high=4))
+
+    def test_search_many(self):
+        """Test finding a batch of targets"""
+        self.assertEqual([0, 4, -1, 2], self.vector.search_many([0, 4, 7, 2]))
+        self.vector.copy_from([9, 7, 7, 3, 1])
+        self.assertEqual([1, -1, 4, 0], self.vector.search_many([7, 5, 1, 9]))
+        self.vector.copy_from(self.random_list + [4])
+        self.assertEqual([2, 0, -1], self.vector.search_many([4, 5, 0]))
+
+    def test_index(self):
+        """Test hash index staying correct through writes"""
+        self.vector.copy_from([3, 1, 3, 2])
+        self.vector.build_index()
+        self.assertEqual(2, self.vector.count(3))
+        self.vector.insert(0, 2)
+        self.vector.partial_remove(1, 3)
+        self.assertEqual(1, self.vector.find(3))
+        self.vector.append(1)
+        self.vector.put(0, 4)
+        self.assertEqual([4, 3, 2, 1], self.vector.get(0, 4))
+        self.assertEqual([0, 1, 2, 3, -1], [self.vector.find(x) for x in [4, 3, 2, 1, 0]])
+        self.vector.put_many([0, 3, 0], [5, 1, 6])
+        self.assertEqual([0, -1, -1, 2, 3], [self.vector.find(x) for x in [6, 5, 4, 2, 1]])
+        self.vector.sort()
+        self.assertEqual(3, self.vector.find(6))
+        self.assertIn(1, self.vector)
+        self.assertNotIn(0, self.vector)
+        self.assertNotIn([1], self.vector)
+        self.assertGreater(self.vector.index_memory_usage(), 0)
+        self.vector.drop_index()
+        self.assertEqual(0, self.vector.index_memory_usage())
+        self.assertEqual(1, self.vector.count(6))
+        self.assertRaises(TypeError, Vector(initial_iter=[[1]]).build_index)
+
+    def test_index_duplicates(self):
+        """Test hash index keeping the least position of repeated values through shifts"""
+        self.vector.copy_from([0, 1, 0, 1, 0])
+        self.vector.build_index()
+        self.vector.put(0, 1)
+        self.assertEqual([2, 0], [self.vector.find(0), self.vector.find(1)])
+        self.vector.insert(1, 0)
+        self.vector.remove(0)
+        self.assertEqual([0, 1], [self.vector.find(0), self.vector.find(1)])
+        self.vector.put_many([0, 3], [1, 1])
+        self.assertEqual([2, 0], [self.vector.find(0), self.vector.find(1)])
+        self.assertEqual([2, 3], [self.vector.count(0), self.vector.count(1)])
+
+    def test_override_methods(self):
+        """Test overriding vector methods on a subclass only by name"""
+        class Traced(Vector):
+            def find(self, target):
+                return -1
+
+        calls = []
+        def traced(method):
+            def wrapper(self, *args):
+                calls.append(method.__name__)
+                return method(self, *args)
+            return wrapper
+
+        override_methods(Traced, ('sum', 'count'), traced)
+        vector = Traced(initial_iter=[1, 2, 2])
+        self.assertEqual([5, 2, 2], [vector.sum(), vector.count(2), vector.max()])
+        self.assertEqual(['sum', 'count'], calls)
+        self.assertRaises(AttributeError, override_methods, Traced, ('missing',), traced)
+        self.assertRaises(TypeError, override_methods, Traced, ('find',), traced)
+
+    def test_take_put_many(self):
+        """Test gathering and scattering a batch"""
+        self.assertEqual([3, 0, 3], self.vector.take([3, 0, 3]))
+        self.vector.put_many([1, 4], [7, 8])
+        self.assertEqual([0, 7, 2, 3, 8], self.vector.get(0, 5))
+        self.assertEqual(False, self.vector.is_acending)
+        self.vector.put_many([1], [1])
+        self.assertEqual(True, self.vector.is_acending)
+        self.assertRaises(IndexError, self.vector.take, [0, 5])
+        self.assertRaises(IndexError, self.vector.put_many, [-1], [0])
+        self.assertRaises(ValueError, self.vector.put_many, [0, 1], [0])
+
+
+class TestTypedVector(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.initial_list = [i for i in range(5)]
+        self.random_list = [5,1,4,2,3]
+
+    @classmethod
+    def tearDownClass(self):
+        print ("All tests for typed vector completed")
+
+    def setUp(self):
+        self.vector = Vector(8, dtype='f8', initial_iter=self.initial_list)
+
+    def test_constructor(self):
+        """Test typed constructor"""
+        self.assertEqual(np.dtype('f8'), self.vector.dtype())
+        self.assertEqual(True, isinstance(self.vector._elements, np.ndarray))
+        self.assertEqual(True, self.vector.compare_with_iterable(self.initial_list))
+        self.assertEqual(0.0, self.vector[7])
+
+    def test_append(self):
+        """Test appending element to typed vector"""
+        for x in range(5, 9):
+            self.vector.append(x)
+        self.assertEqual(8.0, self.vector.get(8))
+        self.assertEqual(16, self.vector._capacity)
+        self.assertEqual(list(range(9)), self.vector.get(0, 9).tolist())
+
+    def test_insert_remove(self):
+        """Test inserting and removing on typed vector"""
+        self.vector.insert(0, -1)
+        self.vector.insert(6, 5)
+        self.assertEqual(list(range(-1, 6)), self.vector.get(0, 7).tolist())
+        self.vector.partial_remove(1, 3)
+        self.assertEqual([-1, 2, 3, 4, 5], self.vector.get(0, 5).tolist())
+        self.vector.remove(4)
+        self.assertEqual(4, self.vector.size())
+
+    def test_find_search(self):
+        """Test vectorized find and search"""
+        self.assertEqual(3, self.vector.find(3))
+        self.assertEqual(-1, self.vector.find(7))
+        self.assertEqual(4, self.vector.search(4))
+        self.vector.copy_from([5,4,4,2,1])
+        self.assertEqual(1, self.vector.search(4))
+        self.assertEqual(4, self.vector.search(1))
+        self.assertEqual(-1, self.vector.search(3))
+        self.vector.copy_from(self.random_list)
+        self.assertEqual(1, self.vector.search(1))
+
+    def test_unsorted(self):
+        """Test vectorized unsorted check"""
+        self.assertEqual(-1, self.vector.unsorted(acending=True))
+        self.assertEqual(1, self.vector.unsorted(acending=False))
+        self.vector.put(3, -1)
+        self.assertEqual(3, self.vector.unsorted(acending=True))
+
+    def test_deduplicate(self):
+        """Test vectorized deduplicate keeps first occurrences in order"""
+        self.vector.copy_from([3, 1, 3, 2, 1, 0])
+        self.vector.deduplicate()
+        self.assertEqual([3, 1, 2, 0], self.vector.get(0, self.vector.size()).tolist())
+
+    def test_mergesort(self):
+        """Test vectorized mergesort"""
+        self.vector.copy_from(self.random_list)
+        self.vector.mergesort(low=1, high=4, acending=True)
+        self.assertEqual([5,1,2,4,3], self.vector.get(0, 5).tolist())
+        self.vector.mergesort(acending=False)
+        self.assertEqual([5,4,3,2,1], self.vector.get(0, 5).tolist())
+
+    def test_counting_sort(self):
+        """Test counting sort on typed integer vector"""
+        vector = Vector(dtype='i2', initial_iter=[4, -1, 4, 3, 0, 3])
+        vector.mergesort(acending=False)
+        self.assertEqual([4, 4, 3, 3, 0, -1], vector.get(0, 6).tolist())
+        vector.sort(low=2, high=6)
+        self.assertEqual([4, 4, -1, 0, 3, 3], vector.get(0, 6).tolist())
+        vector = Vector(dtype='i1', initial_iter=[100, -100, 5])
+        vector.sort()
+        self.assertEqual([-100, 5, 100], vector.get(0, 3).tolist())
+
+    def test_selection(self):
+        """Test selection on typed vector"""
+        self.vector.copy_from([7, 1, 9, 3, 5, 3, 8])
+        self.assertEqual(3, self.vector.select(1))
+        self.assertEqual([9, 8, 7], self.vector.top_k(3))
+        self.assertEqual([], self.vector.top_k(0))
+        self.assertEqual([], self.vector.top_k(0, low=2, high=5))
+        self.vector.nth_element(3)
+        self.assertEqual(5, self.vector.get(3))
+        self.assertEqual(True, all(x <= 5 for x in self.vector.get(0, 3)))
+
+    def test_batches(self):
+        """Test vectorized batch search, gather and scatter"""
+        self.assertEqual([4, -1, 0], self.vector.search_many([4, 2.5, 0]).tolist())
+        self.vector.copy_from(self.random_list)
+        self.assertEqual([1, 0, -1], self.vector.search_many([1, 5, 6]).tolist())
+        self.assertEqual([4., 5.], self.vector.take([2, 0]).tolist())
+        self.vector.put_many(np.array([0, 4]), [0, 9])
+        self.assertEqual([0, 1, 4, 2, 9], self.vector.get(0, 5).tolist())
+
+    def test_arithmetic(self):
+        """Test elementwise operators and comparisons"""
+        other = Vector(dtype='f8', initial_iter=self.random_list)
+        self.assertEqual([5, 2, 6, 5, 7], (self.vector + other).get(0, 5).tolist())
+        self.assertEqual([0, 2, 4, 6, 8], (2 * self.vector).get(0, 5).tolist())
+        self.assertEqual([1, 0, -1, -2, -3], (1 - self.vector).get(0, 5).tolist())
+        self.assertEqual(27, self.vector.dot(other))
+        mask = self.vector > 2
+        self.assertEqual(np.dtype(bool), mask.dtype())
+        self.assertEqual([False, False, False, True, True], mask.get(0, 5).tolist())
+        self.assertEqual([False, True, False, False, False], self.vector.equal(1).get(0, 5).tolist())
+        self.assertRaises(ValueError, self.vector.__add__, [1, 2])
+        self.assertRaises(TypeError, Vector(initial_iter=[1]).__add__, 1)
+
+    def test_inplace_arithmetic(self):
+        """Test in-place operators writing into the buffer"""
+        buffer = self.vector._elements
+        self.vector += self.vector
+        self.vector *= 0.5
+        self.vector -= 1
+        self.assertIs(buffer, self.vector._elements)
+        self.assertEqual([-1, 0, 1, 2, 3], self.vector.get(0, 5).tolist())
+        integers = Vector(dtype='i8', initial_iter=self.random_list)
+        # casting floats into the int buffer is refused
+        with self.assertRaises(TypeError):
+            integers *= 0.5
+
+    def test_reductions(self):
+        """Test reductions on typed and object vectors"""
+        self.vector.copy_from(self.random_list)
+        for vector in (self.vector, Vector(initial_iter=self.random_list)):
+            self.assertEqual(15, vector.sum())
+            self.assertEqual(1, vector.min())
+            self.assertEqual(5, vector.max())
+            self.assertEqual(1, vector.argmin())
+            self.assertEqual(0, vector.argmax())
+            self.assertEqual(3, vector.mean())
+        self.assertEqual(0, Vector().sum())
+        self.assertRaises(ValueError, Vector(dtype='f8').min)
+
+    def test_filter(self):
+        """Test filtering through a mask in place"""
+        self.vector.copy_from(self.random_list)
+        self.vector.filter(self.vector >= 3)
+        self.assertEqual([5, 4, 3], self.vector.get(0, self.vector.size()).tolist())
+        self.assertEqual(0, self.vector[3])
+        vector = Vector(initial_iter=['a', 'b', 'c'])
+        vector.filter([True, False, True])
+        self.assertEqual(True, vector.compare_with_iterable(['a', 'c']))
+        self.assertRaises(ValueError, vector.filter, [True])
+
+        # writes after filtering a sorted vector keep the order counts
+        vector = Vector(dtype='i8', initial_iter=[1, 2, 3])
+        vector.filter(vector > 1)
+        self.assertEqual(False, vector.is_descending)
+        vector.append(9)
+        vector.put(0, 0)
+        vector.insert(1, 5)
+        self.assertEqual([0, 5, 3, 9], vector.get(0, 4).tolist())
+        self.assertEqual(False, vector.is_acending)
+        vector.filter([True, False, True, True])
+        self.assertEqual(True, vector.is_acending)
+
 
 if __name__ == '__main__':
 
@@ -0,0 +1,84 @@
+import unittest
+
+import numpy as np
+
+from data_structure import Vector, VectorView, Queue
+
+
+class TestVectorView(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self):
+        self.initial_list = [i for i in range(10)]
+
+    @classmethod
+    def tearDownClass(self):
+        print ("All tests for vector view completed")
+
+    def setUp(self):
+        self.vector = Vector(8, initial_iter=self.initial_list)
+        self.view = self.vector.view(2, 8)
+
+    def test_indexing(self):
+        """Test indexing and iterating view"""
+        self.assertEqual(True, isinstance(self.view, VectorView))
+        self.assertEqual(6, len(self.view))
+        self.assertEqual(2, self.view[0])
+        self.assertEqual(7, self.view[-1])
+        self.assertEqual([2,3,4,5,6,7], list(self.view))
+        self.assertRaises(IndexError, self.view.__getitem__, 6)
+        self.assertRaises(IndexError, self.vector.view, 5, 11)
+
+    def test_nested_slicing(self):
+        """Test slicing view returns view"""
+        nested = self.view[1:4]
+        self.assertEqual(True, isinstance(nested, VectorView))
+        self.assertEqual([3,4,5], list(nested))
+        self.assertEqual([4,5], list(nested[1:]))
+
+    def test_zero_copy(self):
+        """Test view reflects writes and copies only on materialization"""
+        copy = self.view.materialize()
+        self.vector.put(3, -3)
+        self.assertEqual(-3, self.view[1])
+        self.assertEqual(3, copy[1])
+        self.vector.remove_range(0, 5)
+        self.assertRaises(IndexError, list, self.view)
+
+    def test_search(self):
+        """Test searching in view"""
+        self.assertEqual(3, self.view.search(5))
+        self.assertEqual(-1, self.view.search(9))
+        self.vector.mergesort(acending=False)
+        self.assertEqual(0, self.view.search(7))
+        self.vector.put(0, -1)
+        self.assertEqual(5, self.view.find(2))
+        self.assertEqual(5, self.view.search(2))
+
+    def test_typed(self):
+        """Test memoryview on typed vector"""
+        vector = Vector(dtype='i8', initial_iter=self.initial_list)
+        view = vector.view(2, 8)
+        memory = view.memoryview()
+        self.assertEqual(6, len(memory))
+        self.assertEqual(2, memory[0])
+        vector.put(2, 20)
+        self.assertEqual(20, memory[0])
+        self.assertEqual([20,3,4,5,6,7], np.asarray(view).tolist())
+        self.assertEqual(4, view.search(6))
+        self.assertRaises(TypeError, self.view.memoryview)
+
+    def test_queue(self):
+        """Test view on wrapped queue"""
+        queue = Queue(4)
+        for x in range(3):
+            queue.enqueue(x)
+        queue.dequeue()
+        queue.enqueue(3)
+        queue.enqueue(4)
+        self.assertEqual([4,3,2,1], list(queue.view()))
+
+
+if __name__ == '__main__':
+
+    unittest.main(verbosity=1)